@@ -1,3 +1,4 @@
+import multiprocessing
 import sys
 from pathlib import Path
 
@@ -9,4 +10,8 @@ sys.path.insert(0, str(src_path))
 from sad_app_v2.main import main
 
 if __name__ == "__main__":
+    # No executável (PyInstaller), cada worker do pool de extração reexecuta
+    # este arquivo; freeze_support() o desvia para o código do worker em vez
+    # de abrir outra janela da aplicação
+    multiprocessing.freeze_support()
     main()
@@ -0,0 +1,55 @@
+"""
+Benchmark da busca de código com leitura antecipadamente interrompida.
+
+Compara a extração completa (todas as páginas, como extract_text) com a
+extract_text_for_code, que para na primeira página em que o padrão principal
+do perfil casa, sobre PDFs sintéticos com o cabeçalho "Relatório:" na
+primeira página. Também confere se o código encontrado é o mesmo.
+
+Uso:
+    python scripts/benchmark_code_lookup.py [quantidade_de_pdfs] [páginas]
+"""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from benchmark_parallel_extraction import CONFIG_PATH, make_files  # noqa: E402
+
+from sad_app_v2.infrastructure.extraction import ProfiledExtractorService  # noqa: E402
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    pages = int(sys.argv[2]) if len(sys.argv) > 2 else 30
+    extractor = ProfiledExtractorService(CONFIG_PATH)
+    with tempfile.TemporaryDirectory() as tmp:
+        files = make_files(Path(tmp), count, pages)
+
+        start = time.perf_counter()
+        full_codes = [
+            extractor.find_code(extractor.extract_text(f, "RIR"), "RIR") for f in files
+        ]
+        full = time.perf_counter() - start
+
+        start = time.perf_counter()
+        early_codes = [
+            extractor.find_code(extractor.extract_text_for_code(f, "RIR"), "RIR")
+            for f in files
+        ]
+        early = time.perf_counter() - start
+
+    if full_codes != early_codes:
+        raise SystemExit("Os códigos encontrados divergem!")
+
+    print(f"PDFs: {count} x {pages} páginas")
+    for label, elapsed in (("Todas as páginas:", full), ("Parada antecipada:", early)):
+        print(f"{label:19} {elapsed:8.3f}s  ({elapsed / count * 1e3:7.1f} ms/PDF)")
+    print(f"Ganho:              {full / early:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Benchmark da cópia verificada do SafeFileRenamer.safe_copy_then_delete.
+
+Compara a verificação anterior (MD5 do arquivo inteiro lido em memória,
+shutil.copy2 e nova leitura integral da cópia) com a atual (hash BLAKE2b
+calculado durante a cópia em blocos e releitura da cópia em blocos),
+medindo tempo e pico de memória.
+
+Uso:
+    python scripts/benchmark_copy_verify.py [tamanho_em_MiB]
+"""
+
+import hashlib
+import os
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from sad_app_v2.infrastructure.safe_file_operations import (  # noqa: E402
+    _copy_with_hash,
+    _hash_file,
+)
+
+
+def legacy_copy_verify(source: Path, target: Path) -> None:
+    """Verificação anterior, mantida aqui apenas para comparação."""
+    with open(source, "rb") as f:
+        original_hash = hashlib.md5(f.read()).hexdigest()
+    shutil.copy2(source, target)
+    with open(target, "rb") as f:
+        if hashlib.md5(f.read()).hexdigest() != original_hash:
+            raise OSError("Hash não confere")
+
+
+def streaming_copy_verify(source: Path, target: Path) -> None:
+    original_hash = _copy_with_hash(source, target, "blake2b")
+    if _hash_file(target, "blake2b") != original_hash:
+        raise OSError("Hash não confere")
+
+
+def measure(func, source: Path, target: Path):
+    tracemalloc.start()
+    start = time.perf_counter()
+    func(source, target)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    target.unlink()
+    return elapsed, peak
+
+
+def main():
+    size_mib = int(sys.argv[1]) if len(sys.argv) > 1 else 40
+    with tempfile.TemporaryDirectory() as tmp:
+        source = Path(tmp, "origem.bin")
+        source.write_bytes(os.urandom(size_mib * 2**20))
+        target = Path(tmp, "copia.bin")
+
+        print(f"Arquivo de {size_mib} MiB")
+        for label, func in (
+            ("MD5 em memória:", legacy_copy_verify),
+            ("BLAKE2b em blocos:", streaming_copy_verify),
+        ):
+            elapsed, peak = measure(func, source, target)
+            print(f"{label:20} {elapsed:8.3f}s  pico {peak / 2**20:8.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Benchmark de memória do modelo de domínio.
+
+Compara o layout antigo de DocumentFile/ManifestItem (dataclass com __dict__
+e o campo duplicado _manifest_item) com o layout atual (slots=True e o campo
+legado como propriedade), medindo com tracemalloc a memória de N arquivos
+validados.
+
+Uso:
+    python scripts/benchmark_domain_memory.py [quantidade_de_arquivos]
+"""
+
+import sys
+import tracemalloc
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from sad_app_v2.core.domain import (  # noqa: E402
+    DocumentFile,
+    DocumentStatus,
+    ManifestItem,
+)
+
+
+@dataclass
+class LegacyManifestItem:
+    document_code: str
+    revision: str
+    title: str
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class LegacyDocumentFile:
+    path: Path
+    size_bytes: int
+    status: DocumentStatus = DocumentStatus.UNVALIDATED
+    associated_manifest_item: Optional[LegacyManifestItem] = None
+    _manifest_item: Optional[LegacyManifestItem] = None
+
+
+def build(count: int, file_cls, item_cls, paths):
+    """Cria um item de manifesto e um arquivo validado por posição."""
+    files = []
+    for i in range(count):
+        item = item_cls(f"DOC-{i:06d}", "A", "Título")
+        files.append(
+            file_cls(
+                path=paths[i],
+                size_bytes=i,
+                status=DocumentStatus.VALIDATED,
+                associated_manifest_item=item,
+            )
+        )
+    return files
+
+
+def measure(count: int, file_cls, item_cls, paths) -> int:
+    tracemalloc.start()
+    snapshot_before = tracemalloc.take_snapshot()
+    files = build(count, file_cls, item_cls, paths)
+    snapshot_after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    stats = snapshot_after.compare_to(snapshot_before, "filename")
+    del files
+    return sum(stat.size_diff for stat in stats)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 300_000
+    # Os Path são compartilhados para medir apenas o custo dos objetos de domínio
+    paths = [Path(f"/origem/DOC-{i:06d}_A.pdf") for i in range(count)]
+
+    legacy = measure(count, LegacyDocumentFile, LegacyManifestItem, paths)
+    current = measure(count, DocumentFile, ManifestItem, paths)
+
+    print(f"Arquivos validados: {count:,}")
+    results = (("Layout com __dict__:", legacy), ("Layout com slots:", current))
+    for label, size in results:
+        print(f"{label:22} {size / 2**20:8.1f} MiB  ({size / count:6.0f} B/arquivo)")
+    print(f"Economia:              {(1 - current / legacy) * 100:8.1f}%")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+Benchmark do cache de texto extraído.
+
+Mede a extração completa dos mesmos PDFs sintéticos sem cache, com o cache
+vazio (extração + gravação) e com o cache já preenchido, inclusive depois de
+renomear todos os arquivos (como faz a resolução RIR). Também confere se o
+texto do cache é idêntico ao extraído.
+
+Uso:
+    python scripts/benchmark_extraction_cache.py [quantidade_de_pdfs] [páginas]
+"""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from benchmark_parallel_extraction import CONFIG_PATH, make_files  # noqa: E402
+
+from sad_app_v2.core.domain import DocumentFile  # noqa: E402
+from sad_app_v2.infrastructure.extraction import ProfiledExtractorService  # noqa: E402
+from sad_app_v2.infrastructure.extraction_cache import ExtractionCache  # noqa: E402
+
+
+def extract_all(service, files):
+    start = time.perf_counter()
+    texts = [service.extract_text(f, "RIR") for f in files]
+    return texts, time.perf_counter() - start
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    pages = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    with tempfile.TemporaryDirectory() as tmp:
+        files = make_files(Path(tmp), count, pages)
+        cache = ExtractionCache(Path(tmp) / "cache")
+        plain = ProfiledExtractorService(CONFIG_PATH)
+        cached = ProfiledExtractorService(CONFIG_PATH, cache=cache)
+
+        expected, uncached = extract_all(plain, files)
+        cold_texts, cold = extract_all(cached, files)
+        warm_texts, warm = extract_all(cached, files)
+
+        renamed = []
+        for f in files:
+            path = f.path.rename(f.path.with_name("R_" + f.path.name))
+            renamed.append(DocumentFile(path=path, size_bytes=f.size_bytes))
+        renamed_texts, after_rename = extract_all(cached, renamed)
+        stats = cache.stats()
+
+    if not expected == cold_texts == warm_texts == renamed_texts:
+        raise SystemExit("O texto do cache diverge da extração!")
+
+    print(f"PDFs: {count} x {pages} páginas")
+    for label, elapsed in (
+        ("Sem cache:", uncached),
+        ("Cache vazio:", cold),
+        ("Cache preenchido:", warm),
+        ("Após renomear:", after_rename),
+    ):
+        print(f"{label:18} {elapsed:8.3f}s  ({elapsed / count * 1e3:7.2f} ms/PDF)")
+    print(f"Ganho (preenchido): {uncached / warm:7.1f}x")
+    print(
+        f"Acertos: {stats.hits}  Falhas: {stats.misses}  "
+        f"Entradas: {stats.entries}  Tamanho: {stats.size_bytes} bytes"
+    )
+
+
+if __name__ == "__main__":
+    main()
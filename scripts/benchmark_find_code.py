@@ -0,0 +1,101 @@
+"""
+Micro-benchmark da busca de códigos por perfil (find_code).
+
+Compara três formas de aplicar os padrões de um perfil do patterns.yaml:
+re.search com as strings a cada chamada (implementação anterior), o
+ProfileMatcher com os padrões pré-compilados no carregamento, e uma única
+alternância com grupos nomeados em lookahead (uma passada pelo texto), que foi
+avaliada e não adotada por ser mais lenta no `re` do CPython.
+
+Uso:
+    python scripts/benchmark_find_code.py [repetições]
+"""
+
+import re
+import sys
+import time
+from pathlib import Path
+
+import yaml
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from sad_app_v2.infrastructure.profile_matcher import (  # noqa: E402
+    PATTERN_FLAGS,
+    ProfileMatcher,
+)
+
+CONFIG_PATH = Path(__file__).resolve().parent.parent / "config" / "patterns.yaml"
+
+FILLER = "Página 3 linha: inspeção de equipamento sem anomalias registradas 12345\n"
+TEXTS = {
+    "cabeçalho no início": "Relatório: CZ6_RNEST_U22_3.1.1.1_CVL_RIR_B-22026A\n"
+    + FILLER * 60,
+    "código no fim": FILLER * 60 + "Código: CZ6-RIR-0001\n",
+    "sem código": FILLER * 60,
+}
+
+
+def legacy_find(text, patterns):
+    """Implementação anterior, mantida aqui apenas para comparação."""
+    for pattern in patterns:
+        match = re.search(pattern, text, re.IGNORECASE | re.MULTILINE)
+        if match:
+            return match.group(1) if match.groups() else match.group(0)
+    return None
+
+
+def merged_finder(patterns):
+    """Alternativa avaliada: todos os padrões em uma única expressão."""
+    compiled = [re.compile(p, PATTERN_FLAGS) for p in patterns]
+    combined = re.compile(
+        "|".join(f"(?=(?P<p{i}>{p}))" for i, p in enumerate(patterns)), PATTERN_FLAGS
+    )
+    slots = {}
+    for i, pattern in enumerate(compiled):
+        wrapper = combined.groupindex[f"p{i}"]
+        slots[f"p{i}"] = (i, wrapper + 1 if pattern.groups else wrapper)
+
+    def find(text):
+        best_priority, best = len(patterns), None
+        for match in combined.finditer(text):
+            priority, group = slots[match.lastgroup]
+            if priority < best_priority:
+                best_priority, best = priority, match.group(group)
+                if priority == 0:
+                    break
+        return best
+
+    return find
+
+
+def measure(func, text, repetitions) -> float:
+    start = time.perf_counter()
+    for _ in range(repetitions):
+        func(text)
+    return (time.perf_counter() - start) / repetitions
+
+
+def main():
+    repetitions = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    with open(CONFIG_PATH, encoding="utf-8") as f:
+        patterns = yaml.safe_load(f)["profiles"]["RIR"]["patterns"]
+    matcher = ProfileMatcher(patterns)
+    merged = merged_finder(patterns)
+    variants = (
+        ("re.search(str)", lambda text: legacy_find(text, patterns)),
+        ("pré-compilado", matcher.find),
+        ("alternância única", merged),
+    )
+
+    print(f"{'texto':22} " + " ".join(f"{label:>18}" for label, _ in variants))
+    for name, text in TEXTS.items():
+        results = {func(text) for _, func in variants}
+        if len(results) != 1:
+            raise SystemExit(f"Os resultados divergem em '{name}': {results}")
+        timings = [measure(func, text, repetitions) for _, func in variants]
+        print(f"{name:22} " + " ".join(f"{t * 1e6:15.1f} µs" for t in timings))
+
+
+if __name__ == "__main__":
+    main()
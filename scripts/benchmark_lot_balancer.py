@@ -0,0 +1,108 @@
+"""
+Benchmark do balanceador de lotes.
+
+Compara a versão anterior do GreedyLotBalancerService (min() linear sobre os
+lotes a cada grupo, recalculando os tamanhos) com a versão atual baseada em
+heap, para várias combinações de quantidade de grupos e de lotes. Também
+confere se as duas produzem exatamente a mesma distribuição.
+
+Uso:
+    python scripts/benchmark_lot_balancer.py
+"""
+
+import math
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from sad_app_v2.core.domain import DocumentFile, DocumentGroup, OutputLot  # noqa: E402
+from sad_app_v2.infrastructure.services import GreedyLotBalancerService  # noqa: E402
+
+# (grupos, documentos por lote) -> lotes = ceil(grupos / documentos por lote)
+SCENARIOS = [
+    (1_000, 50),
+    (1_000, 10),
+    (5_000, 50),
+    (20_000, 50),
+    (20_000, 500),
+    (100_000, 50),
+]
+
+# A versão anterior soma todos os arquivos de cada lote a cada grupo
+# (custo ~ grupos²); acima deste limite ela não é executada.
+LEGACY_MAX_GROUPS = 5_000
+
+
+def legacy_balance_lots(groups, max_docs_per_lot):
+    """Implementação anterior, mantida aqui apenas para comparação."""
+    if not groups:
+        return []
+    sorted_groups = sorted(
+        groups, key=lambda g: sum(f.size_bytes for f in g.files), reverse=True
+    )
+    if max_docs_per_lot <= 0:
+        max_docs_per_lot = len(sorted_groups)
+    num_lots = math.ceil(len(sorted_groups) / max_docs_per_lot)
+    lots = [OutputLot(lot_name=f"Lote_{i + 1}") for i in range(num_lots)]
+    for group in sorted_groups:
+        lightest_lot = min(
+            lots,
+            key=lambda lot: sum(
+                f.size_bytes for g in lot.groups for f in g.files
+            ),
+        )
+        lightest_lot.groups.append(group)
+    return lots
+
+
+def generate_groups(count: int):
+    rng = random.Random(7)
+    return [
+        DocumentGroup(
+            f"DOC-{i}",
+            [
+                DocumentFile(Path(f"DOC-{i}_{j}.pdf"), rng.randint(10_000, 5_000_000))
+                for j in range(rng.randint(1, 3))
+            ],
+        )
+        for i in range(count)
+    ]
+
+
+def assignment(lots):
+    return [[g.document_code for g in lot.groups] for lot in lots]
+
+
+def main():
+    balancer = GreedyLotBalancerService()
+    print(f"{'grupos':>8} {'lotes':>6} {'anterior':>10} {'heap':>10} {'ganho':>8}")
+    for group_count, docs_per_lot in SCENARIOS:
+        groups = generate_groups(group_count)
+        lot_count = math.ceil(group_count / docs_per_lot)
+
+        start = time.perf_counter()
+        current = balancer.balance_lots(groups, docs_per_lot)
+        current_elapsed = time.perf_counter() - start
+
+        if group_count <= LEGACY_MAX_GROUPS:
+            start = time.perf_counter()
+            legacy = legacy_balance_lots(groups, docs_per_lot)
+            legacy_elapsed = time.perf_counter() - start
+            if assignment(legacy) != assignment(current):
+                raise SystemExit("As distribuições divergem!")
+            legacy_text = f"{legacy_elapsed:9.3f}s"
+            gain_text = f"{legacy_elapsed / current_elapsed:7.0f}x"
+        else:
+            legacy_text, gain_text = "—".rjust(10), "—".rjust(8)
+
+        print(
+            f"{group_count:>8} {lot_count:>6} {legacy_text} "
+            f"{current_elapsed:9.3f}s {gain_text}"
+        )
+
+
+if __name__ == "__main__":
+    main()
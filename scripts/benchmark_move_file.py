@@ -0,0 +1,63 @@
+"""
+Benchmark da movimentação de arquivos no mesmo volume.
+
+Compara a movimentação anterior (mkdir da pasta de destino + shutil.move a
+cada arquivo) com o SafeFileSystemManager atual (pastas criadas uma única
+vez e um único rename quando origem e destino estão no mesmo dispositivo).
+
+Uso:
+    python scripts/benchmark_move_file.py [quantidade_de_arquivos]
+"""
+
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from sad_app_v2.infrastructure.file_system import SafeFileSystemManager  # noqa: E402
+
+FILES_PER_LOT = 50
+
+
+def legacy_move(source: Path, destination: Path) -> None:
+    """Implementação anterior, mantida aqui apenas para comparação."""
+    destination.parent.mkdir(parents=True, exist_ok=True)
+    shutil.move(str(source), str(destination))
+
+
+def run(move, root: Path, count: int) -> float:
+    source_dir = root / "origem"
+    source_dir.mkdir(parents=True)
+    sources = []
+    for i in range(count):
+        path = source_dir / f"DOC-{i:06d}.pdf"
+        path.write_bytes(b"x")
+        sources.append(path)
+    start = time.perf_counter()
+    for i, source in enumerate(sources):
+        lot_dir = root / "destino" / f"LOTE-{i // FILES_PER_LOT:04d}"
+        move(source, lot_dir / f"{source.stem}_A.pdf")
+    return time.perf_counter() - start
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    with tempfile.TemporaryDirectory() as tmp:
+        legacy = run(legacy_move, Path(tmp, "anterior"), count)
+    with tempfile.TemporaryDirectory() as tmp:
+        current = run(SafeFileSystemManager().move_file, Path(tmp, "atual"), count)
+
+    print(f"Arquivos movidos: {count:,} ({FILES_PER_LOT} por pasta de lote)")
+    for label, elapsed in (
+        ("mkdir + shutil.move:", legacy),
+        ("rename direto:", current),
+    ):
+        print(f"{label:22} {elapsed:8.3f}s  ({elapsed / count * 1e6:6.1f} µs/arquivo)")
+    print(f"Ganho:                 {legacy / current:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
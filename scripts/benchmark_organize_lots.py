@@ -0,0 +1,98 @@
+"""
+Benchmark dos modos de execução da organização de lotes.
+
+Materializa os mesmos lotes (pasta, movimentação dos arquivos e manifesto a
+partir do template) um lote de cada vez, com vários workers e em pipeline,
+usando arquivos reais em uma pasta temporária.
+
+Em disco local a movimentação é um simples rename e o tempo é dominado pelo
+openpyxl; o terceiro argumento acrescenta uma latência artificial a cada
+movimentação, simulando um compartilhamento de rede.
+
+Uso:
+    python scripts/benchmark_organize_lots.py [lotes] [arquivos_por_lote] [ms]
+"""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from sad_app_v2.core.domain import DocumentFile, ManifestItem  # noqa: E402
+from sad_app_v2.core.use_cases.organize_lots import (  # noqa: E402
+    OrganizeAndGenerateLotsUseCase,
+)
+from sad_app_v2.infrastructure.file_system import SafeFileSystemManager  # noqa: E402
+from sad_app_v2.infrastructure.services import GreedyLotBalancerService  # noqa: E402
+from sad_app_v2.infrastructure.template_filler import (  # noqa: E402
+    OpenpyxlTemplateFiller,
+)
+
+TEMPLATE = (
+    Path(__file__).resolve().parent.parent / "tests/fixtures/template_exemplo.xlsx"
+)
+
+MODES = [
+    ("um lote por vez", {}),
+    ("4 workers", {"max_workers": 4}),
+    ("pipeline", {"pipeline": True}),
+]
+
+
+class SlowFileSystemManager(SafeFileSystemManager):
+    """Acrescenta uma latência fixa a cada movimentação."""
+
+    def __init__(self, latency_s: float):
+        super().__init__()
+        self._latency_s = latency_s
+
+    def move_file(self, source: Path, destination: Path) -> None:
+        time.sleep(self._latency_s)
+        super().move_file(source, destination)
+
+
+def create_files(source: Path, count: int):
+    source.mkdir()
+    files = []
+    for i in range(count):
+        path = source / f"DOC-{i:06d}.pdf"
+        path.write_bytes(b"%PDF" + b"0" * 20_000)
+        item = ManifestItem(f"DOC-{i:06d}", "A", f"Título {i}")
+        files.append(DocumentFile(path, 20_004, associated_manifest_item=item))
+    return files
+
+
+def main():
+    lot_count = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    files_per_lot = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    latency_ms = float(sys.argv[3]) if len(sys.argv) > 3 else 0.0
+    file_count = lot_count * files_per_lot
+
+    print(
+        f"{lot_count} lotes x {files_per_lot} arquivos, "
+        f"latência por movimentação: {latency_ms:g} ms"
+    )
+    for label, options in MODES:
+        with tempfile.TemporaryDirectory() as tmp:
+            files = create_files(Path(tmp, "origem"), file_count)
+            file_manager = SlowFileSystemManager(latency_ms / 1000)
+            use_case = OrganizeAndGenerateLotsUseCase(
+                GreedyLotBalancerService(),
+                file_manager,
+                OpenpyxlTemplateFiller(file_manager),
+                **options,
+            )
+            start = time.perf_counter()
+            result = use_case.execute(
+                files, Path(tmp, "destino"), TEMPLATE, files_per_lot, 1, "LOTE-XXXX"
+            )
+            elapsed = time.perf_counter() - start
+            if not result.success:
+                raise SystemExit(result.message)
+            print(f"{label:>16}: {elapsed:8.3f}s ({result.files_moved} arquivos)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""
+Benchmark da extração de texto de PDFs em um pool de processos.
+
+Gera PDFs sintéticos de várias páginas e compara a extração sequencial do
+ProfiledExtractorService (PyPDF2 no processo atual, preso ao GIL) com o
+backend ProcessPoolTextExtractor, em um lote frio (criação dos workers) e em
+um lote com os workers já aquecidos.
+
+Uso:
+    python scripts/benchmark_parallel_extraction.py [quantidade_de_pdfs] [páginas]
+"""
+
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from sad_app_v2.core.domain import DocumentFile  # noqa: E402
+from sad_app_v2.infrastructure.extraction import ProfiledExtractorService  # noqa: E402
+from sad_app_v2.infrastructure.parallel_extraction import (  # noqa: E402
+    ProcessPoolTextExtractor,
+)
+
+CONFIG_PATH = Path(__file__).resolve().parent.parent / "config" / "patterns.yaml"
+
+
+def write_sample_pdf(path: Path, pages: int, code: str, lines_per_page: int = 45):
+    """
+    Grava um PDF mínimo (fonte Helvetica, texto simples) com o cabeçalho
+    "Relatório:" na primeira página e texto de preenchimento nas demais.
+    """
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        None,  # Árvore de páginas, preenchida depois
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica"
+        b" /Encoding /WinAnsiEncoding >>",
+    ]
+    page_ids = []
+    for page in range(pages):
+        lines = [f"Relatorio: {code}"] if page == 0 else []
+        lines += [
+            f"Pagina {page + 1} linha {n}: inspecao de equipamento sem anomalias"
+            for n in range(lines_per_page)
+        ]
+        stream = "BT /F1 9 Tf 40 800 Td 11 TL " + " ".join(
+            f"({line}) '" for line in lines
+        )
+        stream = stream.replace("Relatorio", "Relat\\363rio") + " ET"
+        data = stream.encode("latin-1")
+        objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(data), data))
+        content_id = len(objects)
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842]"
+            b" /Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % content_id
+        )
+        page_ids.append(len(objects))
+    kids = b" ".join(b"%d 0 R" % page_id for page_id in page_ids)
+    objects[1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (kids, len(page_ids))
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    out += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (
+        len(objects) + 1,
+        xref,
+    )
+    path.write_bytes(bytes(out))
+
+
+def make_files(directory: Path, count: int, pages: int):
+    files = []
+    for i in range(count):
+        path = directory / f"rir_{i:04d}.pdf"
+        write_sample_pdf(path, pages, f"CZ6_RNEST_U22_3.1.1.1_CVL_RIR_B-{i:05d}")
+        files.append(DocumentFile(path=path, size_bytes=path.stat().st_size))
+    return files
+
+
+def measure(func) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 40
+    pages = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    with tempfile.TemporaryDirectory() as tmp:
+        files = make_files(Path(tmp), count, pages)
+
+        sequential = ProfiledExtractorService(CONFIG_PATH)
+        expected = {r.file.path: r.text for r in sequential.extract_texts(files, "RIR")}
+        sequential_time = measure(lambda: list(sequential.extract_texts(files, "RIR")))
+
+        with ProcessPoolTextExtractor() as backend:
+            parallel = ProfiledExtractorService(CONFIG_PATH, backend=backend)
+            cold_time = measure(lambda: list(parallel.extract_texts(files, "RIR")))
+            results = list(parallel.extract_texts(files, "RIR"))
+            warm_time = measure(lambda: list(parallel.extract_texts(files, "RIR")))
+
+        if any(expected[r.file.path] != r.text for r in results):
+            raise SystemExit("Os textos extraídos divergem!")
+
+    print(f"PDFs: {count} x {pages} páginas, núcleos: {os.cpu_count()}")
+    rows = (
+        ("Sequencial:", sequential_time),
+        ("Pool (frio):", cold_time),
+        ("Pool (aquecido):", warm_time),
+    )
+    for label, elapsed in rows:
+        print(f"{label:17} {elapsed:8.3f}s  ({sequential_time / elapsed:5.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
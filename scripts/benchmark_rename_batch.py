@@ -0,0 +1,61 @@
+"""
+Benchmark da renomeação em lote usada na resolução RIR.
+
+Compara N chamadas a SafeFileRenamer.safe_rename_file (várias verificações
+exists/stat/access por arquivo) com uma única chamada a safe_rename_batch,
+que valida tudo contra uma listagem por pasta, grava o journal e renomeia.
+
+Uso:
+    python scripts/benchmark_rename_batch.py [quantidade_de_arquivos]
+"""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from sad_app_v2.infrastructure.safe_file_operations import (  # noqa: E402
+    SafeFileRenamer,
+)
+
+
+def make_files(directory: Path, count: int) -> list:
+    directory.mkdir()
+    paths = []
+    for i in range(count):
+        path = directory / f"documento_{i:06d}.pdf"
+        path.write_bytes(b"%PDF")
+        paths.append(path)
+    return paths
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 5_000
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+
+        paths = make_files(root / "individual", count)
+        start = time.perf_counter()
+        for path in paths:
+            SafeFileRenamer.safe_rename_file(path, path.with_name(f"RIR_{path.name}"))
+        individual = time.perf_counter() - start
+
+        paths = make_files(root / "lote", count)
+        start = time.perf_counter()
+        SafeFileRenamer.safe_rename_batch(
+            ((path, path.with_name(f"RIR_{path.name}")) for path in paths),
+            journal_dir=root / "journal",
+        )
+        batch = time.perf_counter() - start
+
+    print(f"Arquivos renomeados: {count:,}")
+    for label, elapsed in (("Arquivo a arquivo:", individual), ("Em lote:", batch)):
+        per_file = elapsed / count * 1e6
+        print(f"{label:19} {elapsed:8.3f}s  ({per_file:7.1f} µs/arquivo)")
+    print(f"Ganho:              {individual / batch:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Benchmark de memória do preenchimento de manifestos de lote.
+
+Compara o pico de memória (tracemalloc) e o tempo do OpenpyxlTemplateFiller,
+que monta a planilha inteira em memória, com o StreamingTemplateFiller, que
+grava as linhas uma a uma no modo write-only do openpyxl.
+
+Uso:
+    python scripts/benchmark_streaming_filler.py [caminho_do_template]
+"""
+
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from sad_app_v2.core.domain import DocumentFile, DocumentGroup, ManifestItem  # noqa: E402
+from sad_app_v2.infrastructure.file_system import SafeFileSystemManager  # noqa: E402
+from sad_app_v2.infrastructure.template_filler import (  # noqa: E402
+    OpenpyxlTemplateFiller,
+    StreamingTemplateFiller,
+)
+
+ROW_COUNTS = [1_000, 10_000, 20_000, 50_000]
+
+DEFAULT_TEMPLATE = (
+    Path(__file__).resolve().parent.parent / "tests/fixtures/template_exemplo.xlsx"
+)
+
+
+def generate_groups(count: int):
+    groups = []
+    for i in range(count):
+        item = ManifestItem(
+            f"DOC-{i:06d}", "A", f"Título {i}", {"DISCIPLINA": "ELE", "FORMATO": "A1"}
+        )
+        file = DocumentFile(Path(f"DOC-{i:06d}.pdf"), 1, associated_manifest_item=item)
+        groups.append(DocumentGroup(item.document_code, [file]))
+    return groups
+
+
+def measure(filler, template, output, groups):
+    """Devolve (pico de memória em bytes, tempo em segundos)."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    filler.fill_and_save(template, output, groups)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak, elapsed
+
+
+def main():
+    template = Path(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_TEMPLATE
+    file_manager = SafeFileSystemManager()
+    fillers = (
+        ("em memória", OpenpyxlTemplateFiller(file_manager)),
+        ("streaming", StreamingTemplateFiller(file_manager)),
+    )
+    # Aquece os caches de template para medir apenas o preenchimento
+    with tempfile.TemporaryDirectory() as tmp:
+        for _, filler in fillers:
+            filler.fill_and_save(template, Path(tmp, "aquecimento.xlsx"), [])
+
+    print(f"{'linhas':>8} {'preenchedor':>12} {'pico':>12} {'tempo':>9}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for count in ROW_COUNTS:
+            groups = generate_groups(count)
+            for label, filler in fillers:
+                output = Path(tmp, f"{label}_{count}.xlsx")
+                peak, elapsed = measure(filler, template, output, groups)
+                print(f"{count:>8} {label:>12} {peak / 2**20:8.1f} MiB {elapsed:8.3f}s")
+
+
+if __name__ == "__main__":
+    main()
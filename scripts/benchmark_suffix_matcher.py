@@ -0,0 +1,80 @@
+"""
+Micro-benchmark da remoção de sufixos de revisão usada na validação de lotes.
+
+Compara o laço antigo (dez padrões com re.search + re.sub por arquivo) com o
+matcher pré-compilado de passada única, sobre nomes de arquivo sintéticos.
+
+Uso:
+    python scripts/benchmark_suffix_matcher.py [quantidade_de_nomes]
+"""
+
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from sad_app_v2.core.use_cases.validate_batch import strip_revision_suffix  # noqa: E402
+
+LEGACY_PATTERNS = [
+    r"_[A-Z]$",
+    r"_Rev\d+$",
+    r"_rev\d+$",
+    r"_\d+$",
+    r"_final$",
+    r"_temp$",
+    r"_old$",
+    r"_backup$",
+    r"_draft$",
+    r"_preliminary$",
+]
+
+SUFFIXES = ["", "_A", "_b", "_Rev2", "_rev10", "_0", "_12", "_final", "_DRAFT", "_x1"]
+
+
+def legacy_strip(stem: str) -> str:
+    """Implementação anterior, mantida aqui apenas para comparação."""
+    for pattern in LEGACY_PATTERNS:
+        if re.search(pattern, stem, re.IGNORECASE):
+            return re.sub(pattern, "", stem, flags=re.IGNORECASE)
+    return stem
+
+
+def generate_stems(count: int) -> list:
+    rng = random.Random(42)
+    stems = []
+    for i in range(count):
+        base = f"CZ6_RNEST_U22_3.1.1.1_ELE_RIR_ELE-{i % 1000:03d}-CHZ-{i}"
+        stems.append(base + rng.choice(SUFFIXES))
+    return stems
+
+
+def measure(func, stems) -> float:
+    start = time.perf_counter()
+    for stem in stems:
+        func(stem)
+    return time.perf_counter() - start
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    stems = generate_stems(count)
+
+    sample = stems[:10_000]
+    mismatches = sum(1 for s in sample if legacy_strip(s) != strip_revision_suffix(s))
+    print(f"Divergências nas primeiras 10.000 amostras: {mismatches}")
+
+    legacy = measure(legacy_strip, stems)
+    current = measure(strip_revision_suffix, stems)
+
+    print(f"Nomes processados: {count:,}")
+    for label, elapsed in (("Laço de padrões:", legacy), ("Passada única:", current)):
+        per_file = elapsed / count * 1e9
+        print(f"{label:18} {elapsed:8.3f}s  ({per_file:8.1f} ns/arquivo)")
+    print(f"Ganho:             {legacy / current:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
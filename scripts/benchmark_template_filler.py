@@ -0,0 +1,206 @@
+"""
+Benchmark do preenchimento do template Excel de lotes.
+
+Compara a inserção anterior (um insert_rows por linha, que desloca o rodapé a
+cada registro) com a inserção em bloco atual (um único deslocamento de N
+linhas seguido da escrita em uma passada), para lotes de vários tamanhos.
+
+Compara também a formatação anterior (novos objetos de estilo atribuídos
+célula a célula, cabeçalho atribuído duas vezes) com os estilos nomeados
+aplicados por intervalo, incluindo o tempo de workbook.save.
+
+Por fim, mede a geração de muitos lotes pequenos com o protótipo do template
+em memória e relendo o template do disco a cada lote.
+
+Uso:
+    python scripts/benchmark_template_filler.py [caminho_do_template]
+"""
+
+import io
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import openpyxl
+from openpyxl.styles import Alignment, Border, Font, PatternFill, Side
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from sad_app_v2.core.domain import DocumentFile, DocumentGroup, ManifestItem  # noqa: E402
+from sad_app_v2.infrastructure.file_system import SafeFileSystemManager  # noqa: E402
+from sad_app_v2.infrastructure.template_filler import (  # noqa: E402
+    HEADER_STYLE_NAME,
+    OpenpyxlTemplateFiller,
+    _adjust_column_widths,
+    _apply_style_to_range,
+    _build_rows,
+    _find_insert_row,
+    _register_named_styles,
+)
+
+ROW_COUNTS = [1_000, 5_000, 10_000, 20_000]
+
+# Muitos lotes pequenos: (quantidade de lotes, linhas por lote)
+SMALL_LOTS = (300, 30)
+
+# A inserção linha a linha custa ~ linhas²; acima deste limite ela não roda.
+LEGACY_MAX_ROWS = 5_000
+
+DEFAULT_TEMPLATE = (
+    Path(__file__).resolve().parent.parent / "tests/fixtures/template_exemplo.xlsx"
+)
+
+
+def legacy_insert(sheet, groups):
+    """Inserção anterior, mantida aqui apenas para comparação."""
+    insert_row = _find_insert_row(sheet)
+    rows = _build_rows(groups)
+    for i, row_data in enumerate(rows):
+        target_row = insert_row + i
+        sheet.insert_rows(target_row)
+        for col_num, value in enumerate(row_data, 1):
+            sheet.cell(row=target_row, column=col_num, value=value)
+
+
+def legacy_format(sheet, data_start_row, num_data_rows):
+    """Formatação anterior, mantida aqui apenas para comparação."""
+    for _ in range(2):  # As larguras eram ajustadas antes e depois
+        for column, width in zip("ABCDEFGHI", (35, 10, 60, 35, 10, 20, 20, 20, 20)):
+            sheet.column_dimensions[column].width = width
+    for col in range(1, 10):
+        cell = sheet.cell(row=1, column=col)
+        cell.fill, cell.font = PatternFill(), Font()
+        cell.alignment, cell.border = Alignment(), Border()
+        cell.fill = PatternFill(
+            start_color="FFFF00", end_color="FFFF00", fill_type="solid"
+        )
+        cell.font = Font(bold=True, size=11)
+        cell.alignment = Alignment(horizontal="center", vertical="center")
+        cell.border = Border(*(Side(style="thin"),) * 4)
+    for row in range(data_start_row, data_start_row + num_data_rows + 1):
+        alignment = Alignment(horizontal="left", vertical="center")
+        border = Border(*(Side(style="thin"),) * 4)
+        for col in range(1, 10):
+            cell = sheet.cell(row=row, column=col)
+            cell.alignment = alignment
+            cell.border = border
+
+
+def filled_sheet(template, groups):
+    """Carrega o template e insere as linhas, ainda sem formatação."""
+    workbook = openpyxl.load_workbook(template)
+    sheet = workbook.active
+    insert_row = _find_insert_row(sheet)
+    rows = _build_rows(groups)
+    sheet.insert_rows(insert_row, amount=len(rows))
+    for target_row, row_data in enumerate(rows, insert_row):
+        for col_num, value in enumerate(row_data, 1):
+            sheet.cell(row=target_row, column=col_num, value=value)
+    return workbook, sheet, insert_row, len(rows)
+
+
+def measure_formatting(format_func, template, groups) -> float:
+    workbook, sheet, insert_row, count = filled_sheet(template, groups)
+    start = time.perf_counter()
+    format_func(sheet, insert_row, count)
+    workbook.save(io.BytesIO())
+    return time.perf_counter() - start
+
+
+def named_styles_format(filler):
+    """Formatação atual completa: estilos, larguras, cabeçalho e dados."""
+
+    def format_sheet(sheet, data_start_row, num_data_rows):
+        fim_font = sheet.cell(row=data_start_row + num_data_rows, column=1).font
+        _register_named_styles(sheet.parent, fim_font)
+        _adjust_column_widths(sheet)
+        _apply_style_to_range(sheet, HEADER_STYLE_NAME, 1, 1)
+        filler._apply_formatting(sheet, data_start_row, num_data_rows)
+
+    return format_sheet
+
+
+def generate_groups(count: int):
+    groups = []
+    for i in range(count):
+        item = ManifestItem(
+            f"DOC-{i:06d}", "A", f"Título {i}", {"DISCIPLINA": "ELE", "FORMATO": "A1"}
+        )
+        file = DocumentFile(Path(f"DOC-{i:06d}.pdf"), 1, associated_manifest_item=item)
+        groups.append(DocumentGroup(item.document_code, [file]))
+    return groups
+
+
+def main():
+    template = Path(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_TEMPLATE
+    filler = OpenpyxlTemplateFiller(SafeFileSystemManager())
+
+    print(f"{'linhas':>8} {'linha a linha':>14} {'em bloco':>10} {'ganho':>8}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for count in ROW_COUNTS:
+            groups = generate_groups(count)
+
+            # Tempo completo do preenchimento atual (escrita, formatação e gravação)
+            start = time.perf_counter()
+            filler.fill_and_save(template, Path(tmp, f"lote_{count}.xlsx"), groups)
+            current_elapsed = time.perf_counter() - start
+
+            if count <= LEGACY_MAX_ROWS:
+                # Apenas a etapa de inserção muda; as demais são somadas iguais
+                sheet = openpyxl.load_workbook(template).active
+                start = time.perf_counter()
+                legacy_insert(sheet, groups)
+                insert_elapsed = time.perf_counter() - start
+
+                sheet = openpyxl.load_workbook(template).active
+                start = time.perf_counter()
+                sheet.insert_rows(_find_insert_row(sheet), amount=count)
+                bulk_elapsed = time.perf_counter() - start
+
+                legacy_elapsed = current_elapsed - bulk_elapsed + insert_elapsed
+                legacy_text = f"{legacy_elapsed:13.3f}s"
+                gain_text = f"{legacy_elapsed / current_elapsed:7.1f}x"
+            else:
+                legacy_text, gain_text = "—".rjust(14), "—".rjust(8)
+
+            print(f"{count:>8} {legacy_text} {current_elapsed:9.3f}s {gain_text}")
+
+    print()
+    print(
+        f"{'linhas':>8} {'célula a célula':>16} {'estilos nomeados':>17} {'ganho':>8}"
+    )
+    for count in ROW_COUNTS:
+        groups = generate_groups(count)
+        legacy_elapsed = measure_formatting(legacy_format, template, groups)
+        current_elapsed = measure_formatting(
+            named_styles_format(filler), template, groups
+        )
+        print(
+            f"{count:>8} {legacy_elapsed:15.3f}s {current_elapsed:16.3f}s "
+            f"{legacy_elapsed / current_elapsed:7.1f}x"
+        )
+
+    print()
+    lot_count, rows_per_lot = SMALL_LOTS
+    groups = generate_groups(rows_per_lot)
+    with tempfile.TemporaryDirectory() as tmp:
+        timings = {}
+        for label, reuse_prototype in (("relendo", False), ("protótipo", True)):
+            filler.clear_cache()
+            start = time.perf_counter()
+            for i in range(lot_count):
+                if not reuse_prototype:
+                    filler.clear_cache()
+                filler.fill_and_save(template, Path(tmp, f"lote_{i}.xlsx"), groups)
+            timings[label] = time.perf_counter() - start
+    print(
+        f"{lot_count} lotes de {rows_per_lot} linhas: "
+        f"relendo o template {timings['relendo']:.3f}s, "
+        f"com protótipo {timings['protótipo']:.3f}s "
+        f"({timings['relendo'] / timings['protótipo']:.1f}x)"
+    )
+
+
+if __name__ == "__main__":
+    main()
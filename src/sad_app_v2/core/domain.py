@@ -1,7 +1,7 @@
 import enum
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence, Set
 
 
 # Enum para o status dos arquivos, garantindo consistência.
@@ -14,7 +14,9 @@ class DocumentStatus(enum.Enum):
     NEEDS_SUFFIX = "Precisa de Sufixo"
 
 
-@dataclass
+# ManifestItem e DocumentFile existem às centenas de milhares durante a
+# validação; slots=True elimina o __dict__ de cada instância.
+@dataclass(slots=True)
 class ManifestItem:
     """Representa uma linha do manifesto de entrada (a fonte da verdade)."""
 
@@ -25,7 +27,7 @@ class ManifestItem:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class DocumentFile:
     """Representa um arquivo físico no disco."""
 
@@ -34,8 +36,6 @@ class DocumentFile:
     status: DocumentStatus = DocumentStatus.UNVALIDATED
     # A associação é feita após a validação bem-sucedida.
     associated_manifest_item: Optional[ManifestItem] = None
-    # Campo para compatibilidade com versões antigas do código
-    _manifest_item: Optional[ManifestItem] = None
 
     def __post_init__(self):
         # Garante que o path seja sempre um objeto Path.
@@ -49,9 +49,80 @@ class DocumentFile:
 
     @manifest_item.setter
     def manifest_item(self, value):
-        """Setter que atualiza ambos os campos para manter compatibilidade."""
+        """Setter para manter compatibilidade com código legado."""
         self.associated_manifest_item = value
-        self._manifest_item = value
+
+    # Campo para compatibilidade com versões antigas do código, agora apenas
+    # um apelido de associated_manifest_item (não ocupa espaço na instância).
+    _manifest_item = manifest_item
+
+
+@dataclass
+class BatchValidationResult:
+    """
+    Resultado colunar da validação em lote: uma posição por arquivo, sem
+    criar um DocumentFile para cada um. Os objetos são materializados apenas
+    para as faixas que forem de fato exibidas ou processadas.
+    """
+
+    paths: Sequence[str]
+    sizes: Sequence[int]
+    statuses: List[DocumentStatus]
+    matched_items: List[Optional[ManifestItem]]
+    validated_indexes: List[int] = field(default_factory=list)
+    unrecognized_indexes: List[int] = field(default_factory=list)
+
+    def document_file(self, index: int) -> DocumentFile:
+        """Cria o DocumentFile de uma posição do resultado."""
+        return DocumentFile(
+            path=Path(self.paths[index]),
+            size_bytes=self.sizes[index],
+            status=self.statuses[index],
+            associated_manifest_item=self.matched_items[index],
+        )
+
+    def validated_files(
+        self, start: int = 0, stop: Optional[int] = None
+    ) -> List[DocumentFile]:
+        """Materializa uma faixa dos arquivos validados."""
+        return [self.document_file(i) for i in self.validated_indexes[start:stop]]
+
+    def unrecognized_files(
+        self, start: int = 0, stop: Optional[int] = None
+    ) -> List[DocumentFile]:
+        """Materializa uma faixa dos arquivos não reconhecidos."""
+        return [self.document_file(i) for i in self.unrecognized_indexes[start:stop]]
+
+
+@dataclass
+class ScanDiff:
+    """Diferença entre a varredura atual de um diretório e a anterior."""
+
+    added: List[DocumentFile] = field(default_factory=list)
+    modified: List[DocumentFile] = field(default_factory=list)
+    removed: List[Path] = field(default_factory=list)
+
+    @property
+    def changed_paths(self) -> Set[Path]:
+        """Todos os caminhos cujo resultado de validação deve ser descartado."""
+        return (
+            {file.path for file in self.added}
+            | {file.path for file in self.modified}
+            | set(self.removed)
+        )
+
+
+@dataclass
+class ExtractionResult:
+    """Texto extraído de um arquivo, ou a mensagem do erro que o impediu."""
+
+    file: DocumentFile
+    text: str = ""
+    error: Optional[str] = None
+
+    @property
+    def success(self) -> bool:
+        return self.error is None
 
 
 @dataclass
@@ -60,11 +131,31 @@ class DocumentGroup:
 
     document_code: str
     files: List[DocumentFile] = field(default_factory=list)
+    # Contador de bytes mantido por add_file. Quem alterar a lista de
+    # arquivos diretamente deve chamar recalculate() em seguida.
+    _size_bytes: int = field(default=0, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.recalculate()
+
+    def recalculate(self) -> None:
+        """Recalcula o contador após alterações diretas na lista de arquivos."""
+        self._size_bytes = sum(file.size_bytes for file in self.files)
+
+    def add_file(self, file: DocumentFile) -> None:
+        """Adiciona um arquivo ao grupo atualizando o contador em O(1)."""
+        self.files.append(file)
+        self._size_bytes += file.size_bytes
+
+    @property
+    def file_count(self) -> int:
+        """Quantidade de arquivos físicos do grupo."""
+        return len(self.files)
 
     @property
     def total_size_bytes(self) -> int:
-        """Calcula o tamanho total de todos os arquivos do grupo."""
-        return sum(file.size_bytes for file in self.files)
+        """Tamanho total de todos os arquivos do grupo."""
+        return self._size_bytes
 
 
 @dataclass
@@ -73,6 +164,29 @@ class OutputLot:
 
     lot_name: str
     groups: List["DocumentGroup"] = field(default_factory=list)
+    # Contadores de bytes e arquivos mantidos por add_group, no mesmo esquema
+    # do grupo. Os grupos devem estar completos quando adicionados ao lote.
+    _size_bytes: int = field(default=0, init=False, repr=False, compare=False)
+    _file_count: int = field(default=0, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.recalculate()
+
+    def recalculate(self) -> None:
+        """
+        Recalcula os contadores do lote e de seus grupos após alterações
+        diretas nas listas de grupos ou de arquivos.
+        """
+        for group in self.groups:
+            group.recalculate()
+        self._size_bytes = sum(group.total_size_bytes for group in self.groups)
+        self._file_count = sum(group.file_count for group in self.groups)
+
+    def add_group(self, group: DocumentGroup) -> None:
+        """Adiciona um grupo ao lote atualizando os contadores em O(1)."""
+        self.groups.append(group)
+        self._size_bytes += group.total_size_bytes
+        self._file_count += group.file_count
 
     # Mantém compatibilidade com código existente
     @property
@@ -83,10 +197,20 @@ class OutputLot:
             all_files.extend(group.files)
         return all_files
 
+    @property
+    def document_count(self) -> int:
+        """Quantidade de documentos (grupos) no lote."""
+        return len(self.groups)
+
+    @property
+    def file_count(self) -> int:
+        """Quantidade de arquivos físicos no lote."""
+        return self._file_count
+
     @property
     def total_size_bytes(self) -> int:
-        """Calcula o tamanho total de todos os grupos no lote."""
-        return sum(group.total_size_bytes for group in self.groups)
+        """Tamanho total de todos os grupos no lote."""
+        return self._size_bytes
 
 
 @dataclass
@@ -97,3 +221,5 @@ class OrganizationResult:
     files_moved: int = 0
     success: bool = True
     message: str = "Operação concluída com sucesso."
+    # Lotes que falharam, na ordem de numeração: nome do lote -> mensagem
+    lot_errors: Dict[str, str] = field(default_factory=dict)
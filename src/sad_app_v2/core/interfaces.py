@@ -1,12 +1,14 @@
 from pathlib import Path
-from typing import List, Optional, Protocol
+from typing import Dict, Iterable, Iterator, List, Optional, Protocol, Sequence
 
 # Importamos nossas entidades de domínio para usá-las nas assinaturas
 from .domain import (
     DocumentFile,
     DocumentGroup,
+    ExtractionResult,
     ManifestItem,
     OutputLot,
+    ScanDiff,
 )
 
 
@@ -60,6 +62,10 @@ class IManifestRepository(Protocol):
         """Carrega dados de um arquivo e os transforma em entidades ManifestItem."""
         ...
 
+    def iter_items(self, file_path: Path) -> Iterator[ManifestItem]:
+        """Produz os ManifestItem à medida que as linhas são lidas."""
+        ...
+
 
 class IFileRepository(Protocol):
     """Contrato para um repositório que lista arquivos em um diretório."""
@@ -69,6 +75,14 @@ class IFileRepository(Protocol):
         ...
 
 
+class IIncrementalFileRepository(IFileRepository, Protocol):
+    """Contrato para um repositório que reporta as mudanças entre varreduras."""
+
+    def scan_changes(self, directory: Path) -> ScanDiff:
+        """Compara o diretório com a última varredura e retorna a diferença."""
+        ...
+
+
 class IContentExtractor(Protocol):
     """Contrato para um serviço que extrai conteúdo textual de um arquivo."""
 
@@ -77,6 +91,20 @@ class IContentExtractor(Protocol):
         ...
 
 
+class IBatchContentExtractor(IContentExtractor, Protocol):
+    """Contrato para um extrator que processa vários arquivos de uma vez."""
+
+    def extract_texts(
+        self, files: Iterable[DocumentFile], profile_id: str
+    ) -> Iterator[ExtractionResult]:
+        """
+        Extrai o texto de vários arquivos, entregando cada resultado assim que
+        fica pronto (não necessariamente na ordem de entrada). Falhas de
+        leitura vêm no próprio resultado, sem interromper os demais arquivos.
+        """
+        ...
+
+
 class ICodeExtractor(Protocol):
     """Contrato para um serviço que encontra um código de relatório em um texto."""
 
@@ -110,6 +138,13 @@ class IFileSystemManager(Protocol):
         """Copia um arquivo do local de origem para o destino."""
         ...
 
+    def stat_files(self, paths: Sequence[Path]) -> Dict[Path, Optional[int]]:
+        """
+        Verifica vários arquivos de uma vez, devolvendo o tamanho em bytes de
+        cada caminho, ou None para os que não existem.
+        """
+        ...
+
 
 class ITemplateFiller(Protocol):
     """Contrato para um serviço que preenche um template Excel."""
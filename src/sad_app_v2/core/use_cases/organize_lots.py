@@ -1,7 +1,11 @@
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List
+from typing import Callable, Dict, List, NamedTuple, Optional
 
-from ..domain import DocumentFile, DocumentGroup, OrganizationResult
+from ..domain import DocumentFile, DocumentGroup, OrganizationResult, OutputLot
 from ..interfaces import (
     CoreError,
     IFileSystemManager,
@@ -41,18 +45,135 @@ def _get_filename_with_revision(original_filename: str, revision: str) -> str:
             return f"{original_filename}_{revision}"
 
 
+class _LotJob(NamedTuple):
+    """Lote já numerado, pronto para ser materializado."""
+
+    lot: OutputLot
+    lot_name: str
+    directory: Path
+
+
+@dataclass
+class _LotState:
+    """Andamento de um lote ao longo das etapas de materialização."""
+
+    job: _LotJob
+    files_moved: int = 0
+    error: Optional[str] = None
+    # Lote não iniciado porque a execução parou em uma falha anterior
+    skipped: bool = False
+
+
+# Marca de fim de fluxo entre as etapas do pipeline
+_END = object()
+
+
+def _run_pipeline(
+    items: List[_LotState],
+    steps: List[Callable[[_LotState], None]],
+    queue_size: int,
+) -> List[_LotState]:
+    """
+    Executa cada etapa em sua própria thread, ligadas por filas limitadas: a
+    etapa k processa o lote N enquanto a etapa k + 1 ainda trata o lote N - 1.
+    A ordem dos lotes é preservada. Uma exceção inesperada em qualquer etapa
+    interrompe o processamento (as filas continuam sendo esvaziadas, para não
+    travar as etapas anteriores) e é relançada ao final.
+    """
+    queues: List[queue.Queue] = [queue.Queue(maxsize=queue_size) for _ in steps]
+    results: List[_LotState] = []
+    failures: List[BaseException] = []
+
+    def run_stage(index: int) -> None:
+        inbox = queues[index]
+        outbox = queues[index + 1] if index + 1 < len(queues) else None
+        while True:
+            item = inbox.get()
+            if item is _END:
+                break
+            if not failures:
+                try:
+                    steps[index](item)
+                except BaseException as e:
+                    failures.append(e)
+            if outbox is None:
+                results.append(item)
+            else:
+                outbox.put(item)
+        if outbox is not None:
+            outbox.put(_END)
+
+    threads = [
+        threading.Thread(
+            target=run_stage, args=(index,), name=f"organize-stage-{index}"
+        )
+        for index in range(len(steps))
+    ]
+    for thread in threads:
+        thread.start()
+    try:
+        for item in items:
+            if failures:
+                break
+            queues[0].put(item)
+    finally:
+        queues[0].put(_END)
+        for thread in threads:
+            thread.join()
+    if failures:
+        raise failures[0]
+    return results
+
+
+def _format_lot_errors(lot_errors: Dict[str, str], total_lots: int) -> str:
+    """Resume as falhas por lote, limitando a lista a 5 lotes."""
+    message = f"Falha ao gerar {len(lot_errors)} de {total_lots} lote(s):\n"
+    items = list(lot_errors.items())
+    for lot_name, error in items[:5]:
+        message += f"- {lot_name}: {error}\n"
+    if len(items) > 5:
+        message += f"...e mais {len(items) - 5} lote(s).\n"
+    return message
+
+
 class OrganizeAndGenerateLotsUseCase:
-    """Implementa o Caso de Uso UC-03: Organizar e Gerar Lotes de Saída."""
+    """
+    Implementa o Caso de Uso UC-03: Organizar e Gerar Lotes de Saída.
+
+    Cada lote passa por três etapas: criação da pasta, movimentação dos
+    arquivos e preenchimento do manifesto. Há três modos de execução:
+
+    - padrão: um lote de cada vez;
+    - max_workers > 1: até max_workers lotes materializados ao mesmo tempo;
+    - pipeline=True: cada etapa roda em sua própria thread, ligadas por filas
+      de até queue_size lotes, de modo que o manifesto do lote N (trabalho de
+      CPU no openpyxl) é gerado enquanto os arquivos do lote N + 1 são movidos
+      (trabalho de E/S). Neste modo max_workers não é usado.
+
+    A numeração é definida antes da execução, na ordem do balanceador, e não
+    depende da ordem de término. Por padrão a execução para na primeira falha:
+    nenhum lote novo é iniciado (os já iniciados terminam) e a mensagem do
+    resultado é a do erro. Com continue_on_error=True a falha de um lote não
+    interrompe os demais e os erros são reunidos por lote no resultado.
+    """
 
     def __init__(
         self,
         balancer: ILotBalancerService,
         file_manager: IFileSystemManager,
         template_filler: ITemplateFiller,
+        max_workers: int = 1,
+        pipeline: bool = False,
+        queue_size: int = 2,
+        continue_on_error: bool = False,
     ):
         self._balancer = balancer
         self._file_manager = file_manager
         self._template_filler = template_filler
+        self._max_workers = max(1, max_workers)
+        self._pipeline = pipeline
+        self._queue_size = max(1, queue_size)
+        self._continue_on_error = continue_on_error
 
     def execute(
         self,
@@ -64,11 +185,14 @@ class OrganizeAndGenerateLotsUseCase:
         lot_name_pattern: str,
     ) -> OrganizationResult:
         try:
-            # Validação inicial - verificar se os arquivos existem
-            nonexistent_files = []
-            for file in validated_files:
-                if not file.path.exists():
-                    nonexistent_files.append(file)
+            # Validação inicial - verificar se os arquivos existem (cada pasta
+            # de origem é listada uma única vez)
+            sizes = self._file_manager.stat_files(
+                [file.path for file in validated_files]
+            )
+            nonexistent_files = [
+                file for file in validated_files if sizes.get(file.path) is None
+            ]
 
             if nonexistent_files:
                 error_msg = (
@@ -98,53 +222,149 @@ class OrganizeAndGenerateLotsUseCase:
 
                 if code not in groups_map:
                     groups_map[code] = DocumentGroup(document_code=code)
-                groups_map[code].files.append(file)
+                groups_map[code].add_file(file)
 
             groups = list(groups_map.values())
 
             # 2. Balanceamento
             output_lots = self._balancer.balance_lots(groups, max_docs_per_lot)
 
-            files_moved_count = 0
-
-            # 3. Loop de Execução (Nomenclatura, Movimentação, Preenchimento)
+            # 3. Numeração dos lotes, fixada antes da execução
+            jobs = []
             for i, lot in enumerate(output_lots):
                 seq_number = start_sequence_number + i
                 lot_name = lot_name_pattern.replace("XXXX", f"{seq_number:04d}")
+                jobs.append(_LotJob(lot, lot_name, output_directory / lot_name))
+
+            # 4. Execução (Movimentação e Preenchimento)
+            outcomes = self._run_jobs(jobs, master_template_path)
+
+        except CoreError as e:
+            # Se qualquer operação de infraestrutura falhar, retorna um resultado
+            # com erro informando o problema.
+            return OrganizationResult(success=False, message=str(e))
+
+        files_moved_count = sum(outcome.files_moved for outcome in outcomes)
+        lot_errors = {
+            outcome.job.lot_name: outcome.error
+            for outcome in outcomes
+            if outcome.error is not None
+        }
+        if lot_errors and not self._continue_on_error:
+            # Execução interrompida: a mensagem é a do primeiro lote com falha
+            completed = [
+                outcome
+                for outcome in outcomes
+                if outcome.error is None and not outcome.skipped
+            ]
+            return OrganizationResult(
+                lots_created=len(completed),
+                files_moved=files_moved_count,
+                success=False,
+                message=next(iter(lot_errors.values())),
+                lot_errors=lot_errors,
+            )
+        if lot_errors:
+            return OrganizationResult(
+                lots_created=len(jobs) - len(lot_errors),
+                files_moved=files_moved_count,
+                success=False,
+                message=_format_lot_errors(lot_errors, len(jobs)),
+                lot_errors=lot_errors,
+            )
+        return OrganizationResult(
+            lots_created=len(jobs),
+            files_moved=files_moved_count,
+        )
 
-                lot_directory_path = output_directory / lot_name
+    def _run_jobs(
+        self, jobs: List[_LotJob], master_template_path: Path
+    ) -> List[_LotState]:
+        """Materializa os lotes; o resultado segue a ordem de numeração."""
+        states = [_LotState(job) for job in jobs]
+        stop = threading.Event()
 
-                # 3a. Criação de Diretório
-                self._file_manager.create_directory(lot_directory_path)
+        def start(state: _LotState) -> None:
+            # Sem continue_on_error, nenhum lote é iniciado após uma falha
+            if stop.is_set():
+                state.skipped = True
+                return
+            self._create_lot_directory(state)
 
-                # 3b. Movimentação dos Arquivos
-                for group in lot.groups:
-                    for file in group.files:
-                        # Obter informações do manifesto
-                        manifest_item = file.associated_manifest_item
-                        revision = manifest_item.revision if manifest_item else "0"
+        steps = [
+            start,
+            self._move_lot_files,
+            lambda state: self._fill_lot_manifest(state, master_template_path),
+        ]
+        if not self._continue_on_error:
+            steps = [self._stopping_on_error(step, stop) for step in steps]
 
-                        # Construir novo nome do arquivo com revisão
-                        new_filename = _get_filename_with_revision(
-                            file.path.name, revision
-                        )
+        def materialize(state: _LotState) -> _LotState:
+            for step in steps:
+                step(state)
+            return state
 
-                        destination_path = lot_directory_path / new_filename
-                        self._file_manager.move_file(file.path, destination_path)
-                        files_moved_count += 1
+        if self._pipeline and len(states) > 1:
+            return _run_pipeline(states, steps, self._queue_size)
+        workers = min(self._max_workers, len(states))
+        if workers <= 1:
+            return [materialize(state) for state in states]
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="organize-lot"
+        ) as executor:
+            return list(executor.map(materialize, states))
 
-                # 3c. Preenchimento do Manifesto de Lote
-                output_manifest_path = lot_directory_path / f"{lot_name}.xlsx"
-                self._template_filler.fill_and_save(
-                    master_template_path, output_manifest_path, lot.groups
-                )
+    @staticmethod
+    def _stopping_on_error(
+        step: Callable[[_LotState], None], stop: threading.Event
+    ) -> Callable[[_LotState], None]:
+        """Envolve uma etapa para sinalizar a parada quando o lote falhar."""
 
-            return OrganizationResult(
-                lots_created=len(output_lots),
-                files_moved=files_moved_count,
-            )
+        def run(state: _LotState) -> None:
+            step(state)
+            if state.error is not None:
+                stop.set()
+
+        return run
 
+    # --- Etapas de um lote ---
+    # Uma falha (CoreError) fica registrada no lote, que pula as etapas
+    # seguintes. Os demais lotes seguem apenas com continue_on_error.
+
+    def _create_lot_directory(self, state: _LotState) -> None:
+        if state.error is not None:
+            return
+        try:
+            self._file_manager.create_directory(state.job.directory)
         except CoreError as e:
-            # Se qualquer operação de infraestrutura falhar, retorna um resultado
-            # com erro informando o problema.
-            return OrganizationResult(success=False, message=str(e))
+            state.error = str(e)
+
+    def _move_lot_files(self, state: _LotState) -> None:
+        if state.error is not None or state.skipped:
+            return
+        try:
+            for group in state.job.lot.groups:
+                for file in group.files:
+                    # Obter informações do manifesto
+                    manifest_item = file.associated_manifest_item
+                    revision = manifest_item.revision if manifest_item else "0"
+
+                    # Construir novo nome do arquivo com revisão
+                    new_filename = _get_filename_with_revision(file.path.name, revision)
+
+                    destination_path = state.job.directory / new_filename
+                    self._file_manager.move_file(file.path, destination_path)
+                    state.files_moved += 1
+        except CoreError as e:
+            state.error = str(e)
+
+    def _fill_lot_manifest(self, state: _LotState, master_template_path: Path) -> None:
+        if state.error is not None or state.skipped:
+            return
+        try:
+            output_manifest_path = state.job.directory / f"{state.job.lot_name}.xlsx"
+            self._template_filler.fill_and_save(
+                master_template_path, output_manifest_path, state.job.lot.groups
+            )
+        except CoreError as e:
+            state.error = str(e)
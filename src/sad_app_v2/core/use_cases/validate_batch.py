@@ -1,10 +1,45 @@
+import os
 import re
 from pathlib import Path
-from typing import Dict, List, Tuple
-
-from ..domain import DocumentFile, DocumentStatus, ManifestItem
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+from ..domain import (
+    BatchValidationResult,
+    DocumentFile,
+    DocumentStatus,
+    ManifestItem,
+)
 from ..interfaces import IFileRepository, IManifestRepository
 
+# Sufixos de revisão típicos, em uma única alternação pré-compilada:
+# _A, _B...; _Rev0, _rev1...; _0, _1...; _final, _temp, _old, _backup,
+# _draft, _preliminary. Nenhuma alternativa contém "_", então o sufixo só
+# pode ser o trecho após o último underscore do nome.
+_REVISION_SUFFIX = re.compile(
+    r"(?:[A-Z]|Rev\d+|\d+|final|temp|old|backup|draft|preliminary)",
+    re.IGNORECASE,
+)
+
+
+def strip_revision_suffix(stem: str) -> str:
+    """
+    Remove um sufixo de revisão conhecido do nome sem extensão, em uma única
+    passada: separa o último segmento após "_" e o testa contra a alternação.
+    """
+    base, separator, suffix = stem.rpartition("_")
+    if separator and _REVISION_SUFFIX.fullmatch(suffix):
+        return base
+    # Se não encontrou nenhum sufixo conhecido, retorna o nome completo
+    return stem
+
+
+def _stem_of(file_name: str) -> str:
+    """Equivalente a Path(file_name).stem, sem criar um objeto Path."""
+    dot = file_name.rfind(".")
+    if 0 < dot < len(file_name) - 1:
+        return file_name[:dot]
+    return file_name
+
 
 class ValidateBatchUseCase:
     """
@@ -30,59 +65,30 @@ class ValidateBatchUseCase:
         - 'CZ6_RNEST_U22_3.1.1.1_ELE_RIR_ELE-700-CHZ-247-FL04_A.pdf' -> 'CZ6_RNEST_U22_3.1.1.1_ELE_RIR_ELE-700-CHZ-247-FL04'
         - 'DOC-123_Rev0.pdf' -> 'DOC-123'
         """
-        name_without_ext = Path(file_name).stem
-
-        # Padrões de sufixos de revisão típicos
-        revision_patterns = [
-            r"_[A-Z]$",  # _A, _B, _C, etc.
-            r"_Rev\d+$",  # _Rev0, _Rev1, _Rev2, etc.
-            r"_rev\d+$",  # _rev0, _rev1, _rev2, etc.
-            r"_\d+$",  # _0, _1, _2, etc.
-            r"_final$",  # _final
-            r"_temp$",  # _temp
-            r"_old$",  # _old
-            r"_backup$",  # _backup
-            r"_draft$",  # _draft
-            r"_preliminary$",  # _preliminary
-        ]
-
-        # Verifica se há um sufixo de revisão no final
-        for pattern in revision_patterns:
-            if re.search(pattern, name_without_ext, re.IGNORECASE):
-                # Remove o sufixo encontrado
-                return re.sub(pattern, "", name_without_ext, flags=re.IGNORECASE)
-
-        # Se não encontrou nenhum sufixo conhecido, retorna o nome completo
-        return name_without_ext
-
-    def execute(
-        self, manifest_path: Path, source_directory: Path
-    ) -> Tuple[List[DocumentFile], List[DocumentFile]]:
-        """
-        Executa o fluxo principal do caso de uso.
-        """
-        # 1. Carrega os dados do manifesto e do sistema de arquivos
-        manifest_items = self._manifest_repo.load_from_file(manifest_path)
-        disk_files = self._file_repo.list_files(source_directory)
+        return strip_revision_suffix(Path(file_name).stem)
 
-        # 2. Cria um dicionário para busca rápida dos itens do manifesto
-        manifest_map: Dict[str, ManifestItem] = {
-            item.document_code: item for item in manifest_items
+    def _load_manifest_map(self, manifest_path: Path) -> Dict[str, ManifestItem]:
+        """Monta o dicionário de busca à medida que o manifesto é lido."""
+        return {
+            item.document_code: item
+            for item in self._manifest_repo.iter_items(manifest_path)
         }
 
-        # 3. Inicializa as listas de resultado
+    def _validate_files(
+        self, disk_files: Iterable[DocumentFile], manifest_map: Dict[str, ManifestItem]
+    ) -> Tuple[List[DocumentFile], List[DocumentFile]]:
+        """Compara cada arquivo com o manifesto e o classifica."""
         validated_files: List[DocumentFile] = []
         unrecognized_files: List[DocumentFile] = []
 
-        # 4. Itera sobre os arquivos do disco para validação
         for file in disk_files:
-            base_name = self._get_file_base_name(file.path.name)
-            file_stem = Path(file.path.name).stem  # Nome sem extensão
+            file_stem = file.path.stem  # Nome sem extensão
+            base_name = strip_revision_suffix(file_stem)
 
             # Verificar se tem sufixo (comparando com nome base)
             has_suffix = file_stem != base_name
 
-            # 5. Tenta encontrar a correspondência no manifesto
+            # Tenta encontrar a correspondência no manifesto
             matched_item = manifest_map.get(base_name)
 
             if matched_item:
@@ -103,3 +109,101 @@ class ValidateBatchUseCase:
                 unrecognized_files.append(file)
 
         return validated_files, unrecognized_files
+
+    def execute(
+        self, manifest_path: Path, source_directory: Path
+    ) -> Tuple[List[DocumentFile], List[DocumentFile]]:
+        """
+        Executa o fluxo principal do caso de uso.
+        """
+        # 1. Carrega os dados do manifesto e do sistema de arquivos
+        manifest_map = self._load_manifest_map(manifest_path)
+        disk_files = self._file_repo.list_files(source_directory)
+
+        # 2. Valida todos os arquivos encontrados
+        return self._validate_files(disk_files, manifest_map)
+
+    def execute_incremental(
+        self,
+        manifest_path: Path,
+        source_directory: Path,
+        previous_validated: List[DocumentFile],
+        previous_unrecognized: List[DocumentFile],
+    ) -> Tuple[List[DocumentFile], List[DocumentFile]]:
+        """
+        Revalida apenas o que mudou no disco desde a última varredura.
+
+        Requer um repositório de arquivos incremental. Os resultados anteriores
+        de arquivos inalterados são mantidos; arquivos adicionados ou
+        modificados são validados de novo e os removidos são descartados.
+        O manifesto deve ser o mesmo da validação anterior.
+        """
+        manifest_map = self._load_manifest_map(manifest_path)
+        diff = self._file_repo.scan_changes(source_directory)
+
+        changed_paths = diff.changed_paths
+        validated_files = [
+            f for f in previous_validated if f.path not in changed_paths
+        ]
+        unrecognized_files = [
+            f for f in previous_unrecognized if f.path not in changed_paths
+        ]
+
+        new_validated, new_unrecognized = self._validate_files(
+            diff.added + diff.modified, manifest_map
+        )
+        return (
+            validated_files + new_validated,
+            unrecognized_files + new_unrecognized,
+        )
+
+    def execute_batch(
+        self, manifest_path: Path, paths: Sequence[str], sizes: Sequence[int]
+    ) -> BatchValidationResult:
+        """
+        Valida arquivos recebidos em colunas (caminhos e tamanhos) em vez de
+        DocumentFile, para acervos muito grandes.
+
+        Os nomes são normalizados em bloco, a correspondência com o manifesto
+        é uma junção por hash e nenhum DocumentFile é criado aqui: o resultado
+        os materializa sob demanda.
+        """
+        if len(paths) != len(sizes):
+            raise ValueError(
+                "As colunas de caminhos e tamanhos devem ter o mesmo tamanho."
+            )
+
+        manifest_map = self._load_manifest_map(manifest_path)
+
+        # 1. Normalização em bloco: nome do arquivo -> nome sem extensão -> base
+        stems = list(map(_stem_of, map(os.path.basename, paths)))
+        base_names = list(map(strip_revision_suffix, stems))
+
+        # 2. Junção por hash com os códigos do manifesto
+        matched_items = list(map(manifest_map.get, base_names))
+
+        # 3. Classificação
+        statuses: List[DocumentStatus] = []
+        validated_indexes: List[int] = []
+        unrecognized_indexes: List[int] = []
+        for index, (stem, base_name, item) in enumerate(
+            zip(stems, base_names, matched_items)
+        ):
+            if item is None:
+                statuses.append(DocumentStatus.UNRECOGNIZED)
+                unrecognized_indexes.append(index)
+            elif stem != base_name:
+                statuses.append(DocumentStatus.VALIDATED)
+                validated_indexes.append(index)
+            else:
+                statuses.append(DocumentStatus.NEEDS_SUFFIX)
+                unrecognized_indexes.append(index)
+
+        return BatchValidationResult(
+            paths=paths,
+            sizes=sizes,
+            statuses=statuses,
+            matched_items=matched_items,
+            validated_indexes=validated_indexes,
+            unrecognized_indexes=unrecognized_indexes,
+        )
@@ -1,54 +1,107 @@
 from pathlib import Path
-from typing import List
+from typing import Any, Dict, Iterator, List, Optional, Sequence
 
 import openpyxl
 
 from ..core.domain import ManifestItem
 from ..core.interfaces import IManifestRepository, ManifestReadError
 
+# Nomes de coluna esperados no cabeçalho para os campos principais.
+# Se algum não for encontrado, os três usam a posição fixa (A=0, B=1, C=2):
+# misturar nomes e posições poderia ler dois campos da mesma coluna.
+_CODE_COLUMN = "DOCUMENTO"
+_REVISION_COLUMN = "REVISÃO"
+_TITLE_COLUMN = "TÍTULO"
+_DEFAULT_POSITIONS = {_CODE_COLUMN: 0, _REVISION_COLUMN: 1, _TITLE_COLUMN: 2}
+
+
+def _normalize_header(value: Any) -> Optional[str]:
+    """Normaliza o nome de uma coluna para comparação (sem espaços, maiúsculo)."""
+    if value is None:
+        return None
+    return str(value).strip().upper()
+
+
+class _ColumnMap:
+    """
+    Mapeamento das colunas do manifesto, resolvido uma única vez a partir
+    do cabeçalho.
+    """
+
+    def __init__(self, header: Sequence[Any]):
+        normalized = [_normalize_header(value) for value in header]
+
+        if all(name in normalized for name in _DEFAULT_POSITIONS):
+            positions = {name: normalized.index(name) for name in _DEFAULT_POSITIONS}
+        else:
+            positions = dict(_DEFAULT_POSITIONS)
+
+        self.code_index = positions[_CODE_COLUMN]
+        self.revision_index = positions[_REVISION_COLUMN]
+        self.title_index = positions[_TITLE_COLUMN]
+
+        # Colunas restantes com nome no cabeçalho viram metadados
+        core_indexes = set(positions.values())
+        self.metadata_columns = [
+            (i, header[i])
+            for i in range(len(header))
+            if i not in core_indexes and header[i] is not None
+        ]
+
+    def to_item(self, row: Sequence[Any]) -> ManifestItem:
+        """Converte uma linha (values_only) em um ManifestItem."""
+
+        def value_at(index: int) -> Any:
+            return row[index] if index < len(row) else None
+
+        metadata: Dict[str, Any] = {
+            name: value_at(i) for i, name in self.metadata_columns
+        }
+        return ManifestItem(
+            document_code=value_at(self.code_index),
+            revision=str(value_at(self.revision_index)),  # Revisão sempre string
+            title=value_at(self.title_index),
+            metadata=metadata,
+        )
+
 
 class ExcelManifestRepository(IManifestRepository):
     """Implementação concreta para ler manifestos de arquivos Excel."""
 
     def load_from_file(self, file_path: Path) -> List[ManifestItem]:
+        return list(self.iter_items(file_path))
+
+    def iter_items(self, file_path: Path) -> Iterator[ManifestItem]:
+        """
+        Lê o manifesto em modo streaming, produzindo um ManifestItem por linha.
+
+        O cabeçalho é lido uma única vez e as colunas são mapeadas pelo nome,
+        de modo que o custo é linear no número de linhas.
+        """
         try:
             workbook = openpyxl.load_workbook(file_path, read_only=True)
-            sheet = workbook.active
+        except FileNotFoundError:
+            raise ManifestReadError(f"Arquivo manifesto não encontrado em: {file_path}")
+        except Exception as e:
+            # Captura outras exceções (formato inválido, etc.)
+            raise ManifestReadError(f"Erro ao ler o arquivo manifesto: {e}")
 
-            items: List[ManifestItem] = []
+        try:
+            rows = workbook.active.iter_rows(values_only=True)
+
+            header = next(rows, None)
+            if header is None:
+                return
+            columns = _ColumnMap(header)
 
-            # Itera sobre as linhas, pulando o cabeçalho (min_row=2)
-            for row in sheet.iter_rows(min_row=2, values_only=True):
+            for row in rows:
                 # Ignora linhas vazias
                 if not any(row):
                     continue
+                yield columns.to_item(row)
 
-                # Mapeamento fixo de colunas. A=0, B=1, etc.
-                document_code = row[0]
-                revision = str(row[1])  # Garante que a revisão seja string
-                title = row[2]
-
-                # Coleta metadados extras a partir da coluna D (índice 3)
-                # Pega os nomes das colunas do cabeçalho
-                header = [cell.value for cell in sheet[1]]
-                metadata = {
-                    header[i]: row[i]
-                    for i in range(3, len(row))
-                    if i < len(header)  # Garante que não leia além do cabeçalho
-                }
-
-                items.append(
-                    ManifestItem(
-                        document_code=document_code,
-                        revision=revision,
-                        title=title,
-                        metadata=metadata,
-                    )
-                )
-            return items
-
-        except FileNotFoundError:
-            raise ManifestReadError(f"Arquivo manifesto não encontrado em: {file_path}")
         except Exception as e:
-            # Captura outras exceções (formato inválido, etc.)
             raise ManifestReadError(f"Erro ao ler o arquivo manifesto: {e}")
+        finally:
+            # Em modo read_only o arquivo fica aberto até o fechamento explícito
+            workbook.close()
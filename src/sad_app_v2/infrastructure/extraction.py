@@ -1,23 +1,136 @@
 import re
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+)
 
 import docx
 import yaml
 from PyPDF2 import PdfReader
 
-from ..core.domain import DocumentFile
-from ..core.interfaces import FileReadError, ICodeExtractor, IContentExtractor
+from ..core.domain import DocumentFile, ExtractionResult
+from ..core.interfaces import FileReadError, IBatchContentExtractor, ICodeExtractor
+from .profile_matcher import PATTERN_FLAGS, compile_profiles
 
+if TYPE_CHECKING:
+    from .extraction_cache import ExtractionCache
+    from .parallel_extraction import ProcessPoolTextExtractor
 
-class ProfiledExtractorService(IContentExtractor, ICodeExtractor):
+# Extensões lidas por read_document_text; as demais resultam em texto vazio
+SUPPORTED_SUFFIXES = (".pdf", ".docx")
+
+# Incrementar sempre que a extração de texto mudar: invalida o cache de texto
+EXTRACTOR_VERSION = 1
+
+
+def _iter_pdf_pages(file_path: Path) -> Iterator[str]:
+    """
+    Extrai o texto das páginas de um PDF sob demanda: uma página só é
+    processada quando o consumidor pede a próxima.
+    """
+    with open(file_path, "rb") as f:
+        reader = PdfReader(f)
+        for page in reader.pages:
+            yield page.extract_text() or ""
+
+
+def _extract_text_from_pdf(file_path: Path) -> str:
+    """Lógica específica para extração de texto de PDF."""
+    # Extrai texto de todas as páginas
+    return "".join(_iter_pdf_pages(file_path))
+
+
+def _extract_text_from_docx(file_path: Path) -> str:
+    """Lógica específica para extração de texto de DOCX."""
+    doc = docx.Document(file_path)
+    return "\n".join([para.text for para in doc.paragraphs])
+
+
+def iter_document_pages(file_path: Path) -> Iterator[str]:
+    """
+    Texto do documento página a página. PDFs são lidos sob demanda; um DOCX
+    não tem páginas fixas e é entregue como uma única página.
+    """
+    suffix = file_path.suffix.lower()
+    if suffix == ".pdf":
+        yield from _iter_pdf_pages(file_path)
+    elif suffix == ".docx":
+        yield _extract_text_from_docx(file_path)
+
+
+def read_document_text(path: str) -> str:
+    """
+    Lê o texto de um documento conforme a extensão. Função de módulo (e não
+    método) para poder ser executada nos processos do pool de extração.
+    """
+    file_path = Path(path)
+    suffix = file_path.suffix.lower()
+    if suffix == ".pdf":
+        return _extract_text_from_pdf(file_path)
+    elif suffix == ".docx":
+        return _extract_text_from_docx(file_path)
+    # Se o perfil precisar, podemos adicionar outros extratores (txt, etc.)
+    return ""
+
+
+def read_document_text_for_code(
+    path: str, confident_pattern: Optional[str] = None, max_pages: Optional[int] = None
+) -> str:
+    """
+    Lê apenas as páginas necessárias para encontrar o código do documento.
+
+    Após cada página, `confident_pattern` (o padrão de maior prioridade do
+    perfil) é procurado na página recém-extraída; ao encontrá-lo, a leitura
+    para. `max_pages` limita a quantidade de páginas lidas. Sem nenhum dos
+    dois, o resultado é o mesmo de read_document_text.
+    """
+    pattern = (
+        re.compile(confident_pattern, PATTERN_FLAGS) if confident_pattern else None
+    )
+    pages: List[str] = []
+    for page_text in iter_document_pages(Path(path)):
+        pages.append(page_text)
+        if pattern is not None and pattern.search(page_text):
+            break
+        if max_pages is not None and len(pages) >= max_pages:
+            break
+    return "".join(pages)
+
+
+class ProfiledExtractorService(IBatchContentExtractor, ICodeExtractor):
     """
     Implementação que extrai conteúdo e códigos de arquivos
     baseado em perfis de configuração.
+
+    Com um `backend` de processos, a leitura de PDF/DOCX (CPU pura, presa ao
+    GIL) é feita fora do processo da interface, em paralelo entre os núcleos.
+    Com um `cache`, o texto de um arquivo já lido é reaproveitado enquanto o
+    conteúdo do arquivo não mudar.
     """
 
-    def __init__(self, config_path: Path):
+    def __init__(
+        self,
+        config_path: Path,
+        backend: Optional["ProcessPoolTextExtractor"] = None,
+        cache: Optional["ExtractionCache"] = None,
+    ):
         self._profiles = self._load_profiles(config_path)
+        self._backend = backend
+        self._cache = cache
+        # Padrões compilados uma única vez; os inválidos são descartados
+        self._matchers, self.pattern_issues = compile_profiles(self._profiles)
+        for issue in self.pattern_issues:
+            print(
+                f"⚠️ Padrão do perfil {issue.profile_id} {issue.problem}: "
+                f"{issue.pattern}"
+            )
 
     def _load_profiles(self, config_path: Path) -> Dict[str, Any]:
         """Carrega os perfis de extração do arquivo YAML."""
@@ -31,48 +144,125 @@ class ProfiledExtractorService(IContentExtractor, ICodeExtractor):
             # Erro de sintaxe no YAML
             return {}
 
+    def get_available_profiles(self) -> List[str]:
+        """Retorna os identificadores dos perfis carregados."""
+        return list(self._profiles)
+
     def extract_text(self, file: DocumentFile, profile_id: str) -> str:
         """Extrai texto de um arquivo (PDF ou DOCX)."""
         try:
-            if file.path.suffix.lower() == ".pdf":
-                return self._extract_text_from_pdf(file.path)
-            elif file.path.suffix.lower() == ".docx":
-                return self._extract_text_from_docx(file.path)
-            else:
-                # Se o perfil precisar, podemos adicionar outros extratores (txt, etc.)
-                return ""
+            return self._cached(
+                file, self._full_text_variant(profile_id), lambda: self._read(file)
+            )
+        except Exception as e:
+            raise FileReadError(f"Falha ao ler o conteúdo de {file.path.name}: {e}")
+
+    def extract_text_for_code(self, file: DocumentFile, profile_id: str) -> str:
+        """
+        Extrai o texto necessário para encontrar o código do documento: as
+        páginas são lidas uma a uma e a leitura para na primeira página em que
+        o padrão principal do perfil casa, ou ao atingir o `max_pages`
+        opcional do perfil. Para uso com find_code: o padrão de parada é o
+        mesmo que find_code tenta primeiro, com as mesmas flags, então o
+        texto entregue sempre contém a correspondência que ele vai usar (com
+        a regra "longest", a mais longa dentre as páginas lidas).
+        """
+        profile = self._profiles.get(profile_id) or {}
+        matcher = self._matchers.get(profile_id)
+        confident_pattern = matcher.primary_pattern if matcher else None
+        max_pages = profile.get("max_pages")
+        # O texto parcial depende do padrão principal e do limite de páginas
+        variant = (
+            f"v{EXTRACTOR_VERSION}|{profile_id}|codigo|{max_pages}|{confident_pattern}"
+        )
+        try:
+            return self._cached(
+                file,
+                variant,
+                lambda: self._read_for_code(file, confident_pattern, max_pages),
+            )
         except Exception as e:
             raise FileReadError(f"Falha ao ler o conteúdo de {file.path.name}: {e}")
 
-    def _extract_text_from_pdf(self, file_path: Path) -> str:
-        """Lógica específica para extração de texto de PDF."""
-        text = ""
-        with open(file_path, "rb") as f:
-            reader = PdfReader(f)
-            # Extrai texto de todas as páginas
-            for page in reader.pages:
-                text += page.extract_text() or ""
-        return text
-
-    def _extract_text_from_docx(self, file_path: Path) -> str:
-        """Lógica específica para extração de texto de DOCX."""
-        doc = docx.Document(file_path)
-        return "\n".join([para.text for para in doc.paragraphs])
+    def extract_texts(
+        self, files: Iterable[DocumentFile], profile_id: str
+    ) -> Iterator[ExtractionResult]:
+        """
+        Extrai vários arquivos, entregando cada resultado assim que fica
+        pronto. Com backend de processos, os arquivos são lidos em paralelo;
+        com cache, só os arquivos ainda não lidos chegam ao backend.
+        """
+        if self._backend is None:
+            for file in files:
+                try:
+                    text = self.extract_text(file, profile_id)
+                    yield ExtractionResult(file, text=text)
+                except FileReadError as e:
+                    yield ExtractionResult(file, error=str(e))
+            return
+
+        if self._cache is None:
+            yield from self._backend.extract_batch(files)
+            return
+
+        variant = self._full_text_variant(profile_id)
+        pending: List[DocumentFile] = []
+        for file in files:
+            try:
+                text = self._cache.lookup(file.path, variant)
+            except OSError as e:
+                yield ExtractionResult(
+                    file, error=f"Falha ao ler o conteúdo de {file.path.name}: {e}"
+                )
+                continue
+            if text is None:
+                pending.append(file)
+            else:
+                yield ExtractionResult(file, text=text)
+
+        for result in self._backend.extract_batch(pending):
+            if result.success:
+                try:
+                    self._cache.store(result.file.path, variant, result.text)
+                except OSError:
+                    pass  # Arquivo removido durante a leitura; apenas não cacheia
+            yield result
+
+    def _full_text_variant(self, profile_id: str) -> str:
+        return f"v{EXTRACTOR_VERSION}|{profile_id}|texto"
+
+    def _cached(
+        self, file: DocumentFile, variant: str, extract: Callable[[], str]
+    ) -> str:
+        if self._cache is None:
+            return extract()
+        return self._cache.get_or_extract(file.path, variant, extract)
+
+    def _uses_backend(self, file: DocumentFile) -> bool:
+        return (
+            self._backend is not None and file.path.suffix.lower() in SUPPORTED_SUFFIXES
+        )
+
+    def _read(self, file: DocumentFile) -> str:
+        if self._uses_backend(file):
+            return self._backend.extract_text(file.path)
+        return read_document_text(str(file.path))
+
+    def _read_for_code(
+        self,
+        file: DocumentFile,
+        confident_pattern: Optional[str],
+        max_pages: Optional[int],
+    ) -> str:
+        if self._uses_backend(file):
+            return self._backend.extract_text_for_code(
+                file.path, confident_pattern, max_pages
+            )
+        return read_document_text_for_code(str(file.path), confident_pattern, max_pages)
 
     def find_code(self, text: str, profile_id: str) -> Optional[str]:
         """Encontra um código em um texto usando os padrões de um perfil."""
-        profile = self._profiles.get(profile_id)
-        if not profile or not text:
+        matcher = self._matchers.get(profile_id)
+        if matcher is None or not text:
             return None
-
-        patterns: List[str] = profile.get("patterns", [])
-        for pattern in patterns:
-            # re.IGNORECASE para ignorar maiúsculas/minúsculas
-            # re.MULTILINE para que ^ e $ funcionem em cada linha
-            match = re.search(pattern, text, re.IGNORECASE | re.MULTILINE)
-            if match:
-                # Se o padrão tem um grupo de captura (parênteses), retorna o grupo.
-                # Senão, retorna a correspondência inteira.
-                return match.group(1) if match.groups() else match.group(0)
-
-        return None
+        return matcher.find(text)
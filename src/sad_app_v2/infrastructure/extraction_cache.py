@@ -0,0 +1,217 @@
+"""
+Cache em disco do texto extraído de documentos, endereçado pelo conteúdo.
+
+A chave de cada entrada combina o hash do conteúdo do arquivo com uma
+variante informada pelo extrator (versão do extrator, perfil e modo de
+extração). Um arquivo alterado gera outra chave e nunca recebe texto antigo;
+um arquivo apenas renomeado ou copiado (como após a resolução RIR) continua
+encontrando o seu texto. O hash de cada arquivo é memorizado por caminho,
+tamanho e mtime, para que o conteúdo seja lido uma única vez por sessão.
+
+O cache tem tamanho limitado: ao passar do limite, as entradas usadas há
+mais tempo são removidas (LRU, pela data de modificação das entradas).
+"""
+
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Dict, NamedTuple, Optional, Tuple
+
+from .optimization import atomic_write_bytes, hash_file
+
+# Incrementar sempre que o formato das entradas mudar
+CACHE_FORMAT_VERSION = 1
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+_ENTRY_SUFFIX = ".txt"
+
+# Limite de hashes memorizados; ao ser atingido a memória é descartada
+_MAX_MEMORIZED_DIGESTS = 100_000
+
+# (caminho absoluto, tamanho, mtime_ns)
+FileSignature = Tuple[str, int, int]
+
+
+class CacheStats(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    size_bytes: int
+
+
+class ExtractionCache:
+    """
+    Cache de texto extraído com chave por conteúdo, limite de tamanho (LRU),
+    gravação atômica e contadores de acertos e falhas.
+
+    Com `content_addressed=False` a chave usa apenas caminho, tamanho e
+    mtime, sem ler o arquivo; um arquivo renomeado deixa então de ser
+    encontrado.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path = Path(".cache/extraction"),
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        content_addressed: bool = True,
+    ):
+        self._cache_dir = Path(cache_dir)
+        self._max_bytes = max_bytes
+        self._content_addressed = content_addressed
+        self._lock = threading.Lock()
+        # Nome da entrada -> tamanho, da usada há mais tempo para a mais recente
+        self._index: Optional["OrderedDict[str, int]"] = None
+        self._size_bytes = 0
+        self._digests: Dict[FileSignature, str] = {}
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    # --- API pública ---
+
+    def get_or_extract(
+        self, file_path: Path, variant: str, extract: Callable[[], str]
+    ) -> str:
+        """
+        Retorna o texto em cache ou o extrai com `extract` e o grava. Erros
+        da extração são propagados e nada é gravado.
+        """
+        key = self.key_for(file_path, variant)
+        text = self._read(key)
+        if text is not None:
+            return text
+        text = extract()
+        self._write(key, text)
+        return text
+
+    def lookup(self, file_path: Path, variant: str) -> Optional[str]:
+        """Texto em cache para o arquivo, ou None (contado como falha)."""
+        return self._read(self.key_for(file_path, variant))
+
+    def store(self, file_path: Path, variant: str, text: str) -> None:
+        """Grava o texto extraído de um arquivo."""
+        self._write(self.key_for(file_path, variant), text)
+
+    def key_for(self, file_path: Path, variant: str) -> str:
+        """Chave da entrada: conteúdo (ou assinatura) do arquivo + variante."""
+        stat = os.stat(file_path)
+        signature = (os.path.abspath(file_path), stat.st_size, stat.st_mtime_ns)
+        if self._content_addressed:
+            identity = self._digest(Path(file_path), signature)
+        else:
+            identity = "|".join(str(part) for part in signature)
+        material = f"{CACHE_FORMAT_VERSION}|{variant}|{identity}"
+        return hashlib.blake2b(material.encode("utf-8"), digest_size=20).hexdigest()
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            index = self._load_index()
+            return CacheStats(
+                self._hits,
+                self._misses,
+                self._evictions,
+                len(index),
+                self._size_bytes,
+            )
+
+    def clear(self) -> None:
+        """Remove todas as entradas e zera os contadores."""
+        with self._lock:
+            for name in self._load_index():
+                try:
+                    (self._cache_dir / name).unlink()
+                except OSError:
+                    pass
+            self._index = OrderedDict()
+            self._size_bytes = 0
+            self._digests.clear()
+            self._hits = self._misses = self._evictions = 0
+
+    # --- Implementação ---
+
+    def _digest(self, file_path: Path, signature: FileSignature) -> str:
+        with self._lock:
+            digest = self._digests.get(signature)
+        if digest is None:
+            digest = hash_file(file_path, digest_size=20)
+            with self._lock:
+                if len(self._digests) >= _MAX_MEMORIZED_DIGESTS:
+                    self._digests.clear()
+                self._digests[signature] = digest
+        return digest
+
+    def _read(self, key: str) -> Optional[str]:
+        name = key + _ENTRY_SUFFIX
+        entry_path = self._cache_dir / name
+        try:
+            data = entry_path.read_bytes()
+            text = data.decode("utf-8")
+        except (OSError, UnicodeDecodeError):
+            with self._lock:
+                self._misses += 1
+            return None
+
+        try:
+            os.utime(entry_path)  # A data de modificação marca o último uso
+        except OSError:
+            pass
+        with self._lock:
+            self._hits += 1
+            index = self._load_index()
+            if name in index:
+                index.move_to_end(name)
+            else:
+                # Gravada por outro processo desde a carga do índice
+                index[name] = len(data)
+                self._size_bytes += len(data)
+        return text
+
+    def _write(self, key: str, text: str) -> None:
+        name = key + _ENTRY_SUFFIX
+        data = text.encode("utf-8")
+        try:
+            atomic_write_bytes(self._cache_dir / name, data)
+        except OSError:
+            return  # Sem cache, a próxima chamada apenas extrai de novo
+        with self._lock:
+            index = self._load_index()
+            self._size_bytes += len(data) - index.pop(name, 0)
+            index[name] = len(data)
+            self._evict(index)
+
+    def _evict(self, index: "OrderedDict[str, int]") -> None:
+        """Remove as entradas usadas há mais tempo até caber no limite."""
+        while self._size_bytes > self._max_bytes and index:
+            name, size = index.popitem(last=False)
+            self._size_bytes -= size
+            self._evictions += 1
+            try:
+                (self._cache_dir / name).unlink()
+            except OSError:
+                pass
+
+    def _load_index(self) -> "OrderedDict[str, int]":
+        """Lista as entradas existentes uma vez, ordenadas pelo último uso."""
+        if self._index is None:
+            entries = []
+            try:
+                with os.scandir(self._cache_dir) as it:
+                    for entry in it:
+                        if not entry.name.endswith(_ENTRY_SUFFIX):
+                            continue
+                        try:
+                            stat = entry.stat()
+                        except OSError:
+                            continue
+                        entries.append((stat.st_mtime_ns, entry.name, stat.st_size))
+            except OSError:
+                pass
+            entries.sort()
+            self._index = OrderedDict((name, size) for _, name, size in entries)
+            self._size_bytes = sum(size for _, _, size in entries)
+            self._evict(self._index)
+        return self._index
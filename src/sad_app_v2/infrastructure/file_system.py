@@ -1,6 +1,21 @@
+import errno
+import os
+import queue
 import shutil  # Usaremos shutil para operações de arquivo mais robustas
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List
+from typing import (
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    TypeVar,
+)
 
 from ..core.domain import DocumentFile
 from ..core.interfaces import (
@@ -10,50 +25,303 @@ from ..core.interfaces import (
     SourceDirectoryNotFoundError,
 )
 
+T = TypeVar("T")
+
+# Pastas lidas em paralelo por padrão: o mesmo padrão do ThreadPoolExecutor
+# (núcleos + 4, limitado a 32), adequado a trabalho de E/S
+DEFAULT_MAX_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+
+
+def parallel_walk(
+    root: str,
+    visit: Callable[[str, threading.Event], Tuple[Optional[T], List[str]]],
+    max_workers: int,
+) -> Iterator[T]:
+    """
+    Percorre uma árvore de pastas em paralelo com um pool de threads limitado.
+
+    `visit` recebe o caminho de uma pasta e um evento de parada, e devolve o
+    resultado daquela pasta (ou None) junto com as subpastas a visitar. Os
+    resultados são produzidos na ordem em que as pastas terminam.
+    """
+    results: "queue.Queue[Tuple[Optional[T], List[str]]]" = queue.Queue()
+    stop = threading.Event()
+    executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="scan")
+
+    def on_done(future) -> None:
+        if future.cancelled():
+            return
+        try:
+            results.put(future.result())
+        except Exception:
+            # Nunca deixa a thread consumidora esperando por uma pasta
+            results.put((None, []))
+
+    def submit(path: str) -> None:
+        executor.submit(visit, path, stop).add_done_callback(on_done)
+
+    try:
+        # A contagem de pastas pendentes fica só nesta thread
+        pending = 1
+        submit(root)
+        while pending:
+            result, subdirs = results.get()
+            pending -= 1
+            for subdir in subdirs:
+                pending += 1
+                submit(subdir)
+            if result is not None:
+                yield result
+    finally:
+        # Se o consumidor parar antes do fim, descarta o trabalho restante
+        stop.set()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _scan_entries(
+    path: str, stop: threading.Event, on_file: Callable[[os.DirEntry], None]
+) -> List[str]:
+    """
+    Lê uma única pasta com os.scandir, entregando cada arquivo a `on_file` e
+    devolvendo as subpastas.
+
+    Usa os dados de tipo e tamanho já trazidos pelo DirEntry (no Windows
+    o stat vem da própria listagem, sem chamadas extras ao sistema).
+    """
+    subdirs: List[str] = []
+    if stop.is_set():
+        return subdirs
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                try:
+                    # Como o rglob, não segue links simbólicos para pastas
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                    elif entry.is_file():
+                        on_file(entry)
+                except OSError:
+                    # Entrada removida ou inacessível durante a varredura
+                    continue
+    except OSError:
+        # Pasta sem permissão de leitura ou removida: ignora, como o rglob
+        pass
+    return subdirs
+
+
+def _scan_directory(
+    path: str, stop: threading.Event
+) -> Tuple[List[DocumentFile], List[str]]:
+    """Lê uma pasta, devolvendo seus arquivos como DocumentFile."""
+    files: List[DocumentFile] = []
+
+    def collect(entry: os.DirEntry) -> None:
+        files.append(
+            DocumentFile(path=Path(entry.path), size_bytes=entry.stat().st_size)
+        )
+
+    subdirs = _scan_entries(path, stop, collect)
+    return files, subdirs
+
+
+def _scan_directory_columns(
+    path: str, stop: threading.Event
+) -> Tuple[Tuple[List[str], List[int]], List[str]]:
+    """Como _scan_directory, mas devolve caminhos e tamanhos em colunas."""
+    paths: List[str] = []
+    sizes: List[int] = []
+
+    def collect(entry: os.DirEntry) -> None:
+        sizes.append(entry.stat().st_size)
+        paths.append(entry.path)
+
+    subdirs = _scan_entries(path, stop, collect)
+    return (paths, sizes), subdirs
+
 
 class FileSystemFileRepository(IFileRepository):
     """Implementação concreta que lista arquivos de um diretório no disco."""
 
+    def __init__(self, max_workers: Optional[int] = None):
+        """
+        Args:
+            max_workers: Número máximo de pastas lidas em paralelo. Por padrão
+                segue o ThreadPoolExecutor (núcleos + 4, limitado a 32).
+        """
+        self._max_workers = max_workers or DEFAULT_MAX_WORKERS
+
     def list_files(self, directory: Path) -> List[DocumentFile]:
+        """
+        Lista os arquivos ordenados pelo caminho. As pastas terminam em ordem
+        variável na varredura paralela; sem a ordenação, a mesma árvore daria
+        listas diferentes (e lotes diferentes no balanceamento).
+        """
+        files = list(self.iter_files(directory))
+        files.sort(key=lambda file: file.path)
+        return files
+
+    def iter_files(self, directory: Path) -> Iterator[DocumentFile]:
+        """
+        Varre o diretório recursivamente, lendo subpastas em paralelo e
+        produzindo os DocumentFile à medida que são encontrados (na ordem em
+        que as pastas terminam; use list_files para uma ordem estável).
+        """
         if not directory.is_dir():
             raise SourceDirectoryNotFoundError(f"Diretório não encontrado: {directory}")
 
-        found_files: List[DocumentFile] = []
+        for files in parallel_walk(str(directory), _scan_directory, self._max_workers):
+            yield from files
 
-        # .rglob('*') busca recursivamente por todos os arquivos
-        for path in directory.rglob("*"):
-            if path.is_file():
-                found_files.append(
-                    DocumentFile(path=path, size_bytes=path.stat().st_size)
-                )
-        return found_files
+    def list_file_columns(self, directory: Path) -> Tuple[List[str], List[int]]:
+        """
+        Varre o diretório como list_files, mas devolve colunas de caminhos e
+        tamanhos (ordenadas pelo caminho), sem criar um DocumentFile por
+        arquivo. Usado com ValidateBatchUseCase.execute_batch.
+        """
+        if not directory.is_dir():
+            raise SourceDirectoryNotFoundError(f"Diretório não encontrado: {directory}")
+
+        all_paths: List[str] = []
+        all_sizes: List[int] = []
+        for paths, sizes in parallel_walk(
+            str(directory), _scan_directory_columns, self._max_workers
+        ):
+            all_paths.extend(paths)
+            all_sizes.extend(sizes)
+        # Ordem estável pelo caminho, como em list_files
+        order = sorted(range(len(all_paths)), key=all_paths.__getitem__)
+        return [all_paths[i] for i in order], [all_sizes[i] for i in order]
 
 
 # --- NOVA CLASSE ABAIXO ---
 
 
+def _list_file_sizes(directory: Path, names: Set[str]) -> Dict[str, int]:
+    """
+    Lista uma pasta uma única vez e devolve o tamanho dos arquivos procurados.
+    Pasta ausente ou inacessível equivale a nenhum arquivo encontrado.
+    """
+    sizes: Dict[str, int] = {}
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.name not in names:
+                    continue
+                try:
+                    if entry.is_file():
+                        sizes[entry.name] = entry.stat().st_size
+                except OSError:
+                    continue
+    except OSError:
+        pass
+    return sizes
+
+
+# Tamanho dos blocos da cópia entre dispositivos
+_COPY_CHUNK_SIZE = 1024 * 1024
+
+
+def _copy_across_devices(source: Path, destination: Path) -> None:
+    """
+    Move um arquivo entre dispositivos: copia em blocos para um arquivo
+    temporário ao lado do destino, força a gravação em disco (fsync), preserva
+    os metadados como o copy2, troca o temporário pelo destino e só então
+    remove a origem.
+    """
+    temp_path = destination.with_name(f".{destination.name}.parcial")
+    try:
+        with open(source, "rb") as src, open(temp_path, "wb") as dst:
+            while chunk := src.read(_COPY_CHUNK_SIZE):
+                dst.write(chunk)
+            dst.flush()
+            os.fsync(dst.fileno())
+        shutil.copystat(source, temp_path)
+        os.replace(temp_path, destination)
+    except BaseException:
+        try:
+            temp_path.unlink()
+        except OSError:
+            pass
+        raise
+    os.unlink(source)
+
+
 class SafeFileSystemManager(IFileSystemManager):
     """
     Implementação concreta para operações físicas de arquivo, com tratamento
     de erros robusto.
+
+    A movimentação guarda as pastas de destino já criadas e o dispositivo de
+    cada pasta, para que mover um arquivo dentro do mesmo volume custe um
+    único rename. Entre volumes, o arquivo é copiado em blocos, gravado em
+    disco e só então removido da origem.
     """
 
+    def __init__(self, max_workers: Optional[int] = None):
+        """
+        Args:
+            max_workers: Número máximo de pastas listadas em paralelo por
+                stat_files. Por padrão segue o ThreadPoolExecutor.
+        """
+        self._max_workers = max_workers or DEFAULT_MAX_WORKERS
+        # Atualizados sem lock: inserções em set/dict são atômicas e, no pior
+        # caso, uma corrida só repete um mkdir ou um stat
+        self._created_dirs: Set[Path] = set()
+        self._devices: Dict[Path, int] = {}
+
     def create_directory(self, path: Path) -> None:
         try:
             path.mkdir(parents=True, exist_ok=True)
         except (OSError, PermissionError) as e:
             raise FileSystemOperationError(f"Falha ao criar diretório {path}: {e}")
+        self._created_dirs.add(path)
 
     def move_file(self, source: Path, destination: Path) -> None:
         try:
-            # Garante que o diretório de destino exista
-            destination.parent.mkdir(parents=True, exist_ok=True)
-            shutil.move(str(source), str(destination))
+            try:
+                self._move(source, destination)
+            except FileNotFoundError:
+                # A pasta de destino pode ter sido removida depois de entrar
+                # no cache: esquece-a e tenta uma única vez mais
+                if not source.exists() or destination.parent.exists():
+                    raise
+                self._created_dirs.discard(destination.parent)
+                self._devices.pop(destination.parent, None)
+                self._move(source, destination)
         except (FileNotFoundError, shutil.Error, OSError, PermissionError) as e:
             raise FileSystemOperationError(
                 f"Falha ao mover {source} para {destination}: {e}"
             )
 
+    def _move(self, source: Path, destination: Path) -> None:
+        # Garante que o diretório de destino exista (uma vez por pasta)
+        target_dir = destination.parent
+        if target_dir not in self._created_dirs:
+            target_dir.mkdir(parents=True, exist_ok=True)
+            self._created_dirs.add(target_dir)
+
+        if self._device_of(source.parent) == self._device_of(target_dir):
+            try:
+                # os.replace sobrescreve o destino, como o shutil.move
+                os.replace(source, destination)
+                return
+            except OSError as e:
+                # Montagens diferentes no mesmo dispositivo recusam o rename
+                if e.errno != errno.EXDEV:
+                    raise
+        if source.is_dir():
+            # Pastas continuam com o shutil, que sabe movê-las entre volumes
+            shutil.move(str(source), str(destination))
+        else:
+            _copy_across_devices(source, destination)
+
+    def _device_of(self, directory: Path) -> int:
+        device = self._devices.get(directory)
+        if device is None:
+            device = os.stat(directory).st_dev
+            self._devices[directory] = device
+        return device
+
     def copy_file(self, source: Path, destination: Path) -> None:
         try:
             # Garante que o diretório de destino exista
@@ -64,3 +332,43 @@ class SafeFileSystemManager(IFileSystemManager):
             raise FileSystemOperationError(
                 f"Falha ao copiar {source} para {destination}: {e}"
             )
+
+    def stat_files(self, paths: Sequence[Path]) -> Dict[Path, Optional[int]]:
+        """
+        Em vez de um stat por arquivo (uma ida e volta por arquivo em
+        compartilhamentos de rede), lista cada pasta de origem uma única vez,
+        em paralelo entre pastas, e confere os nomes em memória.
+
+        Um nome não encontrado na listagem ainda é conferido individualmente,
+        pois em sistemas de arquivos que ignoram maiúsculas e minúsculas o
+        caminho pode diferir da grafia listada.
+        """
+        names_by_dir: Dict[Path, Set[str]] = {}
+        for path in paths:
+            names_by_dir.setdefault(path.parent, set()).add(path.name)
+
+        directories = list(names_by_dir)
+        workers = min(self._max_workers, len(directories))
+        if workers <= 1:
+            listings = [_list_file_sizes(d, names_by_dir[d]) for d in directories]
+        else:
+            with ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="stat-files"
+            ) as executor:
+                listings = list(
+                    executor.map(
+                        lambda d: _list_file_sizes(d, names_by_dir[d]), directories
+                    )
+                )
+        sizes_by_dir = dict(zip(directories, listings))
+
+        result: Dict[Path, Optional[int]] = {}
+        for path in paths:
+            size = sizes_by_dir[path.parent].get(path.name)
+            if size is None:
+                try:
+                    size = path.stat().st_size if path.is_file() else None
+                except OSError:
+                    size = None
+            result[path] = size
+        return result
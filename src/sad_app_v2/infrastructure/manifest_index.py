@@ -0,0 +1,192 @@
+"""
+Índice compilado do manifesto persistido em disco.
+
+Evita reprocessar o XLSX a cada validação: os itens lidos são gravados em um
+arquivo auxiliar (sidecar) identificado pelo caminho do manifesto e validado
+por tamanho, data de modificação e hash do conteúdo.
+"""
+
+import hashlib
+import pickle
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from ..core.domain import ManifestItem
+from ..core.interfaces import IManifestRepository
+from .optimization import atomic_write_bytes, hash_file
+
+# Incrementar sempre que o formato do índice mudar
+INDEX_FORMAT_VERSION = 1
+
+
+class CachedManifestRepository(IManifestRepository):
+    """
+    Decorador de IManifestRepository que mantém um índice compilado em disco.
+
+    Uma leitura com o mesmo tamanho e mtime é atendida sem tocar no XLSX.
+    Se apenas o mtime mudou, o hash do conteúdo decide se o índice continua
+    válido. Caso contrário o manifesto é lido pelo repositório interno e o
+    índice é regravado.
+    """
+
+    def __init__(
+        self, inner: IManifestRepository, index_dir: Path = Path(".cache/manifest")
+    ):
+        self._inner = inner
+        self._index_dir = Path(index_dir)
+        self._lock = threading.Lock()
+        # Última carga em memória, para chamadas repetidas no mesmo processo
+        self._memory: Dict[str, Tuple[Tuple[int, int], List[ManifestItem]]] = {}
+
+    # --- API pública ---
+
+    def load_from_file(self, file_path: Path) -> List[ManifestItem]:
+        return list(self.iter_items(file_path))
+
+    def iter_items(self, file_path: Path) -> Iterator[ManifestItem]:
+        file_path = Path(file_path)
+        cached = self._lookup(file_path)
+        if cached is not None:
+            yield from cached
+            return
+
+        # A assinatura é tomada antes da leitura: se o manifesto for salvo
+        # enquanto é lido, os itens antigos não podem ficar sob a nova
+        signature = self._signature(file_path)
+
+        # Lê em streaming do repositório interno e grava o índice ao final
+        items: List[ManifestItem] = []
+        for item in self._inner.iter_items(file_path):
+            items.append(item)
+            yield item
+        self._store(file_path, items, signature)
+
+    def invalidate(self, file_path: Path) -> None:
+        """Descarta o índice de um manifesto específico."""
+        file_path = Path(file_path)
+        with self._lock:
+            self._memory.pop(self._key(file_path), None)
+            try:
+                self._index_path(file_path).unlink()
+            except FileNotFoundError:
+                pass
+
+    def clear(self) -> None:
+        """Descarta todos os índices conhecidos."""
+        with self._lock:
+            self._memory.clear()
+            if self._index_dir.is_dir():
+                for index_file in self._index_dir.glob("*.idx"):
+                    try:
+                        index_file.unlink()
+                    except OSError:
+                        pass
+
+    # --- Implementação ---
+
+    @staticmethod
+    def _key(file_path: Path) -> str:
+        return str(file_path.resolve())
+
+    def _index_path(self, file_path: Path) -> Path:
+        name = hashlib.sha1(self._key(file_path).encode("utf-8")).hexdigest()
+        return self._index_dir / f"{name}.idx"
+
+    def _lookup(self, file_path: Path) -> Optional[List[ManifestItem]]:
+        """Retorna os itens do índice se ele ainda for válido."""
+        try:
+            stat = file_path.stat()
+        except OSError:
+            # Deixa o repositório interno reportar o erro
+            return None
+        signature = (stat.st_size, stat.st_mtime_ns)
+        key = self._key(file_path)
+
+        with self._lock:
+            memory = self._memory.get(key)
+            if memory is not None and memory[0] == signature:
+                return memory[1]
+
+            payload = self._read_index(file_path)
+            if payload is None or payload["path"] != key:
+                return None
+
+            if (payload["size"], payload["mtime_ns"]) != signature:
+                # Arquivo tocado: só reaproveita se o conteúdo for o mesmo
+                if payload["size"] != stat.st_size:
+                    return None
+                if hash_file(file_path, digest_size=20) != payload["content_hash"]:
+                    return None
+                payload["mtime_ns"] = stat.st_mtime_ns
+                self._write_index(file_path, payload)
+
+            items = [
+                ManifestItem(code, revision, title, metadata)
+                for code, revision, title, metadata in payload["items"]
+            ]
+            self._memory = {key: (signature, items)}
+            return items
+
+    @staticmethod
+    def _signature(file_path: Path) -> Optional[Tuple[int, int, str]]:
+        """Tamanho, mtime e hash do conteúdo, ou None se o arquivo sumiu."""
+        try:
+            stat = file_path.stat()
+            content_hash = hash_file(file_path, digest_size=20)
+        except OSError:
+            return None
+        return stat.st_size, stat.st_mtime_ns, content_hash
+
+    def _store(
+        self,
+        file_path: Path,
+        items: List[ManifestItem],
+        signature: Optional[Tuple[int, int, str]],
+    ) -> None:
+        if signature is None:
+            return
+        size, mtime_ns, content_hash = signature
+        try:
+            stat = file_path.stat()
+        except OSError:
+            return
+        if (stat.st_size, stat.st_mtime_ns) != (size, mtime_ns):
+            # O manifesto mudou durante a leitura: os itens podem estar
+            # desatualizados, então não são indexados
+            return
+
+        payload = {
+            "version": INDEX_FORMAT_VERSION,
+            "path": self._key(file_path),
+            "size": size,
+            "mtime_ns": mtime_ns,
+            "content_hash": content_hash,
+            "items": [
+                (item.document_code, item.revision, item.title, item.metadata)
+                for item in items
+            ],
+        }
+        with self._lock:
+            self._write_index(file_path, payload)
+            self._memory = {payload["path"]: ((size, mtime_ns), items)}
+
+    def _read_index(self, file_path: Path) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self._index_path(file_path), "rb") as f:
+                payload = pickle.load(f)
+        except Exception:
+            # Índice ausente ou corrompido equivale a não ter índice
+            return None
+        if not isinstance(payload, dict):
+            return None
+        if payload.get("version") != INDEX_FORMAT_VERSION:
+            return None
+        return payload
+
+    def _write_index(self, file_path: Path, payload: Dict[str, Any]) -> None:
+        data = pickle.dumps(payload, protocol=pickle.HIGHEST_PROTOCOL)
+        try:
+            atomic_write_bytes(self._index_path(file_path), data)
+        except OSError:
+            pass  # Sem índice, a próxima leitura apenas volta ao XLSX
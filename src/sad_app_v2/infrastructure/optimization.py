@@ -2,12 +2,16 @@
 Utilitários para melhorar o carregamento e a performance da aplicação
 """
 import functools
+import hashlib
 import os
 import threading
 import time
 from pathlib import Path
 from typing import Any, Callable, Dict, Optional
 
+# Tamanho dos blocos lidos por hash_file
+HASH_CHUNK_SIZE = 1024 * 1024
+
 
 def lazy_load(func: Callable) -> Callable:
     """
@@ -39,8 +43,6 @@ def cache_to_disk(cache_dir: str = ".cache") -> Callable:
         def wrapper(*args, **kwargs):
             # Cria hash baseado nos argumentos para servir como chave de cache
             args_str = str(args) + str(kwargs)
-            import hashlib
-
             key = hashlib.md5(args_str.encode()).hexdigest()
 
             # Verifica se diretório de cache existe
@@ -73,6 +75,44 @@ def cache_to_disk(cache_dir: str = ".cache") -> Callable:
     return decorator
 
 
+def atomic_write_bytes(path: Path, data: bytes) -> None:
+    """
+    Grava um arquivo de forma atômica: escreve em um temporário na mesma
+    pasta e o substitui de uma vez, para que leitores nunca vejam conteúdo
+    parcial.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+        raise
+
+
+def hash_file(
+    path: Path, algorithm: str = "blake2b", digest_size: Optional[int] = None
+) -> str:
+    """
+    Calcula o hash (hexadecimal) do conteúdo de um arquivo lendo-o em blocos
+    reaproveitados, com memória constante. `digest_size` só é repassado ao
+    hashlib quando informado (algoritmos de tamanho variável, como blake2b).
+    """
+    options = {} if digest_size is None else {"digest_size": digest_size}
+    hasher = hashlib.new(algorithm, **options)
+    buffer = bytearray(HASH_CHUNK_SIZE)
+    view = memoryview(buffer)
+    with open(path, "rb") as f:
+        while size := f.readinto(buffer):
+            hasher.update(view[:size])
+    return hasher.hexdigest()
+
+
 def prefetch_in_background(resource_func: Callable, *args, **kwargs) -> None:
     """
     Pré-carrega um recurso em segundo plano para uso futuro.
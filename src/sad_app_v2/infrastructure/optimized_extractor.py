@@ -1,11 +1,13 @@
 """
 Implementação da classe OptimizedExtractorService
 """
+
 import time
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
-from .optimization import cache_to_disk
+from ..core.domain import DocumentFile
+from .extraction_cache import ExtractionCache
 
 
 class OptimizedExtractorService:
@@ -14,34 +16,42 @@ class OptimizedExtractorService:
     Wrapper em torno do serviço de extração original com suporte a cache.
     """
 
-    def __init__(self, config_path: Path):
+    def __init__(self, config_path: Path, cache: Optional[ExtractionCache] = None):
         """
         Inicializa o serviço de extração otimizado.
 
         Args:
             config_path: Caminho para o arquivo de configuração YAML com os padrões
+            cache: Cache de texto extraído (padrão: .cache/extraction)
         """
         # Importação preguiçosa para melhorar tempo de inicialização
         from .extraction import ProfiledExtractorService
 
-        self._extractor = ProfiledExtractorService(config_path)
+        self.cache = cache or ExtractionCache()
+        self._extractor = ProfiledExtractorService(config_path, cache=self.cache)
 
-    @cache_to_disk(cache_dir=".cache/extraction")
     def extract_from_file(
         self, file_path: Path, profile: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Extrai dados de um arquivo com suporte a cache.
 
+        O texto é reaproveitado do cache enquanto o conteúdo do arquivo não
+        mudar; o código é sempre procurado de novo, pois a busca é barata e
+        depende dos padrões atuais do perfil.
+
         Args:
             file_path: Caminho do arquivo
             profile: Perfil de extração a ser usado
 
         Returns:
-            Dados extraídos do arquivo
+            Dados extraídos do arquivo ("text" e "code")
         """
         start_time = time.time()
-        result = self._extractor.extract_from_file(file_path, profile)
+        file = DocumentFile(path=file_path, size_bytes=file_path.stat().st_size)
+        profile_id = profile or ""
+        text = self._extractor.extract_text(file, profile_id)
+        result = {"text": text, "code": self._extractor.find_code(text, profile_id)}
         elapsed = time.time() - start_time
         # Se a extração for lenta, log isso para debug
         if elapsed > 1.0:
@@ -0,0 +1,117 @@
+"""
+Extração de texto em um pool de processos.
+
+O PyPDF2 é Python puro e segura o GIL durante todo o parsing, então threads
+não aceleram a extração. Este backend distribui os arquivos entre processos
+(um por núcleo, por padrão). O pool é criado na primeira chamada e mantido
+entre os lotes de resolução, de modo que os workers já estão iniciados e com
+as bibliotecas importadas quando o próximo lote começa.
+"""
+
+import os
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, Optional
+
+from ..core.domain import DocumentFile, ExtractionResult
+from .extraction import read_document_text, read_document_text_for_code
+
+
+def _ready() -> bool:
+    """Tarefa vazia usada para iniciar os workers antecipadamente."""
+    return True
+
+
+class ProcessPoolTextExtractor:
+    """
+    Backend de extração que lê PDF/DOCX em processos separados, reaproveitando
+    os mesmos workers entre lotes até que close() seja chamado.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None):
+        self._max_workers = max_workers or os.cpu_count() or 1
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def warm_up(self) -> None:
+        """
+        Inicia todos os workers sem esperar por eles, para que a primeira
+        resolução não pague a criação dos processos.
+        """
+        executor = self._get_executor()
+        for _ in range(self._max_workers):
+            executor.submit(_ready)
+
+    def extract_text(self, path: Path) -> str:
+        """Extrai o texto de um arquivo em um worker, aguardando o resultado."""
+        return self._submit(read_document_text, str(path)).result()
+
+    def extract_text_for_code(
+        self,
+        path: Path,
+        confident_pattern: Optional[str] = None,
+        max_pages: Optional[int] = None,
+    ) -> str:
+        """Leitura com parada antecipada (read_document_text_for_code) no pool."""
+        return self._submit(
+            read_document_text_for_code, str(path), confident_pattern, max_pages
+        ).result()
+
+    def extract_batch(
+        self, files: Iterable[DocumentFile]
+    ) -> Iterator[ExtractionResult]:
+        """
+        Distribui os arquivos entre os workers e entrega cada resultado assim
+        que fica pronto. Um erro de leitura vira um ExtractionResult com a
+        mensagem, sem interromper os demais arquivos.
+        """
+        futures: Dict[Future, DocumentFile] = {
+            self._submit(read_document_text, str(file.path)): file for file in files
+        }
+        for future in as_completed(futures):
+            file = futures[future]
+            try:
+                yield ExtractionResult(file, text=future.result())
+            except Exception as e:
+                yield ExtractionResult(
+                    file, error=f"Falha ao ler o conteúdo de {file.path.name}: {e}"
+                )
+
+    def close(self) -> None:
+        """Encerra os workers, descartando as extrações ainda não iniciadas."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def __enter__(self) -> "ProcessPoolTextExtractor":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    # --- Implementação ---
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(max_workers=self._max_workers)
+            return self._executor
+
+    def _submit(self, func: Callable[..., str], *args) -> Future:
+        executor = self._get_executor()
+        try:
+            return executor.submit(func, *args)
+        except BrokenProcessPool:
+            # Um worker morreu (ex.: PDF que derruba o parser); o pool inteiro
+            # fica inutilizável, então é recriado uma vez
+            self._discard(executor)
+            return self._get_executor().submit(func, *args)
+
+    def _discard(self, executor: ProcessPoolExecutor) -> None:
+        with self._lock:
+            if self._executor is executor:
+                self._executor = None
+        executor.shutdown(wait=False, cancel_futures=True)
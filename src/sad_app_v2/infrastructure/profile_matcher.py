@@ -0,0 +1,146 @@
+"""
+Padrões de extração pré-compilados por perfil.
+
+Os padrões de cada perfil do patterns.yaml são compilados uma única vez, no
+carregamento, em vez de a cada chamada de find_code. O carregamento também
+valida os padrões: os inválidos são descartados e os lentos são reportados.
+"""
+
+import re
+import time
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+# Mesmas flags usadas historicamente pelo find_code
+PATTERN_FLAGS = re.IGNORECASE | re.MULTILINE
+
+# Regras de escolha da correspondência (chave "match" do perfil)
+MATCH_RULES = ("first", "longest")
+
+# Padrão que leva mais que isto em um texto de sonda é reportado como lento
+SLOW_PATTERN_SECONDS = 0.05
+
+# Tamanhos crescentes do texto de sonda. O crescimento é gradual no início
+# para que um padrão exponencial passe do limite antes de travar a validação.
+_PROBE_SIZES = (8, 12, 16, 20, 24, 32, 64, 256, 1024)
+
+
+class PatternIssue(NamedTuple):
+    """Problema encontrado em um padrão durante o carregamento."""
+
+    profile_id: str
+    pattern: str
+    problem: str
+
+
+def _probe_text(size: int) -> str:
+    """
+    Texto sem nenhum código válido, com sequências longas de caracteres que
+    os padrões de código aceitam: o cenário típico de retrocesso excessivo.
+    """
+    return (
+        f"Relatório: Código: {'A' * size}!\n"
+        f"{'A1_.-' * (size // 5 + 1)} {'A_' * (size // 2 + 1)}!"
+    )
+
+
+def _probe_seconds(pattern: "re.Pattern[str]") -> float:
+    """Maior tempo de busca nos textos de sonda, parando ao passar do limite."""
+    elapsed = 0.0
+    for size in _PROBE_SIZES:
+        text = _probe_text(size)
+        start = time.perf_counter()
+        pattern.search(text)
+        elapsed = time.perf_counter() - start
+        if elapsed > SLOW_PATTERN_SECONDS:
+            break
+    return elapsed
+
+
+class ProfileMatcher:
+    """
+    Padrões de um perfil, compilados uma única vez.
+
+    find() preserva a regra do find_code: vale o primeiro padrão da lista que
+    casar em qualquer ponto do texto, e dele o primeiro grupo de captura (ou
+    a correspondência inteira, se não houver grupo). Com longest=True (regra
+    "longest" do perfil), dentre as correspondências desse padrão no texto
+    vale a mais longa.
+
+    Os padrões são buscados um a um, em ordem de prioridade. Uni-los em uma
+    única alternância com grupos nomeados foi medido e descartado: no `re` do
+    CPython a alternância perde a busca rápida pelo prefixo literal de cada
+    padrão ("Relatório:", "Código:") e fica mais lenta que as buscas
+    separadas, mesmo percorrendo o texto uma única vez.
+    """
+
+    def __init__(self, patterns: Sequence[str], longest: bool = False):
+        self.patterns: List[str] = list(patterns)
+        self.longest = longest
+        self._compiled = [re.compile(p, PATTERN_FLAGS) for p in self.patterns]
+
+    @property
+    def primary_pattern(self) -> Optional[str]:
+        """Padrão de maior prioridade, cuja correspondência é considerada certa."""
+        return self.patterns[0] if self.patterns else None
+
+    def find(self, text: str) -> Optional[str]:
+        """Encontra o código no texto, respeitando a prioridade dos padrões."""
+        if not text:
+            return None
+        for pattern in self._compiled:
+            # Se o padrão tem um grupo de captura (parênteses), usa o grupo.
+            # Senão, usa a correspondência inteira.
+            group = 1 if pattern.groups else 0
+            if not self.longest:
+                match = pattern.search(text)
+                if match:
+                    return match.group(group)
+                continue
+            found = None
+            for match in pattern.finditer(text):
+                value = match.group(group)
+                if found is None or len(value) > len(found):
+                    found = value
+            if found is not None:
+                return found
+        return None
+
+
+def compile_profiles(
+    profiles: Dict[str, dict],
+) -> Tuple[Dict[str, ProfileMatcher], List[PatternIssue]]:
+    """
+    Compila os padrões de todos os perfis, validando cada um. Padrões
+    inválidos são descartados; padrões lentos são mantidos, mas reportados.
+    """
+    matchers: Dict[str, ProfileMatcher] = {}
+    issues: List[PatternIssue] = []
+    for profile_id, profile in profiles.items():
+        profile = profile or {}
+        rule = profile.get("match", "first")
+        if rule not in MATCH_RULES:
+            issues.append(
+                PatternIssue(
+                    profile_id, f"match: {rule}", "regra desconhecida; usando 'first'"
+                )
+            )
+            rule = "first"
+        valid: List[str] = []
+        for pattern in profile.get("patterns", []) or []:
+            try:
+                compiled = re.compile(pattern, PATTERN_FLAGS)
+            except (re.error, TypeError) as e:
+                issues.append(PatternIssue(profile_id, str(pattern), f"inválido: {e}"))
+                continue
+            elapsed = _probe_seconds(compiled)
+            if elapsed > SLOW_PATTERN_SECONDS:
+                issues.append(
+                    PatternIssue(
+                        profile_id,
+                        pattern,
+                        f"lento: {elapsed * 1000:.0f} ms em texto de sonda",
+                    )
+                )
+            valid.append(pattern)
+        matchers[profile_id] = ProfileMatcher(valid, longest=rule == "longest")
+    return matchers, issues
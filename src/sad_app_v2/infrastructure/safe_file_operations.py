@@ -2,10 +2,97 @@
 Correções críticas para problemas de renomeação e interface
 """
 
+import hashlib
+import json
 import os
 import shutil
+import time
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .optimization import atomic_write_bytes, hash_file
+
+# Tamanho dos blocos lidos na cópia e na verificação (memória constante)
+_CHUNK_SIZE = 1024 * 1024
+
+# Algoritmo padrão da verificação: BLAKE2b é mais rápido que MD5 em CPUs de 64 bits
+DEFAULT_HASH_ALGORITHM = "blake2b"
+
+# Pasta dos journals de renomeação em lote; um journal remanescente indica um
+# lote interrompido, que é desfeito por recover_pending_batches
+DEFAULT_JOURNAL_DIR = Path(".cache/rename_journal")
+
+# Incrementar sempre que o formato do journal mudar
+JOURNAL_FORMAT_VERSION = 1
+
+
+def _copy_with_hash(source_path: Path, target_path: Path, algorithm: str) -> str:
+    """
+    Copia o arquivo em blocos calculando o hash dos bytes lidos na mesma
+    passada, de modo que a origem é lida uma única vez. A cópia é gravada em
+    disco (fsync) e recebe os metadados da origem, como no shutil.copy2.
+
+    Returns:
+        str: Hash (hexadecimal) do conteúdo da origem
+    """
+    hasher = hashlib.new(algorithm)
+    buffer = bytearray(_CHUNK_SIZE)
+    view = memoryview(buffer)
+    with open(source_path, "rb") as src, open(target_path, "wb") as dst:
+        while size := src.readinto(buffer):
+            chunk = view[:size]
+            hasher.update(chunk)
+            dst.write(chunk)
+        dst.flush()
+        os.fsync(dst.fileno())
+    shutil.copystat(source_path, target_path)
+    return hasher.hexdigest()
+
+
+def _list_directory_names(directory: Path) -> Optional[Dict[str, bool]]:
+    """
+    Lista uma pasta uma única vez, retornando {nome normalizado: é arquivo}.
+    Os nomes passam por os.path.normcase para que, no Windows, conflitos que
+    diferem só em maiúsculas/minúsculas sejam detectados. Retorna None se a
+    pasta não existir.
+    """
+    try:
+        with os.scandir(directory) as entries:
+            return {os.path.normcase(entry.name): entry.is_file() for entry in entries}
+    except FileNotFoundError:
+        return None
+
+
+def _unique_name_in_listing(target_path: Path, occupied: Dict[str, bool]) -> Path:
+    """
+    Mesma regra de _generate_unique_filename, mas consultando a listagem em
+    memória em vez de um exists() por tentativa.
+    """
+    if os.path.normcase(target_path.name) not in occupied:
+        return target_path
+
+    stem = target_path.stem
+    suffix = target_path.suffix
+    for counter in range(1, 1001):
+        new_name = f"{stem}_{counter:03d}{suffix}"
+        if os.path.normcase(new_name) not in occupied:
+            return target_path.with_name(new_name)
+
+    return target_path.with_name(f"{stem}_{int(time.time())}{suffix}")
+
+
+def _undo_renames(renames: Iterable[Tuple[Path, Path]]) -> List[str]:
+    """
+    Desfaz renomeações (origem, destino) em ordem inversa, devolvendo cada
+    arquivo à origem. Retorna as falhas encontradas (vazio se tudo voltou).
+    """
+    failures = []
+    for source_path, target_path in reversed(list(renames)):
+        try:
+            os.rename(target_path, source_path)
+        except OSError as e:
+            failures.append(f"{target_path} -> {source_path}: {e}")
+    return failures
 
 
 class SafeFileRenamer:
@@ -155,14 +242,183 @@ class SafeFileRenamer:
             )
             raise OSError(error_msg) from e
 
+    @staticmethod
+    def safe_rename_batch(
+        renames: Iterable[Tuple[Path, Path]],
+        journal_dir: Path = DEFAULT_JOURNAL_DIR,
+    ) -> List[Path]:
+        """
+        Renomeia N arquivos como uma transação: ou todos são renomeados, ou
+        nenhum.
+
+        Todos os pares são validados antes de qualquer renomeação, contra uma
+        única listagem por pasta envolvida (em vez de várias chamadas
+        exists/stat/access por arquivo). Conflitos de destino, inclusive entre
+        pares do próprio lote, recebem nomes únicos como em safe_rename_file.
+        O plano é gravado em um journal antes da execução; se uma renomeação
+        falhar, as já feitas são desfeitas em ordem inversa. O journal só é
+        removido quando o disco volta a um estado consistente, de modo que um
+        lote interrompido (queda de energia, processo encerrado) pode ser
+        desfeito depois por recover_pending_batches.
+
+        Args:
+            renames: Pares (origem, destino desejado)
+            journal_dir: Pasta onde o journal do lote é gravado
+
+        Returns:
+            List[Path]: Caminho final de cada arquivo, na ordem dos pares
+
+        Raises:
+            FileNotFoundError: Se alguma origem não existe
+            ValueError: Se alguma origem não é um arquivo ou aparece repetida
+            PermissionError: Se não há permissão de escrita em alguma pasta
+            OSError: Se uma renomeação falhar (o lote é desfeito)
+        """
+        pairs = [(Path(source), Path(target)) for source, target in renames]
+        if not pairs:
+            return []
+
+        # 1. Validação de todas as origens, com uma listagem por pasta
+        listings: Dict[Path, Optional[Dict[str, bool]]] = {}
+
+        def listing(directory: Path) -> Optional[Dict[str, bool]]:
+            if directory not in listings:
+                listings[directory] = _list_directory_names(directory)
+            return listings[directory]
+
+        seen_sources = set()
+        for source_path, _ in pairs:
+            entries = listing(source_path.parent)
+            key = os.path.normcase(source_path.name)
+            if entries is None or key not in entries:
+                raise FileNotFoundError(f"Arquivo origem não encontrado: {source_path}")
+            if not entries[key]:
+                raise ValueError(f"Origem não é um arquivo: {source_path}")
+            if source_path in seen_sources:
+                raise ValueError(f"Arquivo origem repetido no lote: {source_path}")
+            seen_sources.add(source_path)
+
+        # 2. Destinos únicos, reservados na listagem em memória
+        planned: List[Tuple[Path, Path]] = []
+        for source_path, target_path in pairs:
+            if source_path == target_path:
+                planned.append((source_path, target_path))
+                continue
+            occupied = listing(target_path.parent)
+            if occupied is None:
+                target_path.parent.mkdir(parents=True, exist_ok=True)
+                occupied = listings[target_path.parent] = {}
+            unique_target_path = _unique_name_in_listing(target_path, occupied)
+            if unique_target_path != target_path:
+                print(
+                    f"⚠️ Arquivo destino já existe, usando nome único: "
+                    f"{unique_target_path.name}"
+                )
+            occupied[os.path.normcase(unique_target_path.name)] = True
+            planned.append((source_path, unique_target_path))
+
+        # Permissões verificadas uma vez por pasta
+        for directory in listings:
+            if not os.access(directory, os.W_OK):
+                raise PermissionError(f"Sem permissão para escrever em: {directory}")
+
+        # 3. Journal gravado antes de tocar em qualquer arquivo
+        pending = [(source, target) for source, target in planned if source != target]
+        journal_path = None
+        if pending:
+            journal_path = journal_dir / f"lote_{time.time_ns()}_{os.getpid()}.json"
+            payload = {
+                "version": JOURNAL_FORMAT_VERSION,
+                "renames": [[str(source), str(target)] for source, target in pending],
+            }
+            atomic_write_bytes(journal_path, json.dumps(payload).encode("utf-8"))
+
+        # 4. Execução, com rollback de tudo que já foi feito em caso de falha
+        done: List[Tuple[Path, Path]] = []
+        try:
+            for source_path, target_path in pending:
+                os.rename(source_path, target_path)
+                done.append((source_path, target_path))
+        except OSError as e:
+            failures = _undo_renames(done)
+            if failures:
+                raise OSError(
+                    f"Falha na renomeação em lote: {e}\n"
+                    f"ERRO CRÍTICO: não foi possível desfazer {len(failures)} "
+                    f"renomeação(ões); journal mantido em {journal_path}:\n"
+                    + "\n".join(failures)
+                ) from e
+            journal_path.unlink(missing_ok=True)
+            raise OSError(
+                f"Falha na renomeação em lote: {e}\n"
+                f"{len(done)} renomeação(ões) desfeita(s); nenhum arquivo alterado."
+            ) from e
+
+        if journal_path is not None:
+            # Marca o lote como concluído antes de remover o journal: se o
+            # processo morrer entre as duas etapas, a recuperação não desfaz
+            # um lote que terminou com sucesso
+            payload["committed"] = True
+            atomic_write_bytes(journal_path, json.dumps(payload).encode("utf-8"))
+            journal_path.unlink(missing_ok=True)
+        return [target for _, target in planned]
+
+    @staticmethod
+    def recover_pending_batches(journal_dir: Path = DEFAULT_JOURNAL_DIR) -> int:
+        """
+        Desfaz lotes de renomeação interrompidos, cujos journals ficaram na
+        pasta. Cada arquivo que está no destino e cuja origem está livre volta
+        para a origem; o journal é removido quando não resta nada a desfazer.
+        Journals marcados como concluídos (o processo morreu depois da última
+        renomeação) são apenas removidos.
+
+        Returns:
+            int: Quantidade de arquivos devolvidos à origem
+        """
+        try:
+            journals = sorted(journal_dir.glob("lote_*.json"))
+        except OSError:
+            return 0
+
+        restored = 0
+        for journal_path in journals:
+            try:
+                payload = json.loads(journal_path.read_bytes())
+            except (OSError, ValueError):
+                continue
+            if payload.get("version") != JOURNAL_FORMAT_VERSION:
+                continue
+            if payload.get("committed"):
+                journal_path.unlink(missing_ok=True)
+                continue
+            applied = [
+                (Path(source), Path(target))
+                for source, target in payload["renames"]
+                if os.path.lexists(target) and not os.path.lexists(source)
+            ]
+            failures = _undo_renames(applied)
+            restored += len(applied) - len(failures)
+            if not failures:
+                journal_path.unlink(missing_ok=True)
+        return restored
+
     @staticmethod
     def safe_copy_then_delete(
-        source_path: Path, target_path: Path
+        source_path: Path,
+        target_path: Path,
+        algorithm: str = DEFAULT_HASH_ALGORITHM,
     ) -> tuple[bool, Path]:
         """
         Alternativa mais segura: copia arquivo e depois deleta original
         Mais lento mas mais seguro para arquivos críticos
 
+        O hash da origem é calculado durante a própria cópia (a origem é lida
+        uma única vez) e comparado com o hash da cópia relida do disco, para
+        arquivos de qualquer tamanho e com memória constante.
+
+        Args:
+            algorithm: Algoritmo do hashlib usado na verificação
+
         Returns:
             tuple[bool, Path]: (True se sucesso, caminho final do arquivo)
         """
@@ -181,19 +437,11 @@ class SafeFileRenamer:
 
         # Backup do estado original
         original_size = source_path.stat().st_size
-        original_hash = None
-
-        # Para arquivos pequenos, calcular hash para verificação
-        if original_size < 50 * 1024 * 1024:  # 50MB
-            import hashlib
-
-            with open(source_path, "rb") as f:
-                original_hash = hashlib.md5(f.read()).hexdigest()
 
         try:
-            # 1. Copiar arquivo
+            # 1. Copiar arquivo, calculando o hash da origem na mesma leitura
             unique_target_path.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(source_path, unique_target_path)
+            original_hash = _copy_with_hash(source_path, unique_target_path, algorithm)
 
             # 2. Verificar cópia
             if not unique_target_path.exists():
@@ -205,12 +453,10 @@ class SafeFileRenamer:
                     f"Tamanho incorreto após cópia: {original_size} -> {new_size}"
                 )
 
-            # Verificar hash se calculado
-            if original_hash:
-                with open(unique_target_path, "rb") as f:
-                    new_hash = hashlib.md5(f.read()).hexdigest()
-                if new_hash != original_hash:
-                    raise OSError("Hash não confere - arquivo corrompido na cópia")
+            # Verificar hash da cópia
+            new_hash = hash_file(unique_target_path, algorithm)
+            if new_hash != original_hash:
+                raise OSError("Hash não confere - arquivo corrompido na cópia")
 
             # 3. Deletar original apenas após verificação completa
             source_path.unlink()
@@ -0,0 +1,212 @@
+"""
+Varredura incremental do diretório de origem com snapshot persistido.
+
+Cada varredura grava, por pasta, o mtime da pasta e o tamanho, mtime e inode
+de cada arquivo. Na varredura seguinte só as pastas cujo mtime mudou são
+listadas de novo; as demais reaproveitam o snapshot e custam um único stat.
+"""
+
+import hashlib
+import os
+import pickle
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from ..core.domain import DocumentFile, ScanDiff
+from ..core.interfaces import IIncrementalFileRepository, SourceDirectoryNotFoundError
+from .file_system import FileSystemFileRepository, parallel_walk
+from .optimization import atomic_write_bytes
+
+# Incrementar sempre que o formato do snapshot mudar
+SNAPSHOT_FORMAT_VERSION = 1
+
+# Pastas modificadas muito perto do momento da varredura não são confiáveis:
+# uma alteração no mesmo "tique" do relógio do sistema de arquivos (2s no FAT)
+# não mudaria o mtime. Essas pastas são sempre relistadas.
+_MTIME_GRANULARITY_NS = 2 * 10**9
+
+# (tamanho, mtime_ns, inode)
+FileSignature = Tuple[int, int, int]
+
+
+class _DirRecord(NamedTuple):
+    mtime_ns: int
+    files: Dict[str, FileSignature]
+    subdirs: List[str]
+
+
+class _Snapshot(NamedTuple):
+    scanned_at_ns: int
+    dirs: Dict[str, _DirRecord]
+
+
+class _Visited(NamedTuple):
+    path: str
+    record: _DirRecord
+    relisted: bool
+
+
+def _list_directory(path: str, mtime_ns: int) -> _DirRecord:
+    """Lista uma pasta com os.scandir, registrando a assinatura dos arquivos."""
+    files: Dict[str, FileSignature] = {}
+    subdirs: List[str] = []
+    with os.scandir(path) as entries:
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.name)
+                elif entry.is_file():
+                    stat = entry.stat()
+                    files[entry.name] = (stat.st_size, stat.st_mtime_ns, entry.inode())
+            except OSError:
+                continue
+    return _DirRecord(mtime_ns, files, subdirs)
+
+
+class IncrementalFileRepository(FileSystemFileRepository, IIncrementalFileRepository):
+    """
+    Repositório de arquivos que mantém um snapshot da última varredura e
+    consegue reportar apenas o que foi adicionado, removido ou modificado.
+
+    Como só pastas com mtime alterado são relistadas, um arquivo reescrito no
+    lugar (sem criar, remover ou renomear entradas) não é detectado até que
+    sua pasta mude ou o snapshot seja invalidado.
+    """
+
+    def __init__(
+        self,
+        snapshot_dir: Path = Path(".cache/scan"),
+        max_workers: Optional[int] = None,
+    ):
+        super().__init__(max_workers=max_workers)
+        self._snapshot_dir = Path(snapshot_dir)
+        self._lock = threading.Lock()
+
+    def list_files(self, directory: Path) -> List[DocumentFile]:
+        """Varredura completa, que também renova o snapshot."""
+        diff = self._scan(directory, previous=None)
+        return diff.added
+
+    def scan_changes(self, directory: Path) -> ScanDiff:
+        """
+        Compara o diretório com o último snapshot. Sem snapshot, todos os
+        arquivos aparecem como adicionados.
+        """
+        return self._scan(directory, previous=self._load(directory))
+
+    def invalidate(self, directory: Path) -> None:
+        """Descarta o snapshot de um diretório, forçando varredura completa."""
+        try:
+            self._snapshot_path(directory).unlink()
+        except FileNotFoundError:
+            pass
+
+    # --- Implementação ---
+
+    def _scan(self, directory: Path, previous: Optional[_Snapshot]) -> ScanDiff:
+        if not directory.is_dir():
+            raise SourceDirectoryNotFoundError(f"Diretório não encontrado: {directory}")
+
+        scanned_at_ns = time.time_ns()
+        old_dirs = previous.dirs if previous else {}
+        # Pastas alteradas perto da varredura anterior precisam ser relistadas
+        trusted_before = (
+            previous.scanned_at_ns - _MTIME_GRANULARITY_NS if previous else 0
+        )
+
+        def visit(
+            path: str, stop: threading.Event
+        ) -> Tuple[Optional[_Visited], List[str]]:
+            if stop.is_set():
+                return None, []
+            try:
+                mtime_ns = os.stat(path).st_mtime_ns
+                old = old_dirs.get(path)
+                if old and old.mtime_ns == mtime_ns and mtime_ns < trusted_before:
+                    record, relisted = old, False
+                else:
+                    record, relisted = _list_directory(path, mtime_ns), True
+            except OSError:
+                # Pasta removida ou inacessível: seus arquivos contam como removidos
+                return None, []
+            subdirs = [os.path.join(path, name) for name in record.subdirs]
+            return _Visited(path, record, relisted), subdirs
+
+        diff = ScanDiff()
+        new_dirs: Dict[str, _DirRecord] = {}
+        for visited in parallel_walk(str(directory), visit, self._max_workers):
+            new_dirs[visited.path] = visited.record
+            if not visited.relisted:
+                continue
+
+            old = old_dirs.get(visited.path)
+            old_files = old.files if old else {}
+            for name, signature in visited.record.files.items():
+                previous_signature = old_files.get(name)
+                if previous_signature == signature:
+                    continue
+                file = DocumentFile(
+                    path=Path(visited.path, name), size_bytes=signature[0]
+                )
+                if previous_signature is None:
+                    diff.added.append(file)
+                else:
+                    diff.modified.append(file)
+            diff.removed.extend(
+                Path(visited.path, name)
+                for name in old_files
+                if name not in visited.record.files
+            )
+
+        # Pastas que deixaram de existir levam todos os seus arquivos
+        for path, old in old_dirs.items():
+            if path not in new_dirs:
+                diff.removed.extend(Path(path, name) for name in old.files)
+
+        # Ordem estável, como em FileSystemFileRepository.list_files
+        diff.added.sort(key=lambda file: file.path)
+        diff.modified.sort(key=lambda file: file.path)
+        diff.removed.sort()
+
+        self._save(directory, _Snapshot(scanned_at_ns, new_dirs))
+        return diff
+
+    def _snapshot_path(self, directory: Path) -> Path:
+        key = str(Path(directory).resolve())
+        name = hashlib.sha1(key.encode("utf-8")).hexdigest()
+        return self._snapshot_dir / f"{name}.snap"
+
+    def _load(self, directory: Path) -> Optional[_Snapshot]:
+        try:
+            with open(self._snapshot_path(directory), "rb") as f:
+                payload = pickle.load(f)
+        except Exception:
+            # Snapshot ausente ou corrompido equivale a não ter snapshot
+            return None
+        if not isinstance(payload, dict):
+            return None
+        if payload.get("version") != SNAPSHOT_FORMAT_VERSION:
+            return None
+        if payload.get("root") != str(directory):
+            return None
+        dirs = {
+            path: _DirRecord(mtime_ns, files, subdirs)
+            for path, (mtime_ns, files, subdirs) in payload["dirs"].items()
+        }
+        return _Snapshot(payload["scanned_at_ns"], dirs)
+
+    def _save(self, directory: Path, snapshot: _Snapshot) -> None:
+        payload = {
+            "version": SNAPSHOT_FORMAT_VERSION,
+            "root": str(directory),
+            "scanned_at_ns": snapshot.scanned_at_ns,
+            "dirs": {path: tuple(record) for path, record in snapshot.dirs.items()},
+        }
+        data = pickle.dumps(payload, protocol=pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            try:
+                atomic_write_bytes(self._snapshot_path(directory), data)
+            except OSError:
+                pass  # Sem snapshot, a próxima varredura apenas será completa
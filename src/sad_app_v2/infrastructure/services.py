@@ -1,12 +1,17 @@
-﻿import math
-from typing import List
+﻿import bisect
+import heapq
+import math
+from typing import List, Optional, Tuple
 
 from ..core.domain import DocumentGroup, OutputLot
 from ..core.interfaces import ILotBalancerService
 
 
 class GreedyLotBalancerService(ILotBalancerService):
-    """Implementa o algoritmo 'guloso' para balancear lotes."""
+    """
+    Implementa o algoritmo 'guloso' (LPT: maior grupo primeiro, no lote mais
+    leve) para balancear lotes, em O(n log k) para n grupos e k lotes.
+    """
 
     def balance_lots(
         self, groups: List[DocumentGroup], max_docs_per_lot: int
@@ -15,11 +20,8 @@ class GreedyLotBalancerService(ILotBalancerService):
             return []
 
         # 1. Ordena os grupos de documentos do maior para o menor
-        # Usamos uma função anônima (lambda) para especificar que a chave
-        # de ordenação é o tamanho total de cada grupo.
-        sorted_groups = sorted(
-            groups, key=lambda g: sum(f.size_bytes for f in g.files), reverse=True
-        )
+        # A chave de ordenação é o tamanho total de cada grupo (já contado).
+        sorted_groups = sorted(groups, key=lambda g: g.total_size_bytes, reverse=True)
 
         # 2. Determina o número de lotes necessários
         # O limite é por 'documento' (que é um DocumentGroup), não por arquivo.
@@ -33,13 +35,141 @@ class GreedyLotBalancerService(ILotBalancerService):
             OutputLot(lot_name=f"Lote_{i + 1}") for i in range(num_lots)
         ]
 
-        # 4. Distribui os grupos para o lote atualmente mais leve
+        # 4. Distribui os grupos para o lote atualmente mais leve.
+        # Um heap de (tamanho, índice) entrega o lote mais leve em O(log k);
+        # em caso de empate vence o menor índice, como no min() linear.
+        heap: List[Tuple[int, int]] = [(0, i) for i in range(num_lots)]
+        for group in sorted_groups:
+            lightest_size, lightest_index = heap[0]
+
+            # Adiciona o grupo ao lote mais leve, atualizando seus contadores
+            group_size = group.total_size_bytes
+            lots[lightest_index].add_group(group)
+            heapq.heapreplace(heap, (lightest_size + group_size, lightest_index))
+
+        return lots
+
+
+class CapacityAwareLotBalancerService(ILotBalancerService):
+    """
+    Balanceador que respeita um limite de documentos por lote e, opcionalmente,
+    um limite de bytes por lote, usando empacotamento com grupos em ordem
+    decrescente de tamanho.
+
+    Estratégias:
+    - "balanced" (padrão): parte do número mínimo de lotes exigido pelos
+      limites e coloca cada grupo no lote mais leve que ainda tem espaço
+      (worst-fit decreasing), mantendo os lotes equilibrados como o
+      GreedyLotBalancerService. Se nenhum lote couber, abre um novo.
+    - "best_fit": coloca cada grupo no lote com menos espaço livre que ainda
+      o comporte (best-fit decreasing), minimizando o número de lotes.
+
+    Um grupo maior que o limite de bytes não pode ser dividido: ele ocupa um
+    lote sozinho.
+    """
+
+    STRATEGIES = ("balanced", "best_fit")
+
+    def __init__(
+        self, max_bytes_per_lot: Optional[int] = None, strategy: str = "balanced"
+    ):
+        if strategy not in self.STRATEGIES:
+            raise ValueError(f"Estratégia de balanceamento desconhecida: {strategy}")
+        if max_bytes_per_lot is not None and max_bytes_per_lot <= 0:
+            max_bytes_per_lot = None
+        self._max_bytes = max_bytes_per_lot
+        self._strategy = strategy
+
+    def balance_lots(
+        self, groups: List[DocumentGroup], max_docs_per_lot: int
+    ) -> List[OutputLot]:
+        if not groups:
+            return []
+
+        # 1. Ordena os grupos do maior para o menor
+        sorted_groups = sorted(groups, key=lambda g: g.total_size_bytes, reverse=True)
+
+        # 2. Limite de documentos (<= 0 significa sem limite)
+        if max_docs_per_lot <= 0:
+            max_docs_per_lot = len(sorted_groups)
+
+        if self._strategy == "best_fit":
+            return self._best_fit(sorted_groups, max_docs_per_lot)
+        return self._balanced(sorted_groups, max_docs_per_lot)
+
+    def _fits(self, lot_size: int, group_size: int) -> bool:
+        return self._max_bytes is None or lot_size + group_size <= self._max_bytes
+
+    def _balanced(
+        self, sorted_groups: List[DocumentGroup], max_docs: int
+    ) -> List[OutputLot]:
+        # Grupos maiores que o limite de bytes (o prefixo da lista ordenada)
+        # ocupam um lote sozinhos e ficam fora da conta dos demais lotes
+        oversized = 0
+        while oversized < len(sorted_groups) and not self._fits(
+            0, sorted_groups[oversized].total_size_bytes
+        ):
+            oversized += 1
+        lots: List[OutputLot] = []
+        for group in sorted_groups[:oversized]:
+            lots.append(OutputLot(lot_name=f"Lote_{len(lots) + 1}"))
+            lots[-1].add_group(group)
+        regular_groups = sorted_groups[oversized:]
+
+        # Limite inferior de lotes imposto pelos dois limites
+        num_lots = math.ceil(len(regular_groups) / max_docs)
+        if self._max_bytes is not None:
+            total_bytes = sum(g.total_size_bytes for g in regular_groups)
+            num_lots = max(num_lots, math.ceil(total_bytes / self._max_bytes))
+
+        lots.extend(
+            OutputLot(lot_name=f"Lote_{oversized + i + 1}") for i in range(num_lots)
+        )
+        # Heap só com lotes que ainda aceitam documentos. O mais leve é também
+        # o que tem mais bytes livres: se ele não comporta o grupo, nenhum
+        # outro comporta.
+        heap: List[Tuple[int, int]] = [(0, oversized + i) for i in range(num_lots)]
+
+        for group in regular_groups:
+            group_size = group.total_size_bytes
+            if heap and self._fits(heap[0][0], group_size):
+                lot_size, index = heapq.heappop(heap)
+            else:
+                lot_size, index = 0, len(lots)
+                lots.append(OutputLot(lot_name=f"Lote_{index + 1}"))
+
+            lots[index].add_group(group)
+            if lots[index].document_count < max_docs:
+                heapq.heappush(heap, (lot_size + group_size, index))
+
+        # Salvaguarda: nenhum lote pré-criado pode sair vazio (ex.: grupos de
+        # zero bytes empilhados no mesmo lote); a numeração é refeita
+        if any(not lot.groups for lot in lots):
+            lots = [lot for lot in lots if lot.groups]
+            for number, lot in enumerate(lots, start=1):
+                lot.lot_name = f"Lote_{number}"
+        return lots
+
+    def _best_fit(
+        self, sorted_groups: List[DocumentGroup], max_docs: int
+    ) -> List[OutputLot]:
+        lots: List[OutputLot] = []
+        # Lotes abertos ordenados por bytes livres: (livre, índice)
+        open_lots: List[Tuple[float, int]] = []
+        capacity = math.inf if self._max_bytes is None else self._max_bytes
+
         for group in sorted_groups:
-            # Encontra o lote com o menor tamanho total em bytes
-            lightest_lot = min(lots, key=lambda lot: lot.total_size_bytes)
+            group_size = group.total_size_bytes
+            # Primeiro lote com espaço livre suficiente = o mais justo
+            position = bisect.bisect_left(open_lots, (group_size, -1))
+            if position < len(open_lots):
+                free, index = open_lots.pop(position)
+            else:
+                free, index = capacity, len(lots)
+                lots.append(OutputLot(lot_name=f"Lote_{index + 1}"))
 
-            # Adiciona o grupo ao lote mais leve
-            lightest_lot.groups.append(group)
-            # O tamanho total é calculado automaticamente pela propriedade
+            lots[index].add_group(group)
+            if lots[index].document_count < max_docs:
+                bisect.insort(open_lots, (max(free - group_size, 0), index))
 
         return lots
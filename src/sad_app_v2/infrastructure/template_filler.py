@@ -1,10 +1,25 @@
 # src/sad_app_v2/infrastructure/template_filler.py
 
+import io
+import threading
+from copy import copy
 from pathlib import Path
-from typing import List
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    TypeVar,
+)
 
 import openpyxl
-from openpyxl.styles import Alignment, Border, Font, PatternFill, Side
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Alignment, Border, Font, NamedStyle, PatternFill, Side
 
 from ..core.domain import DocumentGroup
 from ..core.interfaces import (
@@ -46,60 +61,61 @@ def _get_filename_with_revision(original_filename: str, revision: str) -> str:
             return f"{original_filename}_{revision}"
 
 
-def _apply_header_formatting(sheet, header_row: int, num_columns: int):
-    """Aplica formatação ao cabeçalho da planilha."""
-    # Estilo do cabeçalho - fundo amarelo, texto em negrito
-    header_fill = PatternFill(
-        start_color="FFFF00", end_color="FFFF00", fill_type="solid"
-    )
-    header_font = Font(bold=True, size=11)
-    header_alignment = Alignment(
-        horizontal="center", vertical="center", wrap_text=False
-    )
+T = TypeVar("T")
 
-    # Borda para todas as células
-    thin_border = Border(
-        left=Side(style="thin"),
-        right=Side(style="thin"),
-        top=Side(style="thin"),
-        bottom=Side(style="thin"),
-    )
+# Total de colunas do manifesto de lote
+_NUM_COLUMNS = 9
 
-    # Aplicar formatação ao cabeçalho - FORÇA aplicação célula por célula
-    for col in range(1, num_columns + 1):
-        cell = sheet.cell(row=header_row, column=col)
-        # Limpar formatação existente primeiro
-        cell.fill = PatternFill()  # Limpa
-        cell.font = Font()  # Limpa
-        cell.alignment = Alignment()  # Limpa
-        cell.border = Border()  # Limpa
-
-        # Aplicar nova formatação
-        cell.fill = header_fill
-        cell.font = header_font
-        cell.alignment = header_alignment
-        cell.border = thin_border
-
-
-def _apply_data_formatting(sheet, start_row: int, end_row: int, num_columns: int):
-    """Aplica formatação às linhas de dados."""
-    # Alinhamento padrão para dados
-    data_alignment = Alignment(horizontal="left", vertical="center")
-
-    # Borda para todas as células
-    thin_border = Border(
-        left=Side(style="thin"),
-        right=Side(style="thin"),
-        top=Side(style="thin"),
-        bottom=Side(style="thin"),
-    )
+# Nomes dos estilos registrados na pasta de trabalho
+HEADER_STYLE_NAME = "SAD Cabeçalho"
+DATA_STYLE_NAME = "SAD Dados"
 
-    # Aplicar formatação aos dados
-    for row in range(start_row, end_row + 1):
-        for col in range(1, num_columns + 1):
-            cell = sheet.cell(row=row, column=col)
-            cell.alignment = data_alignment
-            cell.border = thin_border
+# Objetos de estilo compartilhados: criados uma única vez, e não a cada célula
+_THIN_SIDE = Side(style="thin")
+_THIN_BORDER = Border(
+    left=_THIN_SIDE, right=_THIN_SIDE, top=_THIN_SIDE, bottom=_THIN_SIDE
+)
+_HEADER_FILL = PatternFill(start_color="FFFF00", end_color="FFFF00", fill_type="solid")
+_HEADER_FONT = Font(bold=True, size=11)
+_HEADER_ALIGNMENT = Alignment(horizontal="center", vertical="center", wrap_text=False)
+_DATA_ALIGNMENT = Alignment(horizontal="left", vertical="center")
+
+
+def _register_named_styles(workbook, body_font: Font) -> None:
+    """
+    Registra, uma vez por pasta de trabalho, os estilos nomeados do cabeçalho
+    (fundo amarelo, negrito) e dos dados (alinhado à esquerda). Cada célula
+    passa a apontar para um estilo já indexado, em vez de registrar fonte,
+    borda e alinhamento próprios.
+    """
+    if HEADER_STYLE_NAME not in workbook.named_styles:
+        workbook.add_named_style(
+            NamedStyle(
+                name=HEADER_STYLE_NAME,
+                font=copy(_HEADER_FONT),
+                fill=copy(_HEADER_FILL),
+                alignment=copy(_HEADER_ALIGNMENT),
+                border=copy(_THIN_BORDER),
+            )
+        )
+    if DATA_STYLE_NAME not in workbook.named_styles:
+        workbook.add_named_style(
+            NamedStyle(
+                name=DATA_STYLE_NAME,
+                font=copy(body_font),
+                alignment=copy(_DATA_ALIGNMENT),
+                border=copy(_THIN_BORDER),
+            )
+        )
+
+
+def _apply_style_to_range(sheet, style_name: str, start_row: int, end_row: int):
+    """Aplica um estilo nomeado a todas as células de um intervalo de linhas."""
+    for row in sheet.iter_rows(
+        min_row=start_row, max_row=end_row, max_col=_NUM_COLUMNS
+    ):
+        for cell in row:
+            cell.style = style_name
 
 
 def _adjust_column_widths(sheet):
@@ -116,20 +132,122 @@ def _adjust_column_widths(sheet):
         "I": 20,  # CAMINHO DATABOOK
     }
 
-    # Forçar aplicação das larguras explicitamente
     for column, width in column_widths.items():
-        dimension = sheet.column_dimensions[column]
-        dimension.width = width
-        # Garantir que a largura foi aplicada
-        if dimension.width != width:
-            dimension.width = width
+        sheet.column_dimensions[column].width = width
+
+
+def _find_insert_row(sheet) -> int:
+    """Linha onde os dados começam: a da marca "FIM" ou, sem ela, a linha 2."""
+    for row_num in range(2, sheet.max_row + 1):
+        cell_value = sheet.cell(row=row_num, column=1).value
+        if cell_value and str(cell_value).upper() == "FIM":
+            return row_num
+    return 2  # Por padrão, inserir na linha 2 (após cabeçalho)
+
+
+def _iter_rows(data: List[DocumentGroup]) -> Iterator[List[Any]]:
+    """Gera os valores de cada linha do manifesto de lote, um por arquivo."""
+    for group in data:
+        # O ManifestItem é o mesmo para todos os arquivos em um grupo
+        manifest_info = group.files[0].associated_manifest_item
+        if not manifest_info:
+            continue  # Pula se por algum motivo não houver info
+
+        # Cria uma linha para cada arquivo físico no grupo
+        for file in group.files:
+            # Construir nome do arquivo com revisão (como ele ficará após ser movido)
+            revision = manifest_info.revision
+            filename_with_revision = _get_filename_with_revision(
+                file.path.name, revision
+            )
+
+            # Ordem correta dos campos conforme template:
+            row_data = [
+                manifest_info.document_code,  # DOCUMENTO
+                manifest_info.revision,  # REVISÃO
+                manifest_info.title,  # TÍTULO
+                filename_with_revision,  # ARQUIVO (nome final com revisão)
+                manifest_info.metadata.get("FORMATO", "A4"),  # FORMATO
+                manifest_info.metadata.get("DISCIPLINA", ""),  # DISCIPLINA
+                manifest_info.metadata.get(
+                    "TIPO DE DOCUMENTO", ""
+                ),  # TIPO DE DOCUMENTO
+                manifest_info.metadata.get("PROPÓSITO", ""),  # PROPÓSITO
+                manifest_info.metadata.get("CAMINHO DATABOOK", ""),  # CAMINHO DATABOOK
+            ]
+            yield row_data
+
+
+def _build_rows(data: List[DocumentGroup]) -> List[List[Any]]:
+    """Monta os valores de todas as linhas do manifesto de lote."""
+    return list(_iter_rows(data))
+
+
+class _TemplateCache(Generic[T]):
+    """
+    Templates já interpretados, por caminho. Uma entrada é refeita quando o
+    tamanho ou o mtime do arquivo mudam.
+    """
+
+    def __init__(self):
+        self._entries: Dict[Path, Tuple[Tuple[int, int], T]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, template_path: Path, build: Callable[[Path], T]) -> T:
+        stat = template_path.stat()
+        signature = (stat.st_size, stat.st_mtime_ns)
+        key = template_path.resolve()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] != signature:
+                entry = (signature, build(template_path))
+                self._entries[key] = entry
+            return entry[1]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class _TemplatePrototype(NamedTuple):
+    """Template já interpretado e preparado, mantido em memória."""
+
+    content: bytes  # Template preparado, serializado como .xlsx
+    insert_row: int  # Posição da linha "FIM" (ou a linha 2, sem ela)
+
+
+def _prepare_template(template_path: Path) -> _TemplatePrototype:
+    """
+    Interpreta o template uma vez: localiza a linha "FIM", registra os estilos
+    nomeados (os dados usam a fonte do corpo do template, a da linha "FIM"),
+    formata cabeçalho e larguras e serializa o resultado em memória.
+    """
+    workbook = openpyxl.load_workbook(template_path)
+    sheet = workbook.active
+    insert_row = _find_insert_row(sheet)
+    _register_named_styles(workbook, sheet.cell(row=insert_row, column=1).font)
+    _adjust_column_widths(sheet)
+    _apply_style_to_range(sheet, HEADER_STYLE_NAME, 1, 1)
+
+    buffer = io.BytesIO()
+    workbook.save(buffer)
+    return _TemplatePrototype(buffer.getvalue(), insert_row)
 
 
 class OpenpyxlTemplateFiller(ITemplateFiller):
-    """Implementação que usa openpyxl para preencher templates Excel."""
+    """
+    Implementação que usa openpyxl para preencher templates Excel.
+
+    Cada template é lido do disco e interpretado uma única vez: a posição da
+    linha "FIM" é localizada, os estilos nomeados são registrados e o
+    cabeçalho e as larguras são formatados. O resultado fica em memória como
+    protótipo, e cada lote parte dele sem copiar nem reler o template do
+    disco. O protótipo é refeito se o tamanho ou o mtime do template mudarem.
+    """
 
     def __init__(self, file_manager: IFileSystemManager):
         self._file_manager = file_manager
+        self._prototypes: _TemplateCache[_TemplatePrototype] = _TemplateCache()
 
     def fill_and_save(
         self, template_path: Path, output_path: Path, data: List[DocumentGroup]
@@ -139,72 +257,32 @@ class OpenpyxlTemplateFiller(ITemplateFiller):
                 f"Arquivo template não encontrado: {template_path}"
             )
 
-        # 1. Copia o template para o local de saída
-        self._file_manager.copy_file(template_path, output_path)
+        # 1. Garante o diretório de saída (o template não é mais copiado)
+        self._file_manager.create_directory(output_path.parent)
 
-        # 2. Abre a cópia e a preenche
+        # 2. Abre o protótipo em memória e o preenche
         try:
-            workbook = openpyxl.load_workbook(output_path)
+            prototype = self._get_prototype(template_path)
+            workbook = openpyxl.load_workbook(io.BytesIO(prototype.content))
             sheet = workbook.active
 
-            # Encontrar onde inserir os dados (após cabeçalho, antes de "FIM")
-            insert_row = 2  # Por padrão, inserir na linha 2 (após cabeçalho)
-
-            # Procurar pela linha "FIM" para inserir antes dela
-            for row_num in range(2, sheet.max_row + 1):
-                cell_value = sheet.cell(row=row_num, column=1).value
-                if cell_value and str(cell_value).upper() == "FIM":
-                    insert_row = row_num
-                    break
+            # Linha onde inserir os dados (após cabeçalho, antes de "FIM")
+            insert_row = prototype.insert_row
 
             # Preparar todos os dados primeiro
-            all_rows_data = []
-            for group in data:
-                # O ManifestItem é o mesmo para todos os arquivos em um grupo
-                manifest_info = group.files[0].associated_manifest_item
-                if not manifest_info:
-                    continue  # Pula se por algum motivo não houver info
-
-                # Cria uma linha para cada arquivo físico no grupo
-                for file in group.files:
-                    # Construir nome do arquivo com revisão (como ele ficará após ser movido)
-                    revision = manifest_info.revision
-                    filename_with_revision = _get_filename_with_revision(
-                        file.path.name, revision
-                    )
-
-                    # Ordem correta dos campos conforme template:
-                    row_data = [
-                        manifest_info.document_code,  # DOCUMENTO
-                        manifest_info.revision,  # REVISÃO
-                        manifest_info.title,  # TÍTULO
-                        filename_with_revision,  # ARQUIVO (nome final com revisão)
-                        manifest_info.metadata.get("FORMATO", "A4"),  # FORMATO
-                        manifest_info.metadata.get("DISCIPLINA", ""),  # DISCIPLINA
-                        manifest_info.metadata.get(
-                            "TIPO DE DOCUMENTO", ""
-                        ),  # TIPO DE DOCUMENTO
-                        manifest_info.metadata.get("PROPÓSITO", ""),  # PROPÓSITO
-                        manifest_info.metadata.get(
-                            "CAMINHO DATABOOK", ""
-                        ),  # CAMINHO DATABOOK
-                    ]
-                    all_rows_data.append(row_data)
-
-            # Inserir todas as linhas necessárias ANTES da linha "FIM"
+            all_rows_data = _build_rows(data)
+
+            # Abrir de uma só vez o espaço para todas as linhas ANTES da linha
+            # "FIM": um único deslocamento do rodapé, em vez de um por linha
             if all_rows_data:
-                # Inserir todas as linhas necessárias antes da linha "FIM"
-                for i in range(len(all_rows_data)):
-                    sheet.insert_rows(insert_row)
+                sheet.insert_rows(insert_row, amount=len(all_rows_data))
 
                 # Agora preencher os dados (FIM foi empurrada para baixo)
-                for i, row_data in enumerate(all_rows_data):
-                    target_row = insert_row + i
-                    # Preencher a linha com os dados
+                for target_row, row_data in enumerate(all_rows_data, insert_row):
                     for col_num, value in enumerate(row_data, 1):
                         sheet.cell(row=target_row, column=col_num, value=value)
 
-            # Aplicar formatação à planilha
+            # Aplicar formatação às linhas de dados
             self._apply_formatting(sheet, insert_row, len(all_rows_data))
 
             workbook.save(output_path)
@@ -212,25 +290,171 @@ class OpenpyxlTemplateFiller(ITemplateFiller):
         except Exception as e:
             raise TemplateFillError(f"Falha ao preencher o template {output_path}: {e}")
 
-    def _apply_formatting(self, sheet, data_start_row: int, num_data_rows: int):
-        """Aplica toda a formatação necessária à planilha."""
-        num_columns = 9  # Total de colunas no template
+    def clear_cache(self) -> None:
+        """Descarta os protótipos em memória."""
+        self._prototypes.clear()
 
-        # 1. SEMPRE ajustar larguras das colunas primeiro
-        _adjust_column_widths(sheet)
+    def _get_prototype(self, template_path: Path) -> _TemplatePrototype:
+        """Devolve o protótipo do template, preparando-o se necessário."""
+        return self._prototypes.get(template_path, _prepare_template)
 
-        # 2. Formatação do cabeçalho (linha 1) - FORÇA aplicação
-        _apply_header_formatting(sheet, 1, num_columns)
+    def _apply_formatting(self, sheet, data_start_row: int, num_data_rows: int):
+        """
+        Formata as linhas de dados e a linha "FIM". Cabeçalho, larguras e
+        estilos nomeados já vêm prontos do protótipo (ver _prepare_template).
+        """
+        fim_row = data_start_row + num_data_rows
+        fim_cell = sheet.cell(row=fim_row, column=1)
 
-        # 3. Formatação dos dados (se houver)
+        # Formatação dos dados (se houver)
         if num_data_rows > 0:
-            data_end_row = data_start_row + num_data_rows - 1
-            _apply_data_formatting(sheet, data_start_row, data_end_row, num_columns)
+            data_end_row = fim_row - 1
+            _apply_style_to_range(sheet, DATA_STYLE_NAME, data_start_row, data_end_row)
 
-        # 4. Formatação da linha "FIM" (se existir)
-        fim_row = data_start_row + num_data_rows
-        if sheet.cell(row=fim_row, column=1).value == "FIM":
-            _apply_data_formatting(sheet, fim_row, fim_row, num_columns)
+        # Linha "FIM" (se existir): mantém seu estilo, com borda e alinhamento
+        if fim_cell.value == "FIM":
+            for col in range(1, _NUM_COLUMNS + 1):
+                cell = sheet.cell(row=fim_row, column=col)
+                cell.alignment = _DATA_ALIGNMENT
+                cell.border = _THIN_BORDER
 
-        # 5. Forçar aplicação das larguras novamente (garantia)
-        _adjust_column_widths(sheet)
+
+class _FrameCell(NamedTuple):
+    """Valor e estilo de uma célula do cabeçalho ou do rodapé do template."""
+
+    value: Any
+    style_name: Optional[str]  # Estilo nomeado; se houver, ignora os demais
+    font: Font
+    fill: PatternFill
+    border: Border
+    alignment: Alignment
+    number_format: str
+
+
+class _TemplateFrame(NamedTuple):
+    """Cabeçalho e rodapé do template, entre os quais as linhas são gravadas."""
+
+    title: str
+    body_font: Font
+    column_widths: Dict[str, float]
+    head: List[List[_FrameCell]]  # Linhas antes da linha "FIM"
+    foot: List[List[_FrameCell]]  # A linha "FIM" e as seguintes
+
+
+def _capture_frame(template_path: Path) -> _TemplateFrame:
+    """
+    Lê o template uma vez e guarda, com os mesmos estilos que o
+    OpenpyxlTemplateFiller aplicaria, as linhas antes e depois da linha "FIM".
+    """
+    workbook = openpyxl.load_workbook(template_path)
+    sheet = workbook.active
+    insert_row = _find_insert_row(sheet)
+    _adjust_column_widths(sheet)
+
+    def capture(row_num: int) -> List[_FrameCell]:
+        row = []
+        for col_num in range(1, sheet.max_column + 1):
+            cell = sheet.cell(row=row_num, column=col_num)
+            style_name = None
+            border, alignment = copy(cell.border), copy(cell.alignment)
+            if col_num <= _NUM_COLUMNS:
+                if row_num == 1:
+                    style_name = HEADER_STYLE_NAME
+                elif row_num == insert_row and sheet.cell(row_num, 1).value == "FIM":
+                    border, alignment = _THIN_BORDER, _DATA_ALIGNMENT
+            row.append(
+                _FrameCell(
+                    cell.value,
+                    style_name,
+                    copy(cell.font),
+                    copy(cell.fill),
+                    border,
+                    alignment,
+                    cell.number_format,
+                )
+            )
+        return row
+
+    return _TemplateFrame(
+        title=sheet.title,
+        body_font=copy(sheet.cell(row=insert_row, column=1).font),
+        column_widths={
+            letter: dimension.width
+            for letter, dimension in sheet.column_dimensions.items()
+            if dimension.width
+        },
+        head=[capture(row_num) for row_num in range(1, insert_row)],
+        foot=[capture(row_num) for row_num in range(insert_row, sheet.max_row + 1)],
+    )
+
+
+class StreamingTemplateFiller(ITemplateFiller):
+    """
+    Alternativa ao OpenpyxlTemplateFiller para lotes muito grandes.
+
+    Grava o manifesto com o modo write-only do openpyxl: as linhas de dados
+    são geradas e descarregadas uma a uma, com memória constante, entre o
+    cabeçalho e o rodapé (a linha "FIM" e as seguintes) copiados do template.
+    Do template são preservados os valores, os estilos das células e as
+    larguras das colunas da planilha ativa; células mescladas, imagens e
+    outras planilhas não são copiadas.
+    """
+
+    def __init__(self, file_manager: IFileSystemManager):
+        self._file_manager = file_manager
+        self._frames: _TemplateCache[_TemplateFrame] = _TemplateCache()
+
+    def fill_and_save(
+        self, template_path: Path, output_path: Path, data: List[DocumentGroup]
+    ) -> None:
+        if not template_path.exists():
+            raise TemplateNotFoundError(
+                f"Arquivo template não encontrado: {template_path}"
+            )
+
+        self._file_manager.create_directory(output_path.parent)
+
+        try:
+            frame = self._frames.get(template_path, _capture_frame)
+            workbook = openpyxl.Workbook(write_only=True)
+            sheet = workbook.create_sheet(frame.title)
+            _register_named_styles(workbook, frame.body_font)
+            for letter, width in frame.column_widths.items():
+                sheet.column_dimensions[letter].width = width
+
+            for frame_row in frame.head:
+                sheet.append([_frame_cell(sheet, cell) for cell in frame_row])
+
+            for row_data in _iter_rows(data):
+                row = []
+                for value in row_data:
+                    cell = WriteOnlyCell(sheet, value)
+                    cell.style = DATA_STYLE_NAME
+                    row.append(cell)
+                sheet.append(row)
+
+            for frame_row in frame.foot:
+                sheet.append([_frame_cell(sheet, cell) for cell in frame_row])
+
+            workbook.save(output_path)
+
+        except Exception as e:
+            raise TemplateFillError(f"Falha ao preencher o template {output_path}: {e}")
+
+    def clear_cache(self) -> None:
+        """Descarta os cabeçalhos e rodapés de template em memória."""
+        self._frames.clear()
+
+
+def _frame_cell(sheet, frame_cell: _FrameCell) -> WriteOnlyCell:
+    """Cria a célula de gravação correspondente a uma célula do template."""
+    cell = WriteOnlyCell(sheet, frame_cell.value)
+    if frame_cell.style_name:
+        cell.style = frame_cell.style_name
+    else:
+        cell.font = frame_cell.font
+        cell.fill = frame_cell.fill
+        cell.border = frame_cell.border
+        cell.alignment = frame_cell.alignment
+        cell.number_format = frame_cell.number_format
+    return cell
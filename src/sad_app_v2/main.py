@@ -3,6 +3,8 @@ Ponto de entrada principal da aplicação SAD App v2.0.
 Configura a injeção de dependências e inicia a aplicação GUI.
 """
 
+import multiprocessing
+
 import customtkinter as ctk
 
 from sad_app_v2.presentation.main_view import MainView
@@ -14,14 +16,22 @@ def main():
     from pathlib import Path
 
     from sad_app_v2.infrastructure.extraction import ProfiledExtractorService
+    from sad_app_v2.infrastructure.extraction_cache import ExtractionCache
+    from sad_app_v2.infrastructure.parallel_extraction import ProcessPoolTextExtractor
 
     # Configurações do CustomTkinter
     ctk.set_appearance_mode("dark")
     ctk.set_default_color_theme("blue")
 
-    # Configuração do serviço de extração completo
+    # Configuração do serviço de extração completo, com a leitura dos
+    # documentos em um pool de processos e o texto já lido guardado em cache
+    # entre sessões. O pool só é criado na primeira resolução RIR e então
+    # mantido até o fim da sessão.
     config_path = Path("config/patterns.yaml")
-    extractor_service = ProfiledExtractorService(config_path)
+    extraction_backend = ProcessPoolTextExtractor()
+    extractor_service = ProfiledExtractorService(
+        config_path, backend=extraction_backend, cache=ExtractionCache()
+    )
 
     # Criação da view principal
     app = MainView()
@@ -36,8 +46,12 @@ def main():
     app.populate_profiles_dropdown([])
 
     # Inicialização da aplicação
-    app.mainloop()
+    try:
+        app.mainloop()
+    finally:
+        extraction_backend.close()
 
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()
     main()
@@ -41,6 +41,9 @@ class MainView(ctk.CTk):
         )
         self.validate_button.configure(command=self.controller.on_validate_batch_click)
         self.resolve_button.configure(command=self.controller.on_resolve_click)
+        self.cancel_resolve_button.configure(
+            command=self.controller.on_cancel_resolve_click
+        )
         self.output_dir_button.configure(
             command=self.controller.select_output_directory
         )
@@ -137,8 +140,12 @@ class MainView(ctk.CTk):
             self.resolve_panel, text="Tentar Resolver Selecionados"
         )
         self.resolve_button.grid(row=0, column=1, padx=10, pady=10)
+        # Habilitado apenas enquanto uma resolução está em andamento
+        self.cancel_resolve_button = ctk.CTkButton(self.resolve_panel, text="Cancelar")
+        self.cancel_resolve_button.grid(row=0, column=2, padx=(0, 10), pady=10)
 
         self.set_resolve_panel_state("disabled")
+        self.set_cancel_resolve_state("disabled")
 
     def _create_organization_tab_layout(self, tab):
         """Cria os widgets para a aba de organização."""
@@ -242,6 +249,10 @@ class MainView(ctk.CTk):
         self.profile_combobox.configure(state=state)
         self.resolve_button.configure(state=state)
 
+    def set_cancel_resolve_state(self, state: str):
+        """Define o estado do botão de cancelar a resolução (normal/disabled)."""
+        self.cancel_resolve_button.configure(state=state)
+
     def populate_profiles_dropdown(self, profiles: List[str]):
         """
         Configura o ComboBox de perfis de resolução.
@@ -0,0 +1,137 @@
+"""
+Agendador da resolução de arquivos em segundo plano.
+
+Em vez de uma thread por arquivo selecionado, um número fixo de workers
+consome uma fila limitada (o produtor bloqueia quando ela enche). O
+progresso é agregado e reportado no máximo uma vez por intervalo, e o
+cancelamento impede que arquivos ainda não iniciados sejam processados.
+"""
+
+import queue
+import threading
+import time
+from typing import Any, Callable, Iterable, List, NamedTuple, Optional
+
+# Sinaliza aos workers que não há mais itens
+_END = object()
+
+
+def _report(on_progress: Callable[[int, int], None], done: int, total: int) -> None:
+    """
+    Chama o aviso de progresso ignorando suas falhas (ex.: janela já fechada):
+    elas não podem alterar o resultado dos itens nem derrubar um worker.
+    """
+    try:
+        on_progress(done, total)
+    except Exception:
+        pass
+
+
+class ResolutionOutcome(NamedTuple):
+    """Resultado de um item: valor retornado, erro ou cancelamento."""
+
+    item: Any
+    result: Any = None
+    error: Optional[Exception] = None
+    cancelled: bool = False
+
+
+class ResolutionScheduler:
+    """
+    Executa uma função sobre muitos itens com um pool limitado de workers,
+    fila com backpressure, cancelamento e progresso agregado.
+
+    Cada instância executa um único lote; o cancelamento vale para o lote
+    em andamento (itens já iniciados terminam normalmente).
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 4,
+        queue_size: Optional[int] = None,
+        progress_interval: float = 0.1,
+    ):
+        self._max_workers = max(1, max_workers)
+        # Por padrão, cada worker tem no máximo um item aguardando na fila
+        self._queue_size = max(1, queue_size or self._max_workers)
+        self._progress_interval = progress_interval
+        self._cancel_event = threading.Event()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancel_event.is_set()
+
+    def cancel(self) -> None:
+        """Pede o cancelamento: itens ainda não iniciados são descartados."""
+        self._cancel_event.set()
+
+    def run(
+        self,
+        items: Iterable[Any],
+        work: Callable[[Any], Any],
+        on_progress: Optional[Callable[[int, int], None]] = None,
+    ) -> List[ResolutionOutcome]:
+        """
+        Processa os itens e retorna um resultado por item, na ordem de entrada.
+
+        Exceções de `work` são capturadas no resultado do item, sem
+        interromper os demais. `on_progress(concluídos, total)` é chamado de
+        uma das threads de trabalho no máximo uma vez por intervalo, e sempre
+        uma última vez ao final; exceções lançadas por ele são ignoradas.
+        """
+        items = list(items)
+        total = len(items)
+        outcomes: List[Optional[ResolutionOutcome]] = [None] * total
+        pending: "queue.Queue" = queue.Queue(maxsize=self._queue_size)
+        lock = threading.Lock()
+        completed = 0
+        last_report = time.monotonic()
+
+        def finish(index: int, outcome: ResolutionOutcome) -> None:
+            nonlocal completed, last_report
+            outcomes[index] = outcome
+            with lock:
+                completed += 1
+                now = time.monotonic()
+                if on_progress is None or now - last_report < self._progress_interval:
+                    return
+                last_report = now
+                done = completed
+            _report(on_progress, done, total)
+
+        def worker() -> None:
+            while True:
+                entry = pending.get()
+                if entry is _END:
+                    return
+                index, item = entry
+                if self._cancel_event.is_set():
+                    finish(index, ResolutionOutcome(item, cancelled=True))
+                    continue
+                try:
+                    outcome = ResolutionOutcome(item, result=work(item))
+                except Exception as e:
+                    outcome = ResolutionOutcome(item, error=e)
+                finish(index, outcome)
+
+        workers = [
+            threading.Thread(target=worker, daemon=True)
+            for _ in range(min(self._max_workers, total))
+        ]
+        for thread in workers:
+            thread.start()
+
+        for index, item in enumerate(items):
+            if self._cancel_event.is_set():
+                outcomes[index] = ResolutionOutcome(item, cancelled=True)
+                continue
+            pending.put((index, item))  # Bloqueia enquanto a fila estiver cheia
+
+        for _ in workers:
+            pending.put(_END)
+        for thread in workers:
+            thread.join()
+
+        if on_progress is not None:
+            _report(on_progress, total, total)
+        return outcomes
@@ -1,27 +1,54 @@
 # src/sad_app_v2/presentation/view_controller.py
 
+import os
 import threading
+from collections import deque
 from pathlib import Path
 from tkinter import filedialog, messagebox
-from typing import List
+from typing import Callable, Deque, List, NamedTuple, Optional
 
 import customtkinter as ctk
 from sad_app_v2.core.exceptions import CoreError
 from sad_app_v2.core.use_cases.organize_lots import OrganizeAndGenerateLotsUseCase
 from sad_app_v2.core.use_cases.validate_batch import ValidateBatchUseCase
-from sad_app_v2.infrastructure.file_system import (
-    FileSystemFileRepository,
-    SafeFileSystemManager,
-)
+from sad_app_v2.infrastructure.file_system import SafeFileSystemManager
 from sad_app_v2.infrastructure.safe_file_operations import (
+    DEFAULT_JOURNAL_DIR,
     SafeFileRenamer,
     generate_safe_filename,
 )
-from sad_app_v2.infrastructure.services import GreedyLotBalancerService
+from sad_app_v2.infrastructure.services import CapacityAwareLotBalancerService
 from sad_app_v2.infrastructure.template_filler import OpenpyxlTemplateFiller
 
-from ..core.domain import DocumentFile, DocumentStatus
+from ..core.domain import DocumentFile, DocumentStatus, ManifestItem
 from ..infrastructure.excel_reader import ExcelManifestRepository
+from ..infrastructure.manifest_index import CachedManifestRepository
+from ..infrastructure.scan_snapshot import IncrementalFileRepository
+from .resolution_scheduler import ResolutionScheduler
+
+# Lotes materializados ao mesmo tempo na organização (pastas, arquivos, manifestos)
+ORGANIZE_MAX_WORKERS = 4
+
+# Arquivos RIR resolvidos ao mesmo tempo (extração de texto e busca do código).
+# Com o backend de processos as threads só aguardam os workers, então há ao
+# menos uma por núcleo para mantê-los ocupados.
+RIR_MAX_WORKERS = max(4, os.cpu_count() or 1)
+
+# Intervalo mínimo, em segundos, entre atualizações de log/progresso da resolução
+RIR_PROGRESS_INTERVAL = 0.2
+
+# Falhas de resolução RIR listadas na mensagem final; as demais são resumidas
+RIR_MAX_REPORTED_FAILURES = 5
+
+
+class _RirPlan(NamedTuple):
+    """Renomeação planejada para um arquivo RIR, executada depois em lote."""
+
+    file: DocumentFile
+    new_path: Path
+    matched_item: Optional[ManifestItem]
+    # None quando o arquivo só precisava do sufixo de revisão
+    extracted_name: Optional[str]
 
 
 class ViewController:
@@ -38,6 +65,18 @@ class ViewController:
         self.unrecognized_files: List[DocumentFile] = []
         self.all_manifest_items = []
 
+        # Índice do manifesto e snapshot da pasta compartilhados entre validações
+        self.manifest_repo = CachedManifestRepository(ExcelManifestRepository())
+        self.file_repo = IncrementalFileRepository()
+        self._last_validation_key = None
+
+        # Desfaz renomeações RIR de um lote interrompido antes de qualquer varredura
+        self.rename_journal_dir = DEFAULT_JOURNAL_DIR
+        SafeFileRenamer.recover_pending_batches(self.rename_journal_dir)
+
+        # Resolução RIR em andamento (para cancelamento)
+        self._resolution: Optional[ResolutionScheduler] = None
+
     def set_view(self, view):
         """Define a view associada ao controller."""
         self.view = view
@@ -96,13 +135,29 @@ class ViewController:
 
     def _run_validation(self):
         try:
-            # ... (código existente)
-            manifest_repo = ExcelManifestRepository()
-            file_repo = FileSystemFileRepository()
-            use_case = ValidateBatchUseCase(manifest_repo, file_repo)
-            self.all_manifest_items = manifest_repo.load_from_file(self.manifest_path)
-            self.validated_files, self.unrecognized_files = use_case.execute(
-                self.manifest_path, self.source_directory
+            use_case = ValidateBatchUseCase(self.manifest_repo, self.file_repo)
+            validation_key = self._get_validation_key()
+            incremental = validation_key is not None and (
+                validation_key == self._last_validation_key
+            )
+            if incremental:
+                # Mesmo manifesto e mesma pasta: revalida só o que mudou no disco
+                self.validated_files, self.unrecognized_files = (
+                    use_case.execute_incremental(
+                        self.manifest_path,
+                        self.source_directory,
+                        self.validated_files,
+                        self.unrecognized_files,
+                    )
+                )
+            else:
+                self.validated_files, self.unrecognized_files = use_case.execute(
+                    self.manifest_path, self.source_directory
+                )
+            self._last_validation_key = validation_key
+            # Atendido pelo índice em memória: o XLSX não é lido novamente
+            self.all_manifest_items = self.manifest_repo.load_from_file(
+                self.manifest_path
             )
 
             self.view.after(
@@ -118,376 +173,293 @@ class ViewController:
         finally:
             self.view.after(0, self._set_ui_busy, False, "VALIDAR LOTE")
 
+    def _get_validation_key(self):
+        """
+        Identifica a combinação manifesto + pasta da validação. Se mudar, a
+        próxima validação precisa ser completa.
+        """
+        try:
+            stat = self.manifest_path.stat()
+        except OSError:
+            return None
+        return (
+            str(self.manifest_path),
+            stat.st_size,
+            stat.st_mtime_ns,
+            str(self.source_directory),
+        )
+
     def on_resolve_click(self):
         # ... (código existente)
-        selected_filenames = [
+        selected_filenames = {
             name
             for name, cb in self.view.unrecognized_checkboxes.items()
             if cb.get() == 1
-        ]
+        }
         if not selected_filenames:
             messagebox.showinfo("Seleção", "Selecione arquivos para resolver.")
             return
 
         self.view.set_resolve_panel_state("disabled")
+        self.view.set_cancel_resolve_state("normal")
         files_to_resolve = [
             f for f in self.unrecognized_files if f.path.name in selected_filenames
         ]
 
         # Usar sempre a lógica RIR (única opção disponível)
-        for file in files_to_resolve:
-            threading.Thread(
-                target=self._run_rir_resolution, args=(file,), daemon=True
-            ).start()
+        self._resolution = ResolutionScheduler(
+            max_workers=RIR_MAX_WORKERS, progress_interval=RIR_PROGRESS_INTERVAL
+        )
+        threading.Thread(
+            target=self._run_rir_resolution,
+            args=(files_to_resolve, self._resolution),
+            daemon=True,
+        ).start()
 
-    def _run_rir_resolution(self, file: DocumentFile):
-        """Executa a resolução específica para RIR em thread separada."""
-        try:
-            # Log inicial
-            self.view.after(
-                0,
-                self.view.add_log_message,
-                f"🔍 RIR: Iniciando resolução para '{file.path.name}'",
+    def on_cancel_resolve_click(self):
+        """Cancela a resolução em andamento; nenhum arquivo é renomeado."""
+        if self._resolution is not None and not self._resolution.cancelled:
+            self._resolution.cancel()
+            self.view.add_log_message(
+                "⏹️ RIR: Cancelamento solicitado, aguardando arquivos em andamento..."
             )
 
-            # Verificar se é um arquivo que só precisa de sufixo
-            if (
-                file.status == DocumentStatus.NEEDS_SUFFIX
-                and file.associated_manifest_item
-            ):
-                self.view.after(
-                    0,
-                    self.view.add_log_message,
-                    f"⚠️ RIR: Arquivo '{file.path.name}' encontrado no manifesto, "
-                    f"mas sem sufixo",
-                )
-
-                # Usar o nome existente e adicionar sufixo
-                original_path = file.path
-                file_extension = original_path.suffix
-                file_name_without_ext = original_path.stem
-
-                # Usar a revisão do item do manifesto
-                revision = file.associated_manifest_item.revision
-                new_filename = f"{file_name_without_ext}_{revision}{file_extension}"
-
-                self.view.after(
-                    0,
-                    self.view.add_log_message,
-                    f"🔄 RIR: Adicionando sufixo: '{original_path.name}' → "
-                    f"'{new_filename}'",
-                )
+    def _run_rir_resolution(
+        self, files: List[DocumentFile], scheduler: ResolutionScheduler
+    ):
+        """
+        Executa a resolução RIR em thread separada: um pool limitado de workers
+        define o novo nome de cada arquivo e depois todos são renomeados de uma
+        vez, em uma transação (se uma renomeação falhar, nenhum arquivo fica
+        alterado).
+
+        As mensagens de log são acumuladas e enviadas à interface junto com o
+        progresso, em uma única chamada a `after` por intervalo, em vez de
+        várias por arquivo.
+        """
+        pending_logs: Deque[str] = deque()
+
+        def flush_progress(done: int, total: int):
+            # Os workers continuam anexando enquanto a fila é esvaziada: drena
+            # até a fila ficar vazia, sem confiar num tamanho lido antes
+            lines = []
+            while True:
+                try:
+                    lines.append(pending_logs.popleft())
+                except IndexError:
+                    break
+            fraction = done / total if total else 1.0
+            self.view.after(0, self._show_rir_progress, lines, fraction)
 
-                # Renomear o arquivo
-                new_path = original_path.parent / new_filename
+        failures = []
+        try:
+            pending_logs.append(
+                f"🔍 RIR: Resolvendo {len(files)} arquivo(s) com "
+                f"{RIR_MAX_WORKERS} worker(s)"
+            )
+            outcomes = scheduler.run(
+                files,
+                lambda file: self._plan_rir_resolution(file, pending_logs.append),
+                on_progress=flush_progress,
+            )
 
-                # Verificar se já tem o nome correto (evitar renomear para o mesmo nome)
-                if original_path.name == new_filename:
-                    self.view.after(
-                        0,
-                        self.view.add_log_message,
-                        f"✅ RIR: Arquivo já possui o nome correto: '{new_filename}'",
-                    )
-                    final_filename = new_filename
+            plans = []
+            cancelled = 0
+            for outcome in outcomes:
+                if outcome.cancelled:
+                    cancelled += 1
+                elif outcome.error is not None:
+                    icon = "❌" if isinstance(outcome.error, CoreError) else "💥"
+                    pending_logs.append(f"{icon} RIR ERRO: {outcome.error}")
+                    failures.append(f"'{outcome.item.path.name}': {outcome.error}")
                 else:
-                    # Usar renomeação segura
-                    try:
-                        success, final_path = SafeFileRenamer.safe_rename_file(
-                            original_path, new_path
-                        )
-                        final_filename = final_path.name
-
-                        self.view.after(
-                            0,
-                            self.view.add_log_message,
-                            f"✅ RIR: Arquivo renomeado com segurança: '{final_filename}'",
-                        )
-
-                        # Usar o nome final para as próximas operações
-                        new_filename = final_filename
-
-                    except Exception as rename_error:
-                        self.view.after(
-                            0,
-                            self.view.add_log_message,
-                            f"❌ RIR ERRO CRÍTICO: Falha na renomeação: {rename_error}",
-                        )
-                        raise CoreError(
-                            f"Falha crítica na renomeação de '{original_path.name}': {rename_error}"
-                        )
-
-                # Atualizar o status do arquivo
-                file.status = DocumentStatus.VALIDATED
-                file.path = new_path
+                    plans.append(outcome.result)
 
-                # Atualizar listas
-                self.unrecognized_files.remove(file)
-                self.validated_files.append(file)
-
-                self.view.after(
-                    0,
-                    self.view.add_log_message,
-                    f"✅ RIR: Arquivo renomeado e validado com sucesso: "
-                    f"'{new_filename}'",
+            if scheduler.cancelled:
+                pending_logs.append(
+                    f"⏹️ RIR: Resolução cancelada ({cancelled} arquivo(s) não "
+                    f"processado(s)); nenhum arquivo foi renomeado"
                 )
-
-                # Atualizar interface
-                self.view.after(0, self._update_ui_lists)
-                return
-
-            # Continuar com o fluxo normal para arquivos não reconhecidos
-
-            # 1. Extrair texto do documento
-            self.view.after(
-                0,
-                self.view.add_log_message,
-                f"📄 RIR: Extraindo texto de '{file.path.name}'",
+            elif plans:
+                self._apply_rir_plans(plans, pending_logs.append)
+        except CoreError as e:
+            pending_logs.append(f"❌ RIR ERRO: {str(e)}")
+            failures.append(str(e))
+        finally:
+            pending_logs.append(
+                f"🏁 RIR: Finalizando processamento de {len(files)} arquivo(s)"
             )
-            extracted_text = self.extractor_service.extract_text(file, "RIR")
-
-            if not extracted_text:
+            flush_progress(len(files), len(files))
+            if failures:
+                shown = "\n".join(failures[:RIR_MAX_REPORTED_FAILURES])
+                hidden = len(failures) - RIR_MAX_REPORTED_FAILURES
+                if hidden > 0:
+                    shown += f"\n...e mais {hidden} arquivo(s)."
                 self.view.after(
-                    0, self.view.add_log_message, "❌ RIR: Falha na extração de texto"
+                    0,
+                    messagebox.showinfo,
+                    "Falha na Resolução RIR",
+                    f"Erro ao resolver {len(failures)} arquivo(s) RIR:\n{shown}",
                 )
-                raise CoreError("Não foi possível extrair texto do documento")
+            self.view.after(0, self.view.set_cancel_resolve_state, "disabled")
+            self.view.after(0, self.view.set_resolve_panel_state, "normal")
 
-            # Log do texto extraído (primeiros 200 caracteres)
-            text_preview = extracted_text[:200].replace("\n", " ").replace("\r", " ")
-            self.view.after(
-                0,
-                self.view.add_log_message,
-                f"📋 RIR: Texto extraído (preview): '{text_preview}...'",
+    def _show_rir_progress(self, lines: List[str], fraction: float):
+        """Aplica na interface um lote de mensagens e o progresso da resolução."""
+        for line in lines:
+            self.view.add_log_message(line)
+        self.view.set_progress(fraction)
+
+    def _plan_rir_resolution(
+        self, file: DocumentFile, log: Callable[[str], None]
+    ) -> _RirPlan:
+        """
+        Define o novo nome de um arquivo RIR, sem renomeá-lo ainda. Executado
+        pelos workers da resolução; as mensagens vão para `log`.
+        """
+        # Log inicial
+        log(f"🔍 RIR: Iniciando resolução para '{file.path.name}'")
+
+        # Verificar se é um arquivo que só precisa de sufixo
+        if file.status == DocumentStatus.NEEDS_SUFFIX and file.associated_manifest_item:
+            log(
+                f"⚠️ RIR: Arquivo '{file.path.name}' encontrado no manifesto, "
+                f"mas sem sufixo"
             )
 
-            # 2. Buscar nome após "Relatório:" especificamente
-            import re
+            # Usar o nome existente e adicionar sufixo, com a revisão do manifesto
+            original_path = file.path
+            revision = file.associated_manifest_item.revision
+            new_filename = f"{original_path.stem}_{revision}{original_path.suffix}"
 
-            # Padrão específico para pegar o código RIR
-            # (mais de 3 caracteres, com underscores)
-            pattern = r"Relatório:\s*([A-Z0-9_\.\-]{4,}(?:_[A-Z0-9_\.\-]+)*)"
-            self.view.after(
-                0, self.view.add_log_message, f"🔎 RIR: Buscando padrão: '{pattern}'"
+            log(
+                f"🔄 RIR: Adicionando sufixo: '{original_path.name}' → '{new_filename}'"
             )
-
-            # Buscar todas as ocorrências e pegar a que tem mais caracteres
-            matches = re.findall(pattern, extracted_text, re.IGNORECASE | re.MULTILINE)
-            match = None
-            if matches:
-                # Pegar a correspondência mais longa (mais específica)
-                longest_match = max(matches, key=len)
-                if len(longest_match) > 3:  # Deve ter mais que 3 caracteres
-                    match = type(
-                        "Match", (), {"group": lambda self, n: longest_match}
-                    )()
-                    self.view.after(
-                        0,
-                        self.view.add_log_message,
-                        f"🎯 RIR: Encontradas {len(matches)} correspondências, usando a mais longa",
-                    )
-                else:
-                    match = None
-
-            if not match:
-                self.view.after(
-                    0,
-                    self.view.add_log_message,
-                    "❌ RIR: Padrão não encontrado no texto",
-                )
-                raise CoreError(
-                    "Não foi encontrado nome do relatório após 'Relatório:' no documento"
-                )
-
-            extracted_name = match.group(1).strip()
-            self.view.after(
-                0,
-                self.view.add_log_message,
-                f"✅ RIR: Nome extraído: '{extracted_name}'",
-            )
-            self.view.after(
-                0,
-                self.view.add_log_message,
-                f"📏 RIR: Tamanho do nome: {len(extracted_name)} caracteres",
+            return _RirPlan(file, original_path.parent / new_filename, None, None)
+
+        # Continuar com o fluxo normal para arquivos não reconhecidos
+
+        # 1. Extrair texto do documento
+        log(f"📄 RIR: Extraindo texto de '{file.path.name}'")
+        # Só as páginas necessárias: a leitura para no cabeçalho "Relatório:"
+        extracted_text = self.extractor_service.extract_text_for_code(file, "RIR")
+
+        if not extracted_text:
+            log("❌ RIR: Falha na extração de texto")
+            raise CoreError("Não foi possível extrair texto do documento")
+
+        # Log do texto extraído (primeiros 200 caracteres)
+        text_preview = extracted_text[:200].replace("\n", " ").replace("\r", " ")
+        log(f"📋 RIR: Texto extraído (preview): '{text_preview}...'")
+
+        # 2. Buscar nome após "Relatório:" com os padrões do perfil RIR
+        # (config/patterns.yaml), que escolhe a correspondência mais longa
+        log("🔎 RIR: Buscando nome do relatório com os padrões do perfil RIR")
+        extracted_name = self.extractor_service.find_code(extracted_text, "RIR")
+        if extracted_name:
+            extracted_name = extracted_name.strip()
+
+        if not extracted_name:
+            log("❌ RIR: Padrão não encontrado no texto")
+            raise CoreError(
+                "Não foi encontrado nome do relatório após 'Relatório:' no documento"
             )
 
-            # 3. Buscar item correspondente no manifesto
-            self.view.after(
-                0,
-                self.view.add_log_message,
-                f"🔍 RIR: Buscando '{extracted_name}' no manifesto ({len(self.all_manifest_items)} itens)",
-            )
-            matched_item = None
-            items_checked = 0
-            for item in self.all_manifest_items:
-                items_checked += 1
-                if (
-                    extracted_name.upper() in item.document_code.upper()
-                    or item.document_code.upper() in extracted_name.upper()
-                ):
-                    matched_item = item
-                    self.view.after(
-                        0,
-                        self.view.add_log_message,
-                        f"✅ RIR: Correspondência encontrada após {items_checked} itens",
-                    )
-                    self.view.after(
-                        0,
-                        self.view.add_log_message,
-                        f"📋 RIR: Item manifesto: '{item.document_code}' (rev: {item.revision})",
-                    )
-                    break
+        log(f"✅ RIR: Nome extraído: '{extracted_name}'")
+        log(f"📏 RIR: Tamanho do nome: {len(extracted_name)} caracteres")
 
-            if not matched_item:
-                self.view.after(
-                    0,
-                    self.view.add_log_message,
-                    f"⚠️ RIR: Não encontrado no manifesto (verificou {items_checked} itens)",
+        # 3. Buscar item correspondente no manifesto
+        log(
+            f"🔍 RIR: Buscando '{extracted_name}' no manifesto "
+            f"({len(self.all_manifest_items)} itens)"
+        )
+        matched_item = None
+        items_checked = 0
+        for item in self.all_manifest_items:
+            items_checked += 1
+            if (
+                extracted_name.upper() in item.document_code.upper()
+                or item.document_code.upper() in extracted_name.upper()
+            ):
+                matched_item = item
+                log(f"✅ RIR: Correspondência encontrada após {items_checked} itens")
+                log(
+                    f"📋 RIR: Item manifesto: '{item.document_code}' "
+                    f"(rev: {item.revision})"
                 )
+                break
 
-            # 4. Renomear arquivo com nome extraído (sempre usar o nome extraído)
-            self.view.after(
-                0,
-                self.view.add_log_message,
-                f"📁 RIR: Preparando renomeação de '{file.path.name}'",
-            )
-            original_path = file.path
-            file_extension = original_path.suffix
+        if not matched_item:
+            log(f"⚠️ RIR: Não encontrado no manifesto (verificou {items_checked} itens)")
 
-            # Gerar novo nome: nome_extraído_revisão.extensão
-            # Se encontrou no manifesto, usar a revisão. Senão, usar "0" como padrão
-            revision = matched_item.revision if matched_item else "0"
-            new_filename = f"{extracted_name}_{revision}{file_extension}"
-            new_path = original_path.parent / new_filename
+        # 4. Novo nome: nome_extraído_revisão.extensão
+        # Se encontrou no manifesto, usar a revisão. Senão, usar "0" como padrão
+        original_path = file.path
+        revision = matched_item.revision if matched_item else "0"
+        new_filename = f"{extracted_name}_{revision}{original_path.suffix}"
 
-            self.view.after(
-                0,
-                self.view.add_log_message,
-                f"🔄 RIR: '{original_path.name}' → '{new_filename}' (rev: {revision})",
-            )
+        log(f"🔄 RIR: '{original_path.name}' → '{new_filename}' (rev: {revision})")
+        return _RirPlan(
+            file, original_path.parent / new_filename, matched_item, extracted_name
+        )
 
-            # Renomear o arquivo fisicamente
-            self.view.after(
-                0,
-                self.view.add_log_message,
-                "💾 RIR: Executando renomeação física do arquivo",
+    def _apply_rir_plans(self, plans: List[_RirPlan], log: Callable[[str], None]):
+        """
+        Renomeia todos os arquivos planejados em um único lote e atualiza as
+        listas. Se o lote falhar, ele é desfeito e nenhuma lista é alterada.
+        """
+        log(f"💾 RIR: Executando renomeação física de {len(plans)} arquivo(s)")
+        try:
+            final_paths = SafeFileRenamer.safe_rename_batch(
+                ((plan.file.path, plan.new_path) for plan in plans),
+                journal_dir=self.rename_journal_dir,
             )
+        except (OSError, ValueError) as rename_error:
+            log(f"❌ RIR ERRO CRÍTICO: Falha na renomeação: {rename_error}")
+            raise CoreError(
+                f"Falha crítica na renomeação em lote: {rename_error}"
+            ) from rename_error
+
+        resolved_ids = {id(plan.file) for plan in plans}
+        self.unrecognized_files = [
+            f for f in self.unrecognized_files if id(f) not in resolved_ids
+        ]
+        for plan, final_path in zip(plans, final_paths):
+            file = plan.file
+            original_name = file.path.name
 
-            # Verificar se já tem o nome correto (evitar renomear para o mesmo nome)
-            if original_path.name == new_filename:
-                self.view.after(
-                    0,
-                    self.view.add_log_message,
-                    f"✅ RIR: Arquivo já possui o nome correto: '{new_filename}'",
+            if plan.extracted_name is None:
+                # Arquivo que só precisava de sufixo
+                file.status = DocumentStatus.VALIDATED
+                file.path = final_path
+                self.validated_files.append(file)
+                log(
+                    f"✅ RIR: Arquivo renomeado e validado com sucesso: "
+                    f"'{final_path.name}'"
                 )
-                final_filename = new_filename
-            else:
-                # Usar renomeação segura
-                try:
-                    success, final_path = SafeFileRenamer.safe_rename_file(
-                        original_path, new_path
-                    )
-                    final_filename = final_path.name
+                continue
 
-                    self.view.after(
-                        0,
-                        self.view.add_log_message,
-                        f"✅ RIR: Arquivo renomeado com segurança: '{final_filename}'",
-                    )
-                except Exception as rename_error:
-                    self.view.after(
-                        0,
-                        self.view.add_log_message,
-                        f"❌ RIR ERRO CRÍTICO: Falha na renomeação: {rename_error}",
-                    )
-                    raise CoreError(
-                        f"Falha crítica na renomeação de '{original_path.name}': {rename_error}"
-                    )
-
-            # 5. Criar arquivo resolvido com novo caminho
-            self.view.after(
-                0,
-                self.view.add_log_message,
-                f"📝 RIR: Criando objeto DocumentFile para '{new_path.name}'",
-            )
-            resolved_file = DocumentFile(new_path, file.size_bytes)
-            if matched_item:
-                resolved_file.manifest_item = matched_item
-                # Agora só precisamos definir manifest_item, que atualizará automaticamente os dois campos
-                # pois implementamos um property setter que cuida disso
+            resolved_file = DocumentFile(final_path, file.size_bytes)
+            if plan.matched_item:
+                resolved_file.manifest_item = plan.matched_item
                 resolved_file.status = DocumentStatus.VALIDATED
-                self.view.after(
-                    0,
-                    self.view.add_log_message,
-                    "✅ RIR: Status definido como VALIDATED",
-                )
+                self.validated_files.append(resolved_file)
+                manifest_status = "OK"
             else:
                 # Se não encontrou no manifesto, manter como reconhecido mas sem item
                 resolved_file.status = DocumentStatus.RECOGNIZED
-                self.view.after(
-                    0,
-                    self.view.add_log_message,
-                    "⚠️ RIR: Status definido como RECOGNIZED (sem manifesto)",
-                )
-
-            # 6. Atualizar listas
-            self.view.after(
-                0, self.view.add_log_message, "📊 RIR: Atualizando listas de arquivos"
-            )
-            self.unrecognized_files.remove(file)
-            if matched_item:
-                self.validated_files.append(resolved_file)
-                self.view.after(
-                    0,
-                    self.view.add_log_message,
-                    f"✅ RIR: Adicionado à lista validated_files ({len(self.validated_files)} itens)",
-                )
-            else:
-                # Se não tem item no manifesto, adicionar à lista de reconhecidos
                 if not hasattr(self, "recognized_files"):
                     self.recognized_files = []
                 self.recognized_files.append(resolved_file)
-                self.view.after(
-                    0,
-                    self.view.add_log_message,
-                    f"⚠️ RIR: Adicionado à lista recognized_files ({len(self.recognized_files)} itens)",
-                )
-
-            # 7. Log da operação final
-            if matched_item:
-                log_msg = f"🎉 RIR SUCESSO: '{original_path.name}' → '{new_filename}' (extraído: '{extracted_name}', manifesto: OK)"
-            else:
-                log_msg = f"🎉 RIR SUCESSO: '{original_path.name}' → '{new_filename}' (extraído: '{extracted_name}', manifesto: N/A)"
+                manifest_status = "N/A"
 
-            self.view.after(0, self.view.add_log_message, log_msg)
-            self.view.after(
-                0, self.view.add_log_message, "🔄 RIR: Atualizando interface..."
+            log(
+                f"🎉 RIR SUCESSO: '{original_name}' → '{final_path.name}' "
+                f"(extraído: '{plan.extracted_name}', manifesto: {manifest_status})"
             )
-            self.view.after(0, self._update_ui_lists)
 
-        except CoreError as e:
-            self.view.after(0, self.view.add_log_message, f"❌ RIR ERRO: {str(e)}")
-            self.view.after(
-                0,
-                messagebox.showinfo,
-                "Falha na Resolução RIR",
-                f"Erro ao resolver RIR '{file.path.name}':\n{e}",
-            )
-        except Exception as e:
-            self.view.after(
-                0, self.view.add_log_message, f"💥 RIR ERRO CRÍTICO: {str(e)}"
-            )
-            self.view.after(
-                0,
-                messagebox.showinfo,
-                "Erro Inesperado",
-                f"Erro inesperado ao processar '{file.path.name}':\n{e}",
-            )
-        finally:
-            self.view.after(
-                0,
-                self.view.add_log_message,
-                f"🏁 RIR: Finalizando processamento de '{file.path.name}'",
-            )
-            self.view.after(0, self.view.set_resolve_panel_state, "normal")
+        log("🔄 RIR: Atualizando interface...")
+        self.view.after(0, self._update_ui_lists)
 
     def on_organize_lots_click(self):
         # 1. Validar entradas da UI
@@ -524,11 +496,16 @@ class ViewController:
     def _run_organization(self, **kwargs):
         try:
             # Composição final dos serviços
-            balancer = GreedyLotBalancerService()
+            # Equilibra os lotes como o guloso, mas respeita o limite por lote
+            balancer = CapacityAwareLotBalancerService()
             file_manager = SafeFileSystemManager()
             template_filler = OpenpyxlTemplateFiller(file_manager)
             use_case = OrganizeAndGenerateLotsUseCase(
-                balancer, file_manager, template_filler
+                balancer,
+                file_manager,
+                template_filler,
+                max_workers=ORGANIZE_MAX_WORKERS,
+                continue_on_error=True,
             )
 
             # Execução
@@ -1,5 +1,6 @@
 from pathlib import Path
 
+import openpyxl
 import pytest
 
 from src.sad_app_v2.core.interfaces import ManifestReadError
@@ -33,3 +34,57 @@ def test_load_from_file_not_found():
     # Verifica se a exceção ManifestReadError é lançada
     with pytest.raises(ManifestReadError):
         repo.load_from_file(non_existent_path)
+
+
+def test_iter_items_is_lazy_and_matches_load_from_file():
+    """Verifica se a leitura em streaming produz os mesmos itens da leitura completa."""
+    repo = ExcelManifestRepository()
+    fixture_path = Path("tests/fixtures/manifesto_exemplo.xlsx")
+
+    items_iter = repo.iter_items(fixture_path)
+
+    # Deve ser um iterador preguiçoso, não uma lista
+    assert iter(items_iter) is items_iter
+
+    streamed = list(items_iter)
+    loaded = repo.load_from_file(fixture_path)
+    assert [i.document_code for i in streamed] == [i.document_code for i in loaded]
+
+
+def test_iter_items_maps_columns_by_name(tmp_path):
+    """Verifica se as colunas principais são localizadas pelo nome do cabeçalho."""
+    manifest_path = tmp_path / "manifesto_reordenado.xlsx"
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    sheet.append(["TÍTULO", "DISCIPLINA", "DOCUMENTO", "REVISÃO"])
+    sheet.append(["Título X", "CIVIL", "DOC-X", 0])
+    sheet.append([None, None, None, None])
+    workbook.save(manifest_path)
+
+    items = list(ExcelManifestRepository().iter_items(manifest_path))
+
+    assert len(items) == 1
+    assert items[0].document_code == "DOC-X"
+    assert items[0].revision == "0"
+    assert items[0].title == "Título X"
+    assert items[0].metadata == {"DISCIPLINA": "CIVIL"}
+
+
+def test_iter_items_partially_renamed_header_uses_fixed_positions(tmp_path):
+    """
+    Verifica se, faltando algum dos nomes principais no cabeçalho, os três
+    campos voltam às posições fixas, sem ler dois campos da mesma coluna.
+    """
+    manifest_path = tmp_path / "manifesto_renomeado.xlsx"
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    sheet.append(["TÍTULO", "REV", "CÓDIGO", "DISCIPLINA"])
+    sheet.append(["DOC-Y", "B", "Título Y", "CIVIL"])
+    workbook.save(manifest_path)
+
+    [item] = list(ExcelManifestRepository().iter_items(manifest_path))
+
+    assert item.document_code == "DOC-Y"
+    assert item.revision == "B"
+    assert item.title == "Título Y"
+    assert item.metadata == {"DISCIPLINA": "CIVIL"}
@@ -1,6 +1,8 @@
 from pathlib import Path
+from unittest.mock import patch
 
 from src.sad_app_v2.core.domain import DocumentFile
+from src.sad_app_v2.infrastructure import extraction
 from src.sad_app_v2.infrastructure.extraction import ProfiledExtractorService
 
 
@@ -48,3 +50,79 @@ def test_extract_code_from_docx():
     # Verificação
     assert found_code is not None
     assert found_code.strip() == expected_code
+
+
+def _fake_pages(pages, consumed):
+    """Substitui a leitura de páginas do PDF, registrando as páginas lidas."""
+
+    def iter_pages(file_path):
+        for page in pages:
+            consumed.append(page)
+            yield page
+
+    return iter_pages
+
+
+def test_extract_text_for_code_stops_at_first_confident_page():
+    """
+    Verifica se a leitura para na página em que o padrão principal do perfil
+    casa, sem extrair as páginas seguintes.
+    """
+    extractor = ProfiledExtractorService(Path("config/patterns.yaml"))
+    pages = ["Sumário\n", "Relatório: RIR_ABC_123\n", "Anexo 1\n", "Anexo 2\n"]
+    consumed = []
+    file = DocumentFile(path=Path("relatorio.pdf"), size_bytes=100)
+
+    with patch.object(extraction, "_iter_pdf_pages", _fake_pages(pages, consumed)):
+        text = extractor.extract_text_for_code(file, "RIR")
+
+    assert consumed == pages[:2]
+    assert text == "Sumário\nRelatório: RIR_ABC_123\n"
+    assert extractor.find_code(text, "RIR") == "RIR_ABC_123"
+
+
+def test_extract_text_for_code_respects_profile_page_budget(tmp_path):
+    """Sem correspondência, no máximo max_pages páginas do perfil são lidas."""
+    config_path = tmp_path / "patterns.yaml"
+    config_path.write_text(
+        "profiles:\n"
+        "  RIR:\n"
+        "    max_pages: 2\n"
+        "    patterns:\n"
+        "      - 'Relatório:\\s*([A-Z0-9_]+)'\n",
+        encoding="utf-8",
+    )
+    extractor = ProfiledExtractorService(config_path)
+    pages = ["p1 ", "p2 ", "p3 ", "p4 "]
+    consumed = []
+    file = DocumentFile(path=Path("relatorio.pdf"), size_bytes=100)
+
+    with patch.object(extraction, "_iter_pdf_pages", _fake_pages(pages, consumed)):
+        text = extractor.extract_text_for_code(file, "RIR")
+
+    assert consumed == ["p1 ", "p2 "]
+    assert text == "p1 p2 "
+
+
+def test_code_on_second_page_is_found_with_early_stop():
+    """
+    Verifica se, com o código na página 2, a leitura só para nela e se
+    find_code encontra nesse texto o mesmo código que encontraria no
+    documento inteiro: a parada e a busca usam o mesmo padrão do perfil.
+    """
+    extractor = ProfiledExtractorService(Path("config/patterns.yaml"))
+    code = "CZ6_RNEST_U22_3.1.1.1_CVL_RIR_B-22026A"
+    pages = [
+        "Sumário\nRelatório: RIR - índice\n",
+        f"Relatório: {code}\nRelatório: RIR_1\n",
+        "Anexo 1\n",
+    ]
+    consumed = []
+    file = DocumentFile(path=Path("relatorio.pdf"), size_bytes=100)
+
+    with patch.object(extraction, "_iter_pdf_pages", _fake_pages(pages, consumed)):
+        text = extractor.extract_text_for_code(file, "RIR")
+
+    assert consumed == pages[:2]
+    assert extractor.find_code(text, "RIR") == code
+    assert extractor.find_code("".join(pages), "RIR") == code
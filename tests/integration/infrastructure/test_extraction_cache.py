@@ -0,0 +1,102 @@
+import os
+from pathlib import Path
+
+from src.sad_app_v2.core.domain import DocumentFile
+from src.sad_app_v2.infrastructure import extraction
+from src.sad_app_v2.infrastructure.extraction import ProfiledExtractorService
+from src.sad_app_v2.infrastructure.extraction_cache import ExtractionCache
+
+
+def _write(path: Path, content: bytes, mtime_ns: int = None) -> Path:
+    path.write_bytes(content)
+    if mtime_ns is not None:
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+    return path
+
+
+def test_cache_hits_until_content_changes(tmp_path):
+    """
+    Verifica se o texto é reaproveitado para o mesmo conteúdo, inclusive após
+    renomear o arquivo, e extraído de novo quando o conteúdo muda, mesmo que
+    tamanho e mtime sejam preservados.
+    """
+    cache = ExtractionCache(tmp_path / "cache")
+    calls = []
+
+    def extract():
+        calls.append(1)
+        return f"texto {len(calls)}"
+
+    doc = _write(tmp_path / "a.pdf", b"conteudo-1", mtime_ns=10**18)
+    assert cache.get_or_extract(doc, "v1|RIR|texto", extract) == "texto 1"
+    assert cache.get_or_extract(doc, "v1|RIR|texto", extract) == "texto 1"
+
+    renamed = doc.rename(tmp_path / "RIR_1.pdf")
+    assert cache.get_or_extract(renamed, "v1|RIR|texto", extract) == "texto 1"
+
+    # Outra variante (versão do extrator/perfil) não reaproveita o texto
+    assert cache.get_or_extract(renamed, "v2|RIR|texto", extract) == "texto 2"
+
+    _write(renamed, b"conteudo-2", mtime_ns=10**18 + 1)
+    assert cache.get_or_extract(renamed, "v1|RIR|texto", extract) == "texto 3"
+
+    stats = cache.stats()
+    assert (stats.hits, stats.misses) == (2, 3)
+    assert stats.entries == 3
+
+
+def test_cache_evicts_least_recently_used(tmp_path):
+    """
+    Verifica se, ao passar do limite de tamanho, a entrada usada há mais
+    tempo é removida e a usada recentemente é mantida, inclusive entre
+    instâncias que compartilham o diretório.
+    """
+    cache = ExtractionCache(tmp_path / "cache", max_bytes=25)
+    docs = [_write(tmp_path / f"{i}.pdf", f"doc{i}".encode()) for i in range(3)]
+
+    cache.store(docs[0], "v", "0" * 10)
+    cache.store(docs[1], "v", "1" * 10)
+    assert cache.lookup(docs[0], "v") == "0" * 10  # doc0 passa a ser o mais recente
+    cache.store(docs[2], "v", "2" * 10)
+
+    assert cache.lookup(docs[1], "v") is None
+    assert cache.lookup(docs[0], "v") == "0" * 10
+    stats = cache.stats()
+    assert stats.evictions == 1
+    assert stats.size_bytes == 20
+
+    reopened = ExtractionCache(tmp_path / "cache", max_bytes=25)
+    assert reopened.lookup(docs[2], "v") == "2" * 10
+    assert reopened.stats().entries == 2
+
+
+def test_service_reads_each_file_once_with_cache(tmp_path, monkeypatch):
+    """
+    Verifica se o serviço só lê o documento na primeira extração e se o
+    texto parcial (busca de código) e o completo são guardados separadamente.
+    """
+    reads = []
+    monkeypatch.setattr(
+        extraction,
+        "read_document_text",
+        lambda path: reads.append("texto") or "Relatório: RIR_1",
+    )
+    monkeypatch.setattr(
+        extraction,
+        "read_document_text_for_code",
+        lambda path, pattern, max_pages: reads.append("codigo") or "Relatório: RIR_1",
+    )
+    path = _write(tmp_path / "doc.pdf", b"%PDF")
+    file = DocumentFile(path=path, size_bytes=path.stat().st_size)
+    service = ProfiledExtractorService(
+        tmp_path / "ausente.yaml", cache=ExtractionCache(tmp_path / "cache")
+    )
+
+    for _ in range(2):
+        assert service.extract_text(file, "RIR") == "Relatório: RIR_1"
+        assert service.extract_text_for_code(file, "RIR") == "Relatório: RIR_1"
+        assert [r.text for r in service.extract_texts([file], "RIR")] == [
+            "Relatório: RIR_1"
+        ]
+
+    assert reads == ["texto", "codigo"]
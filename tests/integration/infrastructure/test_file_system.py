@@ -1,6 +1,14 @@
+import errno
+import os
+from pathlib import Path
+from unittest.mock import patch
+
 import pytest  # Garanta que o pytest está importado
 
-from src.sad_app_v2.core.interfaces import FileSystemOperationError
+from src.sad_app_v2.core.interfaces import (
+    FileSystemOperationError,
+    SourceDirectoryNotFoundError,
+)
 from src.sad_app_v2.infrastructure.file_system import (
     FileSystemFileRepository,
     SafeFileSystemManager,  # <-- Importar nova classe
@@ -37,6 +45,64 @@ def test_list_files_finds_all_files(tmp_path):
     assert "file3.txt" in file_names
 
 
+def test_list_files_walks_deep_tree_in_parallel(tmp_path):
+    """Verifica a varredura paralela em várias subpastas, com tamanhos corretos."""
+    expected = {}
+    for i in range(5):
+        nested = tmp_path / f"dir{i}" / "a" / "b"
+        nested.mkdir(parents=True)
+        for j in range(3):
+            file_path = nested / f"doc_{i}_{j}.pdf"
+            file_path.write_bytes(b"x" * (i * 10 + j))
+            expected[file_path] = i * 10 + j
+
+    repo = FileSystemFileRepository(max_workers=4)
+    files = repo.list_files(tmp_path)
+
+    assert {f.path: f.size_bytes for f in files} == expected
+    # Ordem estável, independente da ordem em que as pastas terminam
+    assert [f.path for f in files] == sorted(expected)
+
+
+def test_list_file_columns_matches_list_files(tmp_path):
+    """Verifica se a varredura colunar encontra os mesmos arquivos e tamanhos."""
+    (tmp_path / "a.pdf").write_bytes(b"123")
+    sub_dir = tmp_path / "sub"
+    sub_dir.mkdir()
+    (sub_dir / "b.pdf").write_bytes(b"12345")
+
+    repo = FileSystemFileRepository()
+    paths, sizes = repo.list_file_columns(tmp_path)
+
+    assert dict(zip(paths, sizes)) == {
+        str(f.path): f.size_bytes for f in repo.list_files(tmp_path)
+    }
+    assert paths == sorted(paths)
+
+
+def test_iter_files_can_stop_early(tmp_path):
+    """Verifica se o gerador pode ser interrompido antes do fim da varredura."""
+    for i in range(10):
+        sub_dir = tmp_path / f"sub{i}"
+        sub_dir.mkdir()
+        (sub_dir / "file.pdf").touch()
+
+    repo = FileSystemFileRepository(max_workers=2)
+    files_iter = repo.iter_files(tmp_path)
+    first = next(files_iter)
+    files_iter.close()
+
+    assert first.path.name == "file.pdf"
+
+
+def test_list_files_missing_directory_raises_error(tmp_path):
+    """Verifica se um diretório inexistente gera a exceção do domínio."""
+    repo = FileSystemFileRepository()
+
+    with pytest.raises(SourceDirectoryNotFoundError):
+        repo.list_files(tmp_path / "nao_existe")
+
+
 # --- NOVOS TESTES ABAIXO ---
 
 
@@ -105,3 +171,98 @@ def test_move_non_existent_file_raises_error(tmp_path):
 
     with pytest.raises(FileSystemOperationError):
         manager.move_file(source_file, dest_file)
+
+
+def test_stat_files_lists_each_directory_once(tmp_path):
+    """
+    Verifica se stat_files devolve tamanhos e ausências listando cada pasta
+    de origem uma única vez.
+    """
+    for name in ("a", "b"):
+        (tmp_path / name).mkdir()
+        for i in range(3):
+            (tmp_path / name / f"{name}_{i}.pdf").write_bytes(b"x" * (i + 1))
+    paths = [
+        tmp_path / name / f"{name}_{i}.pdf" for name in ("a", "b") for i in range(3)
+    ]
+    missing = [tmp_path / "a" / "nao_existe.pdf", tmp_path / "sem_pasta" / "x.pdf"]
+    manager = SafeFileSystemManager()
+
+    listed = []
+    original_scandir = os.scandir
+
+    def tracking_scandir(path):
+        listed.append(Path(path).name)
+        return original_scandir(path)
+
+    with patch("os.scandir", tracking_scandir):
+        sizes = manager.stat_files(paths + missing)
+
+    assert sorted(listed) == ["a", "b", "sem_pasta"]
+    assert [sizes[p] for p in paths] == [1, 2, 3, 1, 2, 3]
+    assert sizes[missing[0]] is None
+    assert sizes[missing[1]] is None
+
+
+def test_move_file_creates_each_destination_directory_once(tmp_path):
+    """Verifica se a pasta de destino é criada uma única vez para vários arquivos."""
+    manager = SafeFileSystemManager()
+    sources = []
+    for i in range(3):
+        source = tmp_path / f"arquivo_{i}.txt"
+        source.write_text(f"conteúdo {i}")
+        sources.append(source)
+    dest_dir = tmp_path / "lote"
+
+    with patch.object(Path, "mkdir", autospec=True, side_effect=Path.mkdir) as mkdir:
+        for source in sources:
+            manager.move_file(source, dest_dir / source.name)
+
+    assert mkdir.call_count == 1
+    for i, source in enumerate(sources):
+        assert not source.exists()
+        assert (dest_dir / source.name).read_text() == f"conteúdo {i}"
+
+
+def test_move_file_recreates_directory_removed_after_caching(tmp_path):
+    """Uma pasta de destino removida depois de criada é recriada na próxima vez."""
+    manager = SafeFileSystemManager()
+    dest_dir = tmp_path / "lote"
+    first = tmp_path / "a.txt"
+    second = tmp_path / "b.txt"
+    first.write_text("a")
+    second.write_text("b")
+
+    manager.move_file(first, dest_dir / "a.txt")
+    (dest_dir / "a.txt").unlink()
+    dest_dir.rmdir()
+    manager.move_file(second, dest_dir / "b.txt")
+
+    assert (dest_dir / "b.txt").read_text() == "b"
+
+
+def test_move_file_copies_across_devices(tmp_path):
+    """
+    Quando o rename é recusado entre dispositivos, o arquivo é copiado com os
+    metadados preservados e a origem é removida.
+    """
+    manager = SafeFileSystemManager()
+    source = tmp_path / "origem.bin"
+    source.write_bytes(os.urandom(3 * 1024 * 1024 + 17))
+    os.utime(source, (1_600_000_000, 1_600_000_000))
+    content = source.read_bytes()
+    destination = tmp_path / "outro_volume" / "destino.bin"
+
+    def cross_device_replace(src, dst):
+        if Path(src) == source:
+            raise OSError(errno.EXDEV, "Invalid cross-device link")
+        return original_replace(src, dst)
+
+    original_replace = os.replace
+    with patch("os.replace", cross_device_replace):
+        manager.move_file(source, destination)
+
+    assert not source.exists()
+    assert destination.read_bytes() == content
+    assert int(destination.stat().st_mtime) == 1_600_000_000
+    assert list(destination.parent.iterdir()) == [destination]
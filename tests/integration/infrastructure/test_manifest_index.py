@@ -0,0 +1,99 @@
+import os
+import shutil
+from pathlib import Path
+
+from src.sad_app_v2.infrastructure.excel_reader import ExcelManifestRepository
+from src.sad_app_v2.infrastructure.manifest_index import CachedManifestRepository
+
+
+class _CountingRepository(ExcelManifestRepository):
+    """Repositório real que conta quantas vezes o XLSX foi lido."""
+
+    def __init__(self):
+        self.reads = 0
+
+    def iter_items(self, file_path):
+        self.reads += 1
+        yield from super().iter_items(file_path)
+
+
+def _copy_fixture(tmp_path: Path) -> Path:
+    manifest_path = tmp_path / "manifesto.xlsx"
+    shutil.copy2("tests/fixtures/manifesto_exemplo.xlsx", manifest_path)
+    return manifest_path
+
+
+def test_index_is_reused_across_instances(tmp_path):
+    """Verifica se uma nova instância reaproveita o índice gravado em disco."""
+    manifest_path = _copy_fixture(tmp_path)
+    index_dir = tmp_path / "index"
+
+    first_inner = _CountingRepository()
+    first = CachedManifestRepository(first_inner, index_dir)
+    items = first.load_from_file(manifest_path)
+
+    second_inner = _CountingRepository()
+    second = CachedManifestRepository(second_inner, index_dir)
+    cached_items = second.load_from_file(manifest_path)
+
+    assert first_inner.reads == 1
+    assert second_inner.reads == 0
+    assert [i.document_code for i in cached_items] == [
+        i.document_code for i in items
+    ]
+    assert cached_items[0].metadata["DISCIPLINA"] == "PROCESSO"
+
+
+def test_index_survives_touch_but_not_content_change(tmp_path):
+    """Verifica a validação por mtime e hash do conteúdo."""
+    manifest_path = _copy_fixture(tmp_path)
+    inner = _CountingRepository()
+    repo = CachedManifestRepository(inner, tmp_path / "index")
+    repo.load_from_file(manifest_path)
+
+    # Apenas o mtime muda: o hash confirma que o índice ainda é válido
+    stat = manifest_path.stat()
+    os.utime(manifest_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    repo.load_from_file(manifest_path)
+    assert inner.reads == 1
+
+    # Conteúdo diferente: o manifesto precisa ser relido
+    shutil.copy2("tests/fixtures/manifesto_completo.xlsx", manifest_path)
+    items = repo.load_from_file(manifest_path)
+    assert inner.reads == 2
+    assert items[0].document_code == "RL-5290.00-22212-911-CZ6-019"
+
+
+def test_invalidate_forces_reload(tmp_path):
+    """Verifica se a invalidação explícita descarta o índice."""
+    manifest_path = _copy_fixture(tmp_path)
+    inner = _CountingRepository()
+    repo = CachedManifestRepository(inner, tmp_path / "index")
+
+    repo.load_from_file(manifest_path)
+    repo.invalidate(manifest_path)
+    repo.load_from_file(manifest_path)
+
+    assert inner.reads == 2
+
+
+def test_manifest_saved_during_read_is_not_indexed(tmp_path):
+    """
+    Verifica se itens lidos enquanto o manifesto era salvo não são gravados
+    no índice sob a assinatura do arquivo novo.
+    """
+    manifest_path = _copy_fixture(tmp_path)
+
+    class _SavedDuringRead(_CountingRepository):
+        def iter_items(self, file_path):
+            yield from super().iter_items(file_path)
+            if self.reads == 1:
+                stat = file_path.stat()
+                os.utime(file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    inner = _SavedDuringRead()
+    repo = CachedManifestRepository(inner, tmp_path / "index")
+    repo.load_from_file(manifest_path)
+    repo.load_from_file(manifest_path)
+
+    assert inner.reads == 2
@@ -0,0 +1,21 @@
+import hashlib
+import os
+
+from src.sad_app_v2.infrastructure.optimization import HASH_CHUNK_SIZE, hash_file
+
+
+def test_hash_file_matches_hashlib_across_chunks(tmp_path):
+    """
+    O hash lido em blocos é igual ao do conteúdo inteiro, com o algoritmo e
+    o digest_size informados.
+    """
+    content = os.urandom(2 * HASH_CHUNK_SIZE + 7)
+    path = tmp_path / "arquivo.bin"
+    path.write_bytes(content)
+
+    assert hash_file(path) == hashlib.blake2b(content).hexdigest()
+    assert (
+        hash_file(path, digest_size=20)
+        == hashlib.blake2b(content, digest_size=20).hexdigest()
+    )
+    assert hash_file(path, "sha256") == hashlib.sha256(content).hexdigest()
@@ -0,0 +1,62 @@
+from pathlib import Path
+
+import docx
+
+from src.sad_app_v2.core.domain import DocumentFile
+from src.sad_app_v2.infrastructure.extraction import ProfiledExtractorService
+from src.sad_app_v2.infrastructure.parallel_extraction import (
+    ProcessPoolTextExtractor,
+)
+
+
+def _make_docx(path: Path, text: str) -> DocumentFile:
+    document = docx.Document()
+    document.add_paragraph(text)
+    document.save(path)
+    return DocumentFile(path=path, size_bytes=path.stat().st_size)
+
+
+def test_extract_batch_streams_texts_and_errors(tmp_path):
+    """
+    Verifica se o lote entrega um resultado por arquivo, com o texto lido nos
+    workers e a falha de leitura reportada no próprio resultado.
+    """
+    files = [
+        _make_docx(tmp_path / f"doc{i}.docx", f"Relatório: RIR_{i}") for i in range(3)
+    ]
+    missing = DocumentFile(path=tmp_path / "ausente.docx", size_bytes=0)
+
+    with ProcessPoolTextExtractor(max_workers=2) as backend:
+        results = {
+            r.file.path.name: r for r in backend.extract_batch(files + [missing])
+        }
+
+    assert set(results) == {"doc0.docx", "doc1.docx", "doc2.docx", "ausente.docx"}
+    assert results["doc1.docx"].success
+    assert results["doc1.docx"].text == "Relatório: RIR_1"
+    assert not results["ausente.docx"].success
+    assert "ausente.docx" in results["ausente.docx"].error
+
+
+def test_workers_are_reused_between_batches(tmp_path):
+    """O mesmo pool atende lotes consecutivos, sem recriar os processos."""
+    file = _make_docx(tmp_path / "doc.docx", "texto")
+
+    with ProcessPoolTextExtractor(max_workers=1) as backend:
+        backend.warm_up()
+        first_pool = backend._executor
+        list(backend.extract_batch([file]))
+        assert backend.extract_text(file.path) == "texto"
+        assert backend._executor is first_pool
+
+
+def test_service_uses_backend_for_single_and_batch_extraction(tmp_path):
+    """Com backend, extract_text e extract_texts usam os workers do pool."""
+    file = _make_docx(tmp_path / "doc.docx", "Relatório: RIR_X")
+
+    with ProcessPoolTextExtractor(max_workers=1) as backend:
+        service = ProfiledExtractorService(Path("config/patterns.yaml"), backend)
+        assert service.extract_text(file, "RIR") == "Relatório: RIR_X"
+        [result] = service.extract_texts([file], "RIR")
+
+    assert result.text == "Relatório: RIR_X"
@@ -0,0 +1,183 @@
+import hashlib
+import json
+import os
+from unittest.mock import patch
+
+import pytest
+
+from src.sad_app_v2.infrastructure import safe_file_operations
+from src.sad_app_v2.infrastructure.safe_file_operations import SafeFileRenamer
+
+
+def test_safe_copy_then_delete_moves_large_file(tmp_path):
+    """
+    Verifica se um arquivo maior que um bloco de leitura é copiado íntegro,
+    com metadados preservados, e se a origem é removida.
+    """
+    source = tmp_path / "origem.pdf"
+    content = os.urandom(2 * safe_file_operations._CHUNK_SIZE + 123)
+    source.write_bytes(content)
+    os.utime(source, (1_600_000_000, 1_600_000_000))
+    target = tmp_path / "destino" / "renomeado.pdf"
+
+    success, final_path = SafeFileRenamer.safe_copy_then_delete(source, target)
+
+    assert success is True
+    assert final_path == target
+    assert not source.exists()
+    assert target.read_bytes() == content
+    assert int(target.stat().st_mtime) == 1_600_000_000
+
+
+def test_copy_with_hash_reads_source_once(tmp_path):
+    """O hash devolvido pela cópia é o do conteúdo, calculado na mesma leitura."""
+    source = tmp_path / "origem.bin"
+    content = os.urandom(safe_file_operations._CHUNK_SIZE + 1)
+    source.write_bytes(content)
+
+    digest = safe_file_operations._copy_with_hash(
+        source, tmp_path / "copia.bin", "blake2b"
+    )
+
+    assert digest == hashlib.blake2b(content).hexdigest()
+    assert (tmp_path / "copia.bin").read_bytes() == content
+
+
+def test_safe_copy_then_delete_detects_corrupted_copy(tmp_path):
+    """
+    Se o hash da cópia não confere, a cópia é removida e a origem preservada.
+    """
+    source = tmp_path / "origem.pdf"
+    source.write_bytes(b"conteudo original")
+    target = tmp_path / "destino.pdf"
+
+    with patch.object(safe_file_operations, "hash_file", return_value="divergente"):
+        with pytest.raises(OSError, match="Hash não confere"):
+            SafeFileRenamer.safe_copy_then_delete(source, target)
+
+    assert source.read_bytes() == b"conteudo original"
+    assert not target.exists()
+
+
+def test_safe_rename_batch_renames_all_with_unique_names(tmp_path):
+    """
+    Verifica se o lote renomeia todos os arquivos, resolvendo conflitos com
+    arquivos existentes e entre pares do próprio lote, e remove o journal.
+    """
+    folder = tmp_path / "pasta"
+    folder.mkdir()
+    for name in ("a.pdf", "b.pdf", "RIR_0.pdf"):
+        (folder / name).write_bytes(name.encode())
+    journal_dir = tmp_path / "journal"
+
+    final_paths = SafeFileRenamer.safe_rename_batch(
+        [
+            (folder / "a.pdf", folder / "RIR_0.pdf"),
+            (folder / "b.pdf", folder / "RIR_0.pdf"),
+        ],
+        journal_dir=journal_dir,
+    )
+
+    assert [p.name for p in final_paths] == ["RIR_0_001.pdf", "RIR_0_002.pdf"]
+    assert (folder / "RIR_0_001.pdf").read_bytes() == b"a.pdf"
+    assert (folder / "RIR_0_002.pdf").read_bytes() == b"b.pdf"
+    assert (folder / "RIR_0.pdf").read_bytes() == b"RIR_0.pdf"
+    assert list(journal_dir.glob("*")) == []
+
+
+def test_safe_rename_batch_validates_before_renaming(tmp_path):
+    """Uma origem ausente impede o lote inteiro, sem renomear nada."""
+    (tmp_path / "a.pdf").write_bytes(b"a")
+
+    with pytest.raises(FileNotFoundError):
+        SafeFileRenamer.safe_rename_batch(
+            [
+                (tmp_path / "a.pdf", tmp_path / "A_0.pdf"),
+                (tmp_path / "ausente.pdf", tmp_path / "B_0.pdf"),
+            ],
+            journal_dir=tmp_path / "journal",
+        )
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["a.pdf"]
+
+
+def test_safe_rename_batch_rolls_back_on_failure(tmp_path):
+    """Se uma renomeação falha no meio do lote, as anteriores são desfeitas."""
+    names = [f"doc{i}.pdf" for i in range(4)]
+    for name in names:
+        (tmp_path / name).write_bytes(name.encode())
+    journal_dir = tmp_path / "journal"
+    original_rename = os.rename
+    calls = []
+
+    def failing_rename(source, target):
+        calls.append(source)
+        if len(calls) == 3:
+            raise OSError("disco cheio")
+        original_rename(source, target)
+
+    with patch.object(safe_file_operations.os, "rename", failing_rename):
+        with pytest.raises(OSError, match="desfeita"):
+            SafeFileRenamer.safe_rename_batch(
+                [(tmp_path / n, tmp_path / f"novo_{n}") for n in names],
+                journal_dir=journal_dir,
+            )
+
+    assert sorted(p.name for p in tmp_path.glob("*.pdf")) == names
+    assert list(journal_dir.glob("*")) == []
+
+
+def test_recover_pending_batches_undoes_interrupted_batch(tmp_path):
+    """Um journal remanescente devolve à origem os arquivos já renomeados."""
+    journal_dir = tmp_path / "journal"
+    journal_dir.mkdir()
+    (tmp_path / "novo_a.pdf").write_bytes(b"a")
+    (tmp_path / "b.pdf").write_bytes(b"b")
+    journal = {
+        "version": safe_file_operations.JOURNAL_FORMAT_VERSION,
+        "renames": [
+            [str(tmp_path / "a.pdf"), str(tmp_path / "novo_a.pdf")],
+            [str(tmp_path / "b.pdf"), str(tmp_path / "novo_b.pdf")],
+        ],
+    }
+    (journal_dir / "lote_1_1.json").write_text(json.dumps(journal))
+
+    restored = SafeFileRenamer.recover_pending_batches(journal_dir)
+
+    assert restored == 1
+    assert sorted(p.name for p in tmp_path.glob("*.pdf")) == ["a.pdf", "b.pdf"]
+    assert list(journal_dir.glob("*")) == []
+
+
+class _Crash(BaseException):
+    """Simula a morte do processo em um ponto da renomeação em lote."""
+
+
+def test_recover_keeps_batch_that_crashed_after_last_rename(tmp_path):
+    """
+    Se o processo morre depois da última renomeação, mas antes de remover o
+    journal, a recuperação não desfaz o lote concluído.
+    """
+    journal_dir = tmp_path / "journal"
+    for name in ("a.pdf", "b.pdf"):
+        (tmp_path / name).write_bytes(name.encode())
+
+    with patch.object(safe_file_operations.Path, "unlink", side_effect=_Crash):
+        with pytest.raises(_Crash):
+            SafeFileRenamer.safe_rename_batch(
+                [
+                    (tmp_path / "a.pdf", tmp_path / "novo_a.pdf"),
+                    (tmp_path / "b.pdf", tmp_path / "novo_b.pdf"),
+                ],
+                journal_dir=journal_dir,
+            )
+    assert len(list(journal_dir.glob("lote_*.json"))) == 1
+
+    restored = SafeFileRenamer.recover_pending_batches(journal_dir)
+
+    assert restored == 0
+    assert sorted(p.name for p in tmp_path.glob("*.pdf")) == [
+        "novo_a.pdf",
+        "novo_b.pdf",
+    ]
+    assert list(journal_dir.glob("*")) == []
@@ -0,0 +1,86 @@
+import os
+import shutil
+import time
+from unittest.mock import patch
+
+from src.sad_app_v2.infrastructure import scan_snapshot
+from src.sad_app_v2.infrastructure.scan_snapshot import IncrementalFileRepository
+
+
+def _age_tree(root, seconds=3600):
+    """Recua o mtime de todas as pastas para que o snapshot confie nelas."""
+    past = time.time() - seconds
+    for dirpath, _, _ in os.walk(root):
+        os.utime(dirpath, (past, past))
+
+
+def _make_tree(root):
+    for name in ("a", "b", "c"):
+        sub_dir = root / name
+        sub_dir.mkdir()
+        (sub_dir / f"{name}_1.pdf").write_bytes(b"1")
+        (sub_dir / f"{name}_2.pdf").write_bytes(b"22")
+    _age_tree(root)
+
+
+def test_first_scan_reports_everything_as_added(tmp_path):
+    """Sem snapshot anterior, todos os arquivos aparecem como adicionados."""
+    source = tmp_path / "origem"
+    source.mkdir()
+    _make_tree(source)
+    repo = IncrementalFileRepository(snapshot_dir=tmp_path / "snap")
+
+    diff = repo.scan_changes(source)
+
+    assert len(diff.added) == 6
+    assert [f.path for f in diff.added] == sorted(f.path for f in diff.added)
+    assert diff.modified == []
+    assert diff.removed == []
+
+
+def test_rescan_reports_only_changes(tmp_path):
+    """Verifica a diferença após adicionar, renomear, alterar e remover arquivos."""
+    source = tmp_path / "origem"
+    source.mkdir()
+    _make_tree(source)
+    repo = IncrementalFileRepository(snapshot_dir=tmp_path / "snap")
+    repo.list_files(source)
+
+    (source / "a" / "a_1.pdf").rename(source / "a" / "a_1_A.pdf")
+    (source / "a" / "a_2.pdf").write_bytes(b"modificado")
+    (source / "b" / "novo.pdf").write_bytes(b"novo")
+    shutil.rmtree(source / "c")
+
+    diff = repo.scan_changes(source)
+
+    assert {f.path.name for f in diff.added} == {"a_1_A.pdf", "novo.pdf"}
+    assert {f.path.name for f in diff.modified} == {"a_2.pdf"}
+    assert {p.name for p in diff.removed} == {"a_1.pdf", "c_1.pdf", "c_2.pdf"}
+
+    # Nada mudou desde a última varredura
+    empty = repo.scan_changes(source)
+    assert not (empty.added or empty.modified or empty.removed)
+
+
+def test_rescan_only_lists_changed_directories(tmp_path):
+    """Pastas com mtime inalterado não devem ser relistadas."""
+    source = tmp_path / "origem"
+    source.mkdir()
+    _make_tree(source)
+    repo = IncrementalFileRepository(snapshot_dir=tmp_path / "snap")
+    repo.list_files(source)
+
+    (source / "b" / "novo.pdf").write_bytes(b"novo")
+
+    listed = []
+    original = scan_snapshot._list_directory
+
+    def tracking_list_directory(path, mtime_ns):
+        listed.append(os.path.basename(path))
+        return original(path, mtime_ns)
+
+    with patch.object(scan_snapshot, "_list_directory", tracking_list_directory):
+        diff = repo.scan_changes(source)
+
+    assert listed == ["b"]
+    assert [f.path.name for f in diff.added] == ["novo.pdf"]
@@ -1,12 +1,21 @@
+import shutil
+from copy import copy
 from pathlib import Path
+from unittest.mock import patch
 
 import openpyxl
 import pytest
 
 from src.sad_app_v2.core.domain import DocumentFile, DocumentGroup, ManifestItem
 from src.sad_app_v2.core.interfaces import TemplateNotFoundError
+from src.sad_app_v2.infrastructure import template_filler
 from src.sad_app_v2.infrastructure.file_system import SafeFileSystemManager
-from src.sad_app_v2.infrastructure.template_filler import OpenpyxlTemplateFiller
+from src.sad_app_v2.infrastructure.template_filler import (
+    DATA_STYLE_NAME,
+    HEADER_STYLE_NAME,
+    OpenpyxlTemplateFiller,
+    StreamingTemplateFiller,
+)
 
 
 def test_fill_and_save_creates_and_fills_correctly(tmp_path):
@@ -82,3 +91,158 @@ def test_fill_and_save_raises_error_for_missing_template(tmp_path):
     # Verificação
     with pytest.raises(TemplateNotFoundError):
         filler.fill_and_save(template_path, output_path, [])
+
+
+def test_fill_and_save_keeps_fim_after_all_rows(tmp_path):
+    """
+    Verifica se, com muitas linhas, os dados ficam contíguos e a linha "FIM"
+    é deslocada para logo após o último registro.
+    """
+    groups = []
+    for i in range(250):
+        item = ManifestItem(document_code=f"DOC-{i:03d}", revision="A", title="T")
+        file = DocumentFile(Path(f"DOC-{i:03d}.pdf"), 1, associated_manifest_item=item)
+        groups.append(DocumentGroup(document_code=item.document_code, files=[file]))
+    output_path = tmp_path / "manifesto_grande.xlsx"
+    filler = OpenpyxlTemplateFiller(SafeFileSystemManager())
+
+    filler.fill_and_save(
+        Path("tests/fixtures/template_exemplo.xlsx"), output_path, groups
+    )
+
+    sheet = openpyxl.load_workbook(output_path).active
+    assert sheet["A1"].value == "DOCUMENTO"
+    assert [sheet.cell(row=r, column=1).value for r in range(2, 252)] == [
+        f"DOC-{i:03d}" for i in range(250)
+    ]
+    assert sheet["D251"].value == "DOC-249_A.pdf"
+    assert sheet["A252"].value == "FIM"
+    assert sheet.max_row == 252
+
+
+def test_fill_and_save_uses_named_styles(tmp_path):
+    """
+    Verifica se cabeçalho e dados usam os estilos nomeados, registrados uma
+    única vez na pasta de trabalho, e se a linha "FIM" mantém a borda.
+    """
+    item = ManifestItem(document_code="DOC-1", revision="A", title="T")
+    files = [
+        DocumentFile(Path(f"DOC-1_{i}.pdf"), 1, associated_manifest_item=item)
+        for i in range(3)
+    ]
+    output_path = tmp_path / "manifesto_estilos.xlsx"
+    filler = OpenpyxlTemplateFiller(SafeFileSystemManager())
+
+    filler.fill_and_save(
+        Path("tests/fixtures/template_exemplo.xlsx"),
+        output_path,
+        [DocumentGroup(document_code="DOC-1", files=files)],
+    )
+
+    workbook = openpyxl.load_workbook(output_path)
+    sheet = workbook.active
+    assert workbook.named_styles.count(HEADER_STYLE_NAME) == 1
+    assert workbook.named_styles.count(DATA_STYLE_NAME) == 1
+    assert all(cell.style == HEADER_STYLE_NAME for cell in sheet[1])
+    assert sheet["A1"].font.b and sheet["A1"].fill.fgColor.rgb == "00FFFF00"
+    for row in sheet.iter_rows(min_row=2, max_row=4):
+        assert all(cell.style == DATA_STYLE_NAME for cell in row)
+    assert sheet["C3"].alignment.horizontal == "left"
+    assert sheet["A5"].value == "FIM"
+    assert sheet["I5"].border.bottom.style == "thin"
+
+
+def test_fill_and_save_reads_template_once(tmp_path):
+    """
+    Verifica se o template é interpretado uma única vez para vários lotes e
+    se volta a ser lido quando o arquivo muda.
+    """
+    template_path = tmp_path / "template.xlsx"
+    shutil.copy2("tests/fixtures/template_exemplo.xlsx", template_path)
+    item = ManifestItem(document_code="DOC-1", revision="A", title="T")
+    group = DocumentGroup(
+        document_code="DOC-1",
+        files=[DocumentFile(Path("DOC-1.pdf"), 1, associated_manifest_item=item)],
+    )
+    filler = OpenpyxlTemplateFiller(SafeFileSystemManager())
+
+    with patch.object(
+        template_filler, "_prepare_template", wraps=template_filler._prepare_template
+    ) as prepare:
+        for i in range(3):
+            filler.fill_and_save(
+                template_path, tmp_path / f"lote_{i}" / "m.xlsx", [group]
+            )
+        assert prepare.call_count == 1
+
+        workbook = openpyxl.load_workbook(template_path)
+        workbook.active["A1"] = "CÓDIGO"
+        workbook.save(template_path)
+        filler.fill_and_save(template_path, tmp_path / "lote_3" / "m.xlsx", [group])
+        assert prepare.call_count == 2
+
+    for i in range(3):
+        sheet = openpyxl.load_workbook(tmp_path / f"lote_{i}" / "m.xlsx").active
+        assert sheet["A2"].value == "DOC-1"
+        assert sheet["A3"].value == "FIM"
+    sheet = openpyxl.load_workbook(tmp_path / "lote_3" / "m.xlsx").active
+    assert sheet["A1"].value == "CÓDIGO"
+
+
+def test_streaming_filler_matches_openpyxl_filler(tmp_path):
+    """
+    Verifica se o preenchimento em streaming gera a mesma planilha (valores,
+    estilos, larguras e linha "FIM") que o preenchimento em memória.
+    """
+    groups = []
+    for i in range(20):
+        item = ManifestItem(
+            document_code=f"DOC-{i:02d}",
+            revision="B",
+            title=f"Título {i}",
+            metadata={"DISCIPLINA": "ELE", "FORMATO": "A1"},
+        )
+        files = [
+            DocumentFile(Path(f"DOC-{i:02d}.{ext}"), 1, associated_manifest_item=item)
+            for ext in ("pdf", "dwg")
+        ]
+        groups.append(DocumentGroup(document_code=item.document_code, files=files))
+    template_path = Path("tests/fixtures/template_exemplo.xlsx")
+    file_manager = SafeFileSystemManager()
+
+    OpenpyxlTemplateFiller(file_manager).fill_and_save(
+        template_path, tmp_path / "memoria.xlsx", groups
+    )
+    StreamingTemplateFiller(file_manager).fill_and_save(
+        template_path, tmp_path / "streaming" / "manifesto.xlsx", groups
+    )
+
+    expected = openpyxl.load_workbook(tmp_path / "memoria.xlsx").active
+    actual = openpyxl.load_workbook(tmp_path / "streaming" / "manifesto.xlsx").active
+    assert actual.title == expected.title
+    assert actual.max_row == expected.max_row == 42
+    assert actual["A42"].value == "FIM"
+    for expected_row, actual_row in zip(expected.iter_rows(), actual.iter_rows()):
+        for expected_cell, actual_cell in zip(expected_row, actual_row):
+            assert actual_cell.value == expected_cell.value
+            assert actual_cell.style == expected_cell.style
+            assert copy(actual_cell.font) == copy(expected_cell.font)
+            assert copy(actual_cell.fill) == copy(expected_cell.fill)
+            assert copy(actual_cell.border) == copy(expected_cell.border)
+            assert copy(actual_cell.alignment) == copy(expected_cell.alignment)
+    for letter in "ABCDEFGHI":
+        assert (
+            actual.column_dimensions[letter].width
+            == expected.column_dimensions[letter].width
+        )
+
+
+def test_streaming_filler_raises_error_for_missing_template(tmp_path):
+    """
+    Verifica se o preenchimento em streaming levanta exceção para template
+    inexistente.
+    """
+    filler = StreamingTemplateFiller(SafeFileSystemManager())
+
+    with pytest.raises(TemplateNotFoundError):
+        filler.fill_and_save(Path("inexistente.xlsx"), tmp_path / "saida.xlsx", [])
@@ -93,3 +93,68 @@ def test_output_lot_creation():
     assert lot.lot_name == lot_name
     assert len(lot.files) == 2
     assert lot.total_size_bytes == 2000
+
+
+def test_document_file_is_slotted_and_keeps_legacy_alias():
+    """
+    Verifica se DocumentFile não tem __dict__ e se o campo legado
+    _manifest_item continua acessível como apelido de associated_manifest_item.
+    """
+    item = ManifestItem(document_code="DOC-001", revision="A", title="Teste")
+    doc_file = DocumentFile(path="test.pdf", size_bytes=10)
+
+    assert not hasattr(doc_file, "__dict__")
+    assert not hasattr(item, "__dict__")
+
+    doc_file._manifest_item = item
+    assert doc_file.associated_manifest_item is item
+    assert doc_file.manifest_item is item
+
+    doc_file.associated_manifest_item = None
+    assert doc_file._manifest_item is None
+
+
+def test_group_and_lot_counters_follow_appends():
+    """
+    Verifica se os contadores incrementais de grupos e lotes acompanham as
+    adições feitas por add_file e add_group.
+    """
+    group = DocumentGroup(document_code="group1")
+    group.add_file(DocumentFile(path="a.pdf", size_bytes=100))
+    group.add_file(DocumentFile(path="a.dwg", size_bytes=50))
+    assert group.total_size_bytes == 150
+    assert group.file_count == 2
+
+    lot = OutputLot(lot_name="LOTE-001")
+    lot.add_group(group)
+    lot.add_group(DocumentGroup("group2", [DocumentFile(path="b.pdf", size_bytes=7)]))
+    assert lot.total_size_bytes == 157
+    assert lot.document_count == 2
+    assert lot.file_count == 3
+
+
+def test_recalculate_after_direct_list_changes():
+    """
+    Verifica se recalculate() corrige os contadores após alterações diretas
+    nas listas: arquivo adicionado a um grupo já incluído no lote, grupo
+    substituído e arquivo removido.
+    """
+    group = DocumentGroup("group1", [DocumentFile(path="a.pdf", size_bytes=100)])
+    lot = OutputLot(lot_name="LOTE-001")
+    lot.add_group(group)
+    assert lot.total_size_bytes == 100
+
+    group.files.append(DocumentFile(path="a.dwg", size_bytes=50))
+    lot.recalculate()
+    assert group.total_size_bytes == 150
+    assert lot.total_size_bytes == 150
+    assert lot.file_count == 2
+
+    lot.groups[0] = DocumentGroup("group2", [DocumentFile(path="b", size_bytes=7)])
+    lot.recalculate()
+    assert lot.total_size_bytes == 7
+    assert lot.file_count == 1
+
+    group.files.pop()
+    group.recalculate()
+    assert group.total_size_bytes == 100
@@ -1,3 +1,4 @@
+import threading
 from pathlib import Path
 from unittest.mock import MagicMock, call
 
@@ -8,6 +9,7 @@ from src.sad_app_v2.core.domain import (
     OutputLot,
 )
 from src.sad_app_v2.core.use_cases.organize_lots import OrganizeAndGenerateLotsUseCase
+from src.sad_app_v2.infrastructure.file_system import SafeFileSystemManager
 
 
 def test_organize_lots_happy_path():
@@ -142,3 +144,264 @@ def test_organize_lots_handles_errors():
     assert "Erro de teste" in result.message
     assert result.lots_created == 0
     assert result.files_moved == 0
+
+
+def _make_lots(tmp_path, count):
+    """Cria arquivos reais (para a verificação de existência) e um lote por arquivo."""
+    lots = []
+    files = []
+    for i in range(count):
+        path = tmp_path / f"f{i}.pdf"
+        path.write_bytes(b"x")
+        item = ManifestItem(f"DOC-{i}", "A", f"Doc {i}")
+        file = DocumentFile(path, 1, associated_manifest_item=item)
+        files.append(file)
+        group = DocumentGroup(document_code=item.document_code, files=[file])
+        lots.append(OutputLot(lot_name=f"temp{i}", groups=[group]))
+    return files, lots
+
+
+def test_organize_lots_parallel_keeps_sequence_numbering(tmp_path):
+    """
+    Com vários workers, cada lote recebe o número da sua posição no
+    balanceamento, independentemente da ordem em que termina.
+    """
+    files, lots = _make_lots(tmp_path, 6)
+    mock_balancer = MagicMock()
+    mock_balancer.balance_lots.return_value = lots
+    mock_file_manager = MagicMock()
+    mock_template_filler = MagicMock()
+    output = tmp_path / "destino"
+
+    use_case = OrganizeAndGenerateLotsUseCase(
+        mock_balancer, mock_file_manager, mock_template_filler, max_workers=4
+    )
+    result = use_case.execute(files, output, Path("master.xlsx"), 1, 7, "LOTE-XXXX")
+
+    assert result.success is True
+    assert result.lots_created == 6
+    assert result.files_moved == 6
+    assert result.lot_errors == {}
+    for i, lot in enumerate(lots):
+        lot_dir = output / f"LOTE-{7 + i:04d}"
+        mock_file_manager.move_file.assert_any_call(
+            files[i].path, lot_dir / f"f{i}_A.pdf"
+        )
+        mock_template_filler.fill_and_save.assert_any_call(
+            Path("master.xlsx"), lot_dir / f"LOTE-{7 + i:04d}.xlsx", lot.groups
+        )
+
+
+def test_organize_lots_aggregates_errors_per_lot(tmp_path):
+    """
+    Com continue_on_error, a falha de um lote é registrada no resultado sem
+    interromper os demais.
+    """
+    from src.sad_app_v2.core.interfaces import FileSystemOperationError
+
+    files, lots = _make_lots(tmp_path, 4)
+    mock_balancer = MagicMock()
+    mock_balancer.balance_lots.return_value = lots
+    mock_file_manager = MagicMock()
+
+    def move_file(source, destination):
+        if source.name == "f2.pdf":
+            raise FileSystemOperationError("Disco cheio")
+
+    mock_file_manager.move_file.side_effect = move_file
+    mock_template_filler = MagicMock()
+
+    use_case = OrganizeAndGenerateLotsUseCase(
+        mock_balancer,
+        mock_file_manager,
+        mock_template_filler,
+        max_workers=2,
+        continue_on_error=True,
+    )
+    result = use_case.execute(
+        files, tmp_path / "destino", Path("master.xlsx"), 1, 1, "LOTE-XXXX"
+    )
+
+    assert result.success is False
+    assert result.lots_created == 3
+    assert result.files_moved == 3
+    assert result.lot_errors == {"LOTE-0003": "Disco cheio"}
+    assert "Falha ao gerar 1 de 4 lote(s)" in result.message
+    assert "- LOTE-0003: Disco cheio" in result.message
+    assert mock_template_filler.fill_and_save.call_count == 3
+
+
+def test_organize_lots_serial_stops_at_first_failed_lot(tmp_path):
+    """
+    No modo padrão, a execução para no primeiro lote com falha: nenhum lote
+    seguinte é criado e a mensagem é a do erro, como na versão sequencial.
+    """
+    from src.sad_app_v2.core.interfaces import FileSystemOperationError
+
+    files, lots = _make_lots(tmp_path, 4)
+    mock_balancer = MagicMock()
+    mock_balancer.balance_lots.return_value = lots
+    mock_file_manager = MagicMock()
+
+    def move_file(source, destination):
+        if source.name == "f1.pdf":
+            raise FileSystemOperationError("Disco cheio")
+
+    mock_file_manager.move_file.side_effect = move_file
+    mock_template_filler = MagicMock()
+
+    use_case = OrganizeAndGenerateLotsUseCase(
+        mock_balancer, mock_file_manager, mock_template_filler
+    )
+    result = use_case.execute(
+        files, tmp_path / "destino", Path("master.xlsx"), 1, 1, "LOTE-XXXX"
+    )
+
+    assert result.success is False
+    assert result.message == "Disco cheio"
+    assert result.lots_created == 1
+    assert result.lot_errors == {"LOTE-0002": "Disco cheio"}
+    assert mock_file_manager.create_directory.call_count == 2
+    assert mock_file_manager.move_file.call_count == 2
+    assert mock_template_filler.fill_and_save.call_count == 1
+
+
+def test_organize_lots_pipeline_stops_starting_lots_after_failure(tmp_path):
+    """
+    No modo pipeline sem continue_on_error, nenhum lote é iniciado depois da
+    falha de um lote anterior.
+    """
+    from src.sad_app_v2.core.interfaces import FileSystemOperationError
+
+    files, lots = _make_lots(tmp_path, 5)
+    mock_balancer = MagicMock()
+    mock_balancer.balance_lots.return_value = lots
+    mock_file_manager = MagicMock()
+
+    def create_directory(path):
+        if path.name == "LOTE-0001":
+            raise FileSystemOperationError("Sem permissão")
+
+    mock_file_manager.create_directory.side_effect = create_directory
+    mock_template_filler = MagicMock()
+
+    use_case = OrganizeAndGenerateLotsUseCase(
+        mock_balancer, mock_file_manager, mock_template_filler, pipeline=True
+    )
+    result = use_case.execute(
+        files, tmp_path / "destino", Path("master.xlsx"), 1, 1, "LOTE-XXXX"
+    )
+
+    assert result.success is False
+    assert result.message == "Sem permissão"
+    assert result.lots_created == 0
+    assert result.files_moved == 0
+    mock_file_manager.create_directory.assert_called_once()
+    mock_template_filler.fill_and_save.assert_not_called()
+
+
+def test_organize_lots_pipeline_overlaps_moves_and_manifests(tmp_path):
+    """
+    No modo pipeline, o manifesto do lote 1 é gerado enquanto os arquivos do
+    lote 2 são movidos; a numeração e a ordem dos manifestos são mantidas.
+    """
+    files, lots = _make_lots(tmp_path, 3)
+    mock_balancer = MagicMock()
+    mock_balancer.balance_lots.return_value = lots
+    second_lot_moving = threading.Event()
+    mock_file_manager = MagicMock()
+
+    def move_file(source, destination):
+        if source.name == "f1.pdf":
+            second_lot_moving.set()
+
+    mock_file_manager.move_file.side_effect = move_file
+    filled = []
+    mock_template_filler = MagicMock()
+
+    def fill_and_save(template, output, groups):
+        if not filled:
+            # Em execução sequencial o lote 2 só seria movido depois daqui
+            assert second_lot_moving.wait(timeout=5)
+        filled.append(output.name)
+
+    mock_template_filler.fill_and_save.side_effect = fill_and_save
+
+    use_case = OrganizeAndGenerateLotsUseCase(
+        mock_balancer, mock_file_manager, mock_template_filler, pipeline=True
+    )
+    result = use_case.execute(
+        files, tmp_path / "destino", Path("master.xlsx"), 1, 1, "LOTE-XXXX"
+    )
+
+    assert result.success is True
+    assert result.lots_created == 3
+    assert result.files_moved == 3
+    assert filled == ["LOTE-0001.xlsx", "LOTE-0002.xlsx", "LOTE-0003.xlsx"]
+
+
+def test_organize_lots_pipeline_aggregates_errors_per_lot(tmp_path):
+    """
+    No modo pipeline com continue_on_error, um lote com falha pula as etapas
+    seguintes e os demais lotes seguem.
+    """
+    from src.sad_app_v2.core.interfaces import FileSystemOperationError
+
+    files, lots = _make_lots(tmp_path, 3)
+    mock_balancer = MagicMock()
+    mock_balancer.balance_lots.return_value = lots
+    mock_file_manager = MagicMock()
+
+    def create_directory(path):
+        if path.name == "LOTE-0001":
+            raise FileSystemOperationError("Sem permissão")
+
+    mock_file_manager.create_directory.side_effect = create_directory
+    mock_template_filler = MagicMock()
+
+    use_case = OrganizeAndGenerateLotsUseCase(
+        mock_balancer,
+        mock_file_manager,
+        mock_template_filler,
+        pipeline=True,
+        continue_on_error=True,
+    )
+    result = use_case.execute(
+        files, tmp_path / "destino", Path("master.xlsx"), 1, 1, "LOTE-XXXX"
+    )
+
+    assert result.success is False
+    assert result.lots_created == 2
+    assert result.files_moved == 2
+    assert result.lot_errors == {"LOTE-0001": "Sem permissão"}
+    assert mock_template_filler.fill_and_save.call_count == 2
+
+
+def test_organize_lots_reports_missing_files(tmp_path):
+    """
+    Arquivos ausentes são reportados antes de qualquer movimentação, com a
+    lista limitada a 5 caminhos.
+    """
+    files, lots = _make_lots(tmp_path, 8)
+    for file in files[1:]:
+        file.path.unlink()
+    mock_balancer = MagicMock()
+    mock_balancer.balance_lots.return_value = lots
+    mock_template_filler = MagicMock()
+
+    use_case = OrganizeAndGenerateLotsUseCase(
+        mock_balancer, SafeFileSystemManager(), mock_template_filler
+    )
+    result = use_case.execute(
+        files, tmp_path / "destino", Path("master.xlsx"), 1, 1, "LOTE-XXXX"
+    )
+
+    assert result.success is False
+    assert result.lots_created == 0
+    assert "Alguns arquivos não foram encontrados" in result.message
+    assert f"- {files[1].path}\n" in result.message
+    assert f"- {files[5].path}\n" in result.message
+    assert str(files[6].path) not in result.message
+    assert "...e mais 2 arquivo(s)." in result.message
+    mock_balancer.balance_lots.assert_not_called()
+    assert files[0].path.exists()
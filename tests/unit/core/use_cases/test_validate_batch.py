@@ -1,7 +1,12 @@
 from pathlib import Path
 from unittest.mock import MagicMock
 
-from src.sad_app_v2.core.domain import DocumentFile, DocumentStatus, ManifestItem
+from src.sad_app_v2.core.domain import (
+    DocumentFile,
+    DocumentStatus,
+    ManifestItem,
+    ScanDiff,
+)
 from src.sad_app_v2.core.use_cases.validate_batch import ValidateBatchUseCase
 
 
@@ -24,7 +29,7 @@ def test_validate_batch_happy_path():
 
     # -- Criar Mocks dos Repositórios
     mock_manifest_repo = MagicMock()
-    mock_manifest_repo.load_from_file.return_value = [manifest_item1, manifest_item2]
+    mock_manifest_repo.iter_items.return_value = iter([manifest_item1, manifest_item2])
 
     mock_file_repo = MagicMock()
     mock_file_repo.list_files.return_value = [file1, file2, file3]
@@ -64,7 +69,7 @@ def test_validate_batch_all_files_match():
     file2 = DocumentFile(path=Path("C:/fake/DOC-002_B.docx"), size_bytes=200)
 
     mock_manifest_repo = MagicMock()
-    mock_manifest_repo.load_from_file.return_value = [manifest_item1, manifest_item2]
+    mock_manifest_repo.iter_items.return_value = iter([manifest_item1, manifest_item2])
 
     mock_file_repo = MagicMock()
     mock_file_repo.list_files.return_value = [file1, file2]
@@ -94,7 +99,7 @@ def test_validate_batch_no_files_match():
     file2 = DocumentFile(path=Path("C:/fake/DOC-888_B.docx"), size_bytes=200)
 
     mock_manifest_repo = MagicMock()
-    mock_manifest_repo.load_from_file.return_value = [manifest_item1, manifest_item2]
+    mock_manifest_repo.iter_items.return_value = iter([manifest_item1, manifest_item2])
 
     mock_file_repo = MagicMock()
     mock_file_repo.list_files.return_value = [file1, file2]
@@ -129,3 +134,109 @@ def test_get_file_base_name():
 
     # Testa caso com múltiplos underscores
     assert use_case._get_file_base_name("COMPLEX_DOC_NAME_A.pdf") == "COMPLEX_DOC_NAME"
+
+
+def test_execute_incremental_revalidates_only_the_diff():
+    """
+    Testa a revalidação incremental: arquivos inalterados mantêm o resultado
+    anterior, e apenas a diferença reportada pelo repositório é validada.
+    """
+    manifest_item = ManifestItem("DOC-001", "A", "Documento 1")
+
+    kept = DocumentFile(path=Path("C:/fake/DOC-001_A.pdf"), size_bytes=100)
+    kept.status = DocumentStatus.VALIDATED
+    renamed_before = DocumentFile(path=Path("C:/fake/DOC-001.dwg"), size_bytes=200)
+    renamed_before.status = DocumentStatus.NEEDS_SUFFIX
+    renamed_after = DocumentFile(path=Path("C:/fake/DOC-001_A.dwg"), size_bytes=200)
+
+    mock_manifest_repo = MagicMock()
+    mock_manifest_repo.iter_items.return_value = iter([manifest_item])
+
+    mock_file_repo = MagicMock()
+    mock_file_repo.scan_changes.return_value = ScanDiff(
+        added=[renamed_after], removed=[renamed_before.path]
+    )
+
+    use_case = ValidateBatchUseCase(
+        manifest_repo=mock_manifest_repo, file_repo=mock_file_repo
+    )
+    validated, unrecognized = use_case.execute_incremental(
+        Path("C:/fake/manifest.xlsx"), Path("C:/fake/"), [kept], [renamed_before]
+    )
+
+    mock_file_repo.list_files.assert_not_called()
+    assert validated == [kept, renamed_after]
+    assert unrecognized == []
+    assert renamed_after.status == DocumentStatus.VALIDATED
+
+
+def test_get_file_base_name_all_suffix_kinds():
+    """
+    Testa todos os tipos de sufixo reconhecidos pelo matcher de passada única.
+    """
+    use_case = ValidateBatchUseCase(manifest_repo=MagicMock(), file_repo=MagicMock())
+
+    assert use_case._get_file_base_name("DOC-123_Rev0.pdf") == "DOC-123"
+    assert use_case._get_file_base_name("DOC-123_REV12.pdf") == "DOC-123"
+    assert use_case._get_file_base_name("DOC-123_a.pdf") == "DOC-123"
+    assert use_case._get_file_base_name("DOC-123_15.pdf") == "DOC-123"
+    assert use_case._get_file_base_name("DOC_123_Preliminary.pdf") == "DOC_123"
+    assert use_case._get_file_base_name("DOC_123_backup") == "DOC_123"
+
+    # Apenas o último sufixo é removido
+    assert use_case._get_file_base_name("DOC_A_B.pdf") == "DOC_A"
+
+    # Segmentos que não são sufixos de revisão são preservados
+    assert use_case._get_file_base_name("DOC_123_AB.pdf") == "DOC_123_AB"
+    assert use_case._get_file_base_name("DOC_123_Rev.pdf") == "DOC_123_Rev"
+    assert use_case._get_file_base_name("DOC_123_finally.pdf") == "DOC_123_finally"
+
+
+def test_execute_batch_matches_execute():
+    """
+    Testa se o modo colunar classifica os arquivos como o modo por objetos,
+    materializando DocumentFile apenas sob demanda.
+    """
+    manifest_items = [
+        ManifestItem("DOC-001", "A", "Documento 1"),
+        ManifestItem("DOC-002", "0", "Documento 2"),
+    ]
+    paths = [
+        "C:/fake/DOC-001_A.pdf",
+        "C:/fake/sub/DOC-002.dwg",
+        "C:/fake/DOC-999_A.pdf",
+        "C:/fake/DOC-002_Rev1",
+    ]
+    sizes = [100, 200, 300, 400]
+
+    mock_manifest_repo = MagicMock()
+    mock_manifest_repo.iter_items.side_effect = lambda _: iter(manifest_items)
+    mock_file_repo = MagicMock()
+    mock_file_repo.list_files.return_value = [
+        DocumentFile(path=Path(p), size_bytes=s) for p, s in zip(paths, sizes)
+    ]
+    use_case = ValidateBatchUseCase(
+        manifest_repo=mock_manifest_repo, file_repo=mock_file_repo
+    )
+
+    result = use_case.execute_batch(Path("C:/fake/manifest.xlsx"), paths, sizes)
+    validated, unrecognized = use_case.execute(
+        Path("C:/fake/manifest.xlsx"), Path("C:/fake/")
+    )
+
+    assert result.validated_indexes == [0, 3]
+    assert result.unrecognized_indexes == [1, 2]
+
+    batch_validated = result.validated_files()
+    batch_unrecognized = result.unrecognized_files()
+    assert [(f.path, f.status) for f in batch_validated] == [
+        (f.path, f.status) for f in validated
+    ]
+    assert [(f.path, f.status) for f in batch_unrecognized] == [
+        (f.path, f.status) for f in unrecognized
+    ]
+    assert batch_unrecognized[0].status == DocumentStatus.NEEDS_SUFFIX
+    assert batch_unrecognized[0].associated_manifest_item is manifest_items[1]
+
+    # Materialização parcial: só a faixa pedida
+    assert [f.size_bytes for f in result.validated_files(1, 2)] == [400]
@@ -0,0 +1,66 @@
+import re
+
+from src.sad_app_v2.infrastructure.profile_matcher import (
+    PATTERN_FLAGS,
+    ProfileMatcher,
+    compile_profiles,
+)
+
+
+def test_find_respects_pattern_priority():
+    """
+    Verifica se vale o primeiro padrão da lista que casar, mesmo que outro
+    padrão case antes no texto, como no find_code original.
+    """
+    patterns = [r"Relatório:\s*([A-Z0-9_]+)", r"Código:\s*([A-Z0-9_]+)", r"RIR_\d+"]
+    matcher = ProfileMatcher(patterns)
+    texts = [
+        "Código: COD_1\nRelatório: REL_2",
+        "Código: COD_1\nRIR_9",
+        "nada aqui RIR_7",
+        "",
+    ]
+
+    for text in texts:
+        expected = None
+        for pattern in patterns:
+            match = re.search(pattern, text, PATTERN_FLAGS)
+            if match:
+                expected = match.group(1) if match.groups() else match.group(0)
+                break
+        assert matcher.find(text) == expected
+
+
+def test_compile_profiles_reports_invalid_and_slow_patterns():
+    """Padrões inválidos são descartados e padrões lentos são reportados."""
+    matchers, issues = compile_profiles(
+        {"RIR": {"patterns": [r"Relatório:\s*(\w+)", "([", r"(a+)+b"]}}
+    )
+
+    assert matchers["RIR"].patterns == [r"Relatório:\s*(\w+)", r"(a+)+b"]
+    problems = {issue.pattern: issue.problem for issue in issues}
+    assert problems["(["].startswith("inválido")
+    assert problems[r"(a+)+b"].startswith("lento")
+    assert r"Relatório:\s*(\w+)" not in problems
+
+
+def test_longest_rule_picks_longest_match_of_first_matching_pattern():
+    """
+    Verifica a regra "longest" do perfil: dentre as ocorrências do primeiro
+    padrão que casar, vale a mais longa; os demais padrões são alternativas.
+    """
+    matchers, issues = compile_profiles(
+        {
+            "RIR": {
+                "match": "longest",
+                "patterns": [r"Relatório:\s*([A-Z0-9_]{4,})", r"Código:\s*(\w+)"],
+            },
+            "GERAL": {"match": "maior", "patterns": [r"Relatório:\s*(\w+)"]},
+        }
+    )
+    text = "Relatório: ABCD\nCódigo: X\nRelatório: RIR_LONGO_1\nRelatório: RIR_2"
+
+    assert matchers["RIR"].find(text) == "RIR_LONGO_1"
+    assert matchers["RIR"].find("Código: X") == "X"
+    assert matchers["GERAL"].find(text) == "ABCD"
+    assert [issue.pattern for issue in issues] == ["match: maior"]
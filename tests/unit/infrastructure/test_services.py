@@ -1,7 +1,10 @@
 ﻿from pathlib import Path
 
 from src.sad_app_v2.core.domain import DocumentFile, DocumentGroup
-from src.sad_app_v2.infrastructure.services import GreedyLotBalancerService
+from src.sad_app_v2.infrastructure.services import (
+    CapacityAwareLotBalancerService,
+    GreedyLotBalancerService,
+)
 
 
 def test_balancer_distributes_correctly():
@@ -67,3 +70,94 @@ def test_balancer_respects_max_docs_limit():
     assert sum(group_counts) == 7
     assert all(count <= 3 for count in group_counts)
     assert max(group_counts) == 3  # Pelo menos um lote deve ter 3 documentos
+
+
+def test_balancer_breaks_ties_by_lot_order():
+    """Em empates de tamanho, o grupo vai para o primeiro lote mais leve."""
+    groups = [
+        DocumentGroup(f"DOC-{i}", [DocumentFile(Path(f"f{i}"), 10)]) for i in range(5)
+    ]
+
+    lots = GreedyLotBalancerService().balance_lots(groups, max_docs_per_lot=2)
+
+    assert [[g.document_code for g in lot.groups] for lot in lots] == [
+        ["DOC-0", "DOC-3"],
+        ["DOC-1", "DOC-4"],
+        ["DOC-2"],
+    ]
+
+
+def _skewed_groups():
+    sizes = [1000, 900, 50, 40, 30, 20, 10, 5, 3, 1]
+    return [
+        DocumentGroup(f"DOC-{size}", [DocumentFile(Path(f"f{size}"), size)])
+        for size in sizes
+    ]
+
+
+def test_capacity_balancer_enforces_document_cap():
+    """Com tamanhos desiguais, nenhum lote pode passar do limite de documentos."""
+    balancer = CapacityAwareLotBalancerService()
+
+    lots = balancer.balance_lots(_skewed_groups(), max_docs_per_lot=3)
+
+    assert len(lots) == 4  # ceil(10 / 3)
+    assert all(lot.document_count <= 3 for lot in lots)
+    assert sum(lot.document_count for lot in lots) == 10
+
+
+def test_capacity_balancer_enforces_byte_cap():
+    """Nenhum lote pode passar do limite de bytes; novos lotes são abertos."""
+    balancer = CapacityAwareLotBalancerService(max_bytes_per_lot=1000)
+
+    lots = balancer.balance_lots(_skewed_groups(), max_docs_per_lot=5)
+
+    assert all(lot.total_size_bytes <= 1000 for lot in lots)
+    assert all(lot.document_count <= 5 for lot in lots)
+    assert sum(lot.total_size_bytes for lot in lots) == 2059
+
+
+def test_capacity_balancer_best_fit_minimizes_lots():
+    """A estratégia best_fit deve usar o mínimo de lotes possível aqui."""
+    balancer = CapacityAwareLotBalancerService(
+        max_bytes_per_lot=1100, strategy="best_fit"
+    )
+
+    lots = balancer.balance_lots(_skewed_groups(), max_docs_per_lot=10)
+
+    assert len(lots) == 2
+    assert all(lot.total_size_bytes <= 1100 for lot in lots)
+
+
+def test_capacity_balancer_isolates_oversized_group():
+    """Um grupo maior que o limite de bytes fica sozinho em um lote."""
+    balancer = CapacityAwareLotBalancerService(max_bytes_per_lot=500)
+
+    lots = balancer.balance_lots(_skewed_groups(), max_docs_per_lot=10)
+
+    oversized = [lot for lot in lots if lot.total_size_bytes > 500]
+    assert [lot.document_count for lot in oversized] == [1, 1]
+
+
+def test_capacity_balancer_leaves_no_empty_lot():
+    """
+    Com grupos maiores que o limite de bytes, nenhum lote retornado pode
+    ficar vazio e a numeração deve ser contínua, nas duas estratégias.
+    """
+    groups = [
+        DocumentGroup(f"DOC-{size}", [DocumentFile(Path(f"f{size}"), size)])
+        for size in (1000, 900)
+    ]
+    for strategy in CapacityAwareLotBalancerService.STRATEGIES:
+        balancer = CapacityAwareLotBalancerService(500, strategy=strategy)
+
+        lots = balancer.balance_lots(groups, max_docs_per_lot=10)
+
+        assert [lot.lot_name for lot in lots] == ["Lote_1", "Lote_2"]
+        assert all(lot.document_count > 0 for lot in lots)
+
+    lots = CapacityAwareLotBalancerService(500).balance_lots(
+        _skewed_groups(), max_docs_per_lot=10
+    )
+    assert all(lot.document_count > 0 for lot in lots)
+    assert sum(lot.document_count for lot in lots) == 10
@@ -0,0 +1,84 @@
+import threading
+
+from src.sad_app_v2.presentation.resolution_scheduler import ResolutionScheduler
+
+
+def test_run_limits_concurrency_and_keeps_order():
+    """
+    Verifica se no máximo max_workers itens rodam ao mesmo tempo e se os
+    resultados voltam na ordem de entrada, com erros capturados por item.
+    """
+    lock = threading.Lock()
+    running = 0
+    peak = 0
+
+    def work(item):
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        try:
+            if item == 3:
+                raise ValueError("falhou")
+            return item * 10
+        finally:
+            with lock:
+                running -= 1
+
+    outcomes = ResolutionScheduler(max_workers=2).run(range(20), work)
+
+    assert peak <= 2
+    assert [o.item for o in outcomes] == list(range(20))
+    assert isinstance(outcomes[3].error, ValueError)
+    assert [o.result for o in outcomes if o.error is None] == [
+        i * 10 for i in range(20) if i != 3
+    ]
+
+
+def test_cancel_skips_items_not_started():
+    """Após o cancelamento, os itens ainda não iniciados não são processados."""
+    scheduler = ResolutionScheduler(max_workers=1, queue_size=1)
+    processed = []
+
+    def work(item):
+        processed.append(item)
+        if item == 1:
+            scheduler.cancel()
+        return item
+
+    outcomes = scheduler.run(range(10), work)
+
+    assert processed == [0, 1]
+    assert [o.cancelled for o in outcomes] == [False, False] + [True] * 8
+
+
+def test_progress_is_aggregated():
+    """O progresso é reportado com intervalo mínimo e sempre ao final."""
+    reports = []
+
+    ResolutionScheduler(max_workers=4, progress_interval=60).run(
+        range(100), lambda item: item, on_progress=lambda *args: reports.append(args)
+    )
+
+    assert reports == [(100, 100)]
+
+
+def test_failing_progress_callback_does_not_change_outcomes():
+    """
+    Verifica se uma exceção no aviso de progresso não transforma um item bem
+    sucedido em erro nem interrompe os workers.
+    """
+    calls = []
+
+    def on_progress(done, total):
+        calls.append(done)
+        raise RuntimeError("janela fechada")
+
+    outcomes = ResolutionScheduler(max_workers=2, progress_interval=0).run(
+        range(6), lambda item: item + 1, on_progress
+    )
+
+    assert [o.result for o in outcomes] == [1, 2, 3, 4, 5, 6]
+    assert all(o.error is None for o in outcomes)
+    assert calls[-1] == 6
+    assert max(calls) == 6